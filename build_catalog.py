@@ -0,0 +1,49 @@
+"""Собирает data/recipes_catalog.db из data/recipes_seed.json.gz.
+
+Запуск: python build_catalog.py
+Результат — готовая к чтению БД: со всеми индексами, ANALYZE и VACUUM.
+Обновление каталога в приложении = замена этого файла.
+"""
+import os
+import sqlite3
+from contextlib import closing
+
+import migrations
+from recipes_db import (
+    CATALOG_ID_BASE,
+    CATALOG_PATH,
+    INDEX_VERSION,
+    _bulk_load,
+    catalog_hash,
+    seed_catalog,
+)
+
+
+def build(path: str = CATALOG_PATH) -> dict:
+    tmp = path + ".tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+
+    conn = sqlite3.connect(tmp)
+    try:
+        migrations.migrate(conn, migrations.CATALOG_DB)
+        with closing(conn.cursor()) as c:
+            c.execute("INSERT INTO sqlite_sequence(name, seq) VALUES('recipes', ?)", (CATALOG_ID_BASE,))
+            stats = _bulk_load(c, seed_catalog())
+            c.execute("CREATE TABLE catalog_info (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            c.executemany(
+                "INSERT INTO catalog_info(key, value) VALUES(?, ?)",
+                [("version", f"{catalog_hash()}:k{INDEX_VERSION}"), ("keys_version", INDEX_VERSION)],
+            )
+        conn.commit()
+        conn.execute("ANALYZE")
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    os.replace(tmp, path)
+    return stats
+
+
+if __name__ == "__main__":
+    print(build())
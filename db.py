@@ -1,24 +1,16 @@
-import sqlite3
 from contextlib import closing
+from db_pool import get_conn
+import migrations
 
 DB_PATH = "app.db"
+migrations.register(DB_PATH, migrations.APP_DB)
 
 def _conn():
-    return sqlite3.connect(DB_PATH)
+    return get_conn(DB_PATH)
 
 def init_db():
-    with _conn() as conn, closing(conn.cursor()) as cur:
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS user_profile (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                gender TEXT,         -- 'm' / 'f' / NULL
-                birth TEXT,          -- строкой 'ДД.ММ.ГГГГ'
-                height_cm REAL,
-                weight_kg REAL
-            );
-        """)
-        conn.commit()
+    """Схема создаётся миграциями (migrations.APP_DB) при открытии соединения."""
+    _conn()
 
 def insert_profile(data: dict) -> int:
     """Вставляет новую строку, возвращает id."""
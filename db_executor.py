@@ -0,0 +1,52 @@
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+
+# Один рабочий поток: запросы к SQLite выполняются по очереди и вне потока UI-обработчика.
+# У потока своё соединение из db_pool, как и у любого другого.
+_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-worker")
+_lock = threading.Lock()
+_latest: dict[str, Future] = {}
+
+
+def is_current(key: str, fut: Future) -> bool:
+    """False, если после fut по тому же key уже поставлен более новый запрос."""
+    with _lock:
+        return _latest.get(key) is fut
+
+
+def submit(fn, *args, key: str | None = None, on_done=None, on_error=None, **kwargs) -> Future:
+    """Ставит fn(*args, **kwargs) в очередь рабочего потока и возвращает Future.
+
+    key — запросы с одинаковым key вытесняют друг друга: ещё не начатый предыдущий
+    отменяется, а результат уже выполняющегося не доставляется в on_done.
+    on_done(result) / on_error(exc) вызываются в рабочем потоке; внутри них можно
+    менять контролы и вызывать control.update().
+    Из async-обработчика Flet результат можно ждать через asyncio.wrap_future(fut).
+    """
+    fut = _pool.submit(fn, *args, **kwargs)
+    if key is not None:
+        with _lock:
+            prev = _latest.get(key)
+            _latest[key] = fut
+        if prev is not None:
+            prev.cancel()
+
+    def _deliver(f: Future):
+        if key is not None:
+            if not is_current(key, f):
+                return
+            with _lock:
+                _latest.pop(key, None)
+        try:
+            result = f.result()
+        except CancelledError:
+            return
+        except Exception as exc:
+            if on_error is not None:
+                on_error(exc)
+            return
+        if on_done is not None:
+            on_done(result)
+
+    fut.add_done_callback(_deliver)
+    return fut
@@ -0,0 +1,124 @@
+import atexit
+import os
+import sqlite3
+import threading
+import weakref
+
+# Прагмы применяются один раз при открытии соединения.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",        # ~8 МБ страниц в памяти
+    "PRAGMA mmap_size=67108864",      # 64 МБ
+)
+
+_local = threading.local()
+_lock = threading.Lock()
+_all: list[sqlite3.Connection] = []
+_generation = 0
+_hooks: dict[str, list] = {}
+
+
+def _key(path: str) -> str:
+    return os.path.abspath(path)
+
+
+class _ThreadConns(dict):
+    """Соединения одного потока: {путь: [conn, применено хуков]}.
+
+    Живёт в threading.local — когда поток завершается, объект удаляется и weakref.finalize
+    закрывает его соединения, иначе они висели бы в _all до выхода из процесса.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.opened: list[sqlite3.Connection] = []
+        self.finalizer = weakref.finalize(self, _close, self.opened)
+
+
+def _close(conns: list[sqlite3.Connection]) -> None:
+    with _lock:
+        for conn in conns:
+            if conn in _all:
+                _all.remove(conn)
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    conns.clear()
+
+
+def _open(path: str) -> sqlite3.Connection:
+    # uri=True — чтобы в ATTACH можно было передать 'file:...?mode=ro';
+    # check_same_thread=False — соединением по-прежнему пользуется только свой поток,
+    # но закрыть его могут close_all() и финализатор завершившегося потока
+    conn = sqlite3.connect(path, timeout=5.0, uri=True, check_same_thread=False)
+    for p in PRAGMAS:
+        conn.execute(p)
+    with _lock:
+        _all.append(conn)
+    return conn
+
+
+def get_conn(path: str) -> sqlite3.Connection:
+    """Долгоживущее соединение с файлом БД для текущего потока.
+
+    Flet вызывает обработчики из пула потоков, поэтому у каждого потока
+    своё соединение: sqlite3 не разрешает делить их между потоками.
+    `with get_conn(...) as conn:` коммитит/откатывает транзакцию, но не закрывает файл.
+    """
+    conns = getattr(_local, "conns", None)
+    if conns is None or _local.generation != _generation:
+        conns = _local.conns = _ThreadConns()
+        _local.generation = _generation
+    key = _key(path)
+    entry = conns.get(key)
+    if entry is None:
+        entry = conns[key] = [_open(key), 0]
+        conns.opened.append(entry[0])
+    conn, applied = entry
+    hooks = _hooks.get(key, ())
+    while applied < len(hooks):
+        hooks[applied](conn)
+        applied = entry[1] = applied + 1
+    return conn
+
+
+def on_connect(path: str, fn) -> None:
+    """Регистрирует fn(conn), которая выполнится один раз на каждом соединении с path.
+
+    Применяется и к уже открытым соединениям — при их следующей выдаче из get_conn.
+    """
+    with _lock:
+        _hooks.setdefault(_key(path), []).append(fn)
+
+
+def release() -> None:
+    """Закрывает соединения текущего потока (в конце фоновой задачи в отдельном потоке).
+
+    Следующий get_conn в этом потоке откроет новое соединение.
+    """
+    conns = getattr(_local, "conns", None)
+    _local.conns = None
+    if conns is not None:
+        conns.finalizer()
+
+
+def close_all() -> None:
+    """Закрывает все открытые соединения (при выходе из приложения)."""
+    global _generation
+    with _lock:
+        conns, _all[:] = list(_all), []
+        _generation += 1
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+atexit.register(close_all)
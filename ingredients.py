@@ -0,0 +1,94 @@
+"""Таблица синонимов ингредиентов/продуктов и общие помощники для ключей.
+
+Разбор названий, стемминг и сопоставление — в matcher.py.
+"""
+import hashlib
+
+ALIASES = {
+    "авокадо": "авокадо",
+    "анчоусы": "анчоусы",
+    "батон": "хлеб",
+    "бекон": "бекон",
+    "болгарский перец": "перец",
+    "бульон": "куриный бульон",
+    "горошек": "горошек",
+    "греческий йогурт": "йогурт",
+    "дрожжи": "дрожжи",
+    "зеленый лук": "зелень",
+    "зелёный лук": "зелень",
+    "зелень": "зелень",
+    "какао-порошок": "какао",
+    "капуста": "капуста",
+    "кефир 1%": "кефир",
+    "кефир 2,5%": "кефир",
+    "кефир": "кефир",
+    "колбаса": "колбаса",
+    "консервированный тунец": "тунец консервированный",
+    "краб-палочки": "крабовые палочки",
+    "крабовые палочки": "крабовые палочки",
+    "лаваш тонкий": "лаваш",
+    "лаваш": "лаваш",
+    "лепешки": "тортильи",
+    "листы лазаньи": "листы лазаньи",
+    "лук репчатый": "лук",
+    "макароны": "паста",
+    "масло растительное": "масло",
+    "масло сливочное": "масло",
+    "мед": "мёд",
+    "моцарелла": "сыр моцарелла",
+    "нори лист": "нори",
+    "нори": "нори",
+    "овсяные хлопья": "овсянка",
+    "огурцы": "огурец",
+    "оливковое масло": "масло",
+    "паприка": "паприка",
+    "пельмешки": "пельмени",
+    "пельмени": "пельмени",
+    "перец болгарский": "перец",
+    "помидор": "томаты",
+    "помидоры": "томаты",
+    "рис арборио": "рис",
+    "рисовая лапша": "лапша",
+    "растительное масло": "масло",
+    "сметана 15%": "сметана",
+    "сметана 20%": "сметана",
+    "сметана": "сметана",
+    "соус терияки": "соевый соус",
+    "спагетти": "паста",
+    "сливки": "сливки",
+    "сыр пармезан": "сыр",
+    "сыр моцарелла": "сыр моцарелла",
+    "сыр фета": "сыр фета",
+    "тахини": "тахини",
+    "томат": "томаты",
+    "томатная паста": "томаты",
+    "томаты": "томаты",
+    "тортилья": "тортильи",
+    "тунец": "тунец консервированный",
+    "тунец консервированный": "тунец консервированный",
+    "хлеб тостовый": "хлеб",
+    "хлеб": "хлеб",
+    "хлопья овсяные": "овсянка",
+    "терияки": "соевый соус",
+    "яйца куриные": "яйца",
+    "яйцо": "яйца",
+    "ягоды": "ягоды",
+    "йогурт натуральный": "йогурт",
+    "йогурт": "йогурт",
+}
+
+
+def fold(s: str) -> str:
+    """Нижний регистр, ё -> е, одиночные пробелы."""
+    return " ".join((s or "").lower().replace("ё", "е").split())
+
+
+def norm(s: str) -> str:
+    """Простой ключ: точное совпадение с ALIASES (для старой миграции migrations._recipes_v2_keys)."""
+    k = (s or "").strip().lower()
+    return ALIASES.get(k, k)
+
+
+def key_id(key: str) -> int:
+    """Стабильный id ключа (63 бита): одинаков в каталоге, в app.db и между сборками."""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big") >> 1
@@ -1,8 +1,9 @@
-import os, sys
+import multiprocessing, os, sys, threading
 import flet as ft
 from router import Router
 from ui.colors import APP_BG
-from settings_db import init_settings_db, get_setting
+from settings_db import init_settings_db, get_setting, subscribe
+from recipes_db import ensure_recipe_catalog
 
 def resource_path(rel_path: str) -> str:
     base = getattr(sys, "_MEIPASS", os.path.abspath("."))
@@ -13,8 +14,14 @@ def main(page: ft.Page):
     page.padding = 0
     page.window_icon = "appicon.ico"
     init_settings_db()
-    theme = get_setting("theme", "light")
-    page.theme_mode = ft.ThemeMode.DARK if theme == "dark" else ft.ThemeMode.LIGHT
+    threading.Thread(target=ensure_recipe_catalog, daemon=True).start()
+    def apply_theme(theme: str):
+        page.theme_mode = ft.ThemeMode.DARK if theme == "dark" else ft.ThemeMode.LIGHT
+    apply_theme(get_setting("theme", "light"))
+    def on_theme_setting(theme: str):
+        apply_theme(theme)
+        page.go(page.route)
+    subscribe("theme", on_theme_setting)
     def apply_bg():
         page.bgcolor = "#0F1115" if page.theme_mode == ft.ThemeMode.DARK else APP_BG
     apply_bg()
@@ -28,6 +35,8 @@ def main(page: ft.Page):
     page.go("/")
 
 if __name__ == "__main__":
+    # процессы пула recipe_shards в собранном (PyInstaller) приложении
+    multiprocessing.freeze_support()
     ft.app(
         target=main,
         view=ft.AppView.FLET_APP,
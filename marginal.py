@@ -0,0 +1,99 @@
+"""«Что докупить одно»: какой ингредиент откроет больше всего рецептов или сильнее поднимет покрытие.
+
+Вместо подбора заново для каждого возможного продукта — один проход по рецептам:
+для каждого рецепта считаются слоты, которых нет в холодильнике, и каждый ключ
+недостающего слота (основной и альтернативы) получает вклад рецепта: +1 к «откроет»,
+если он закрывает все недостающие слоты, +1 к «перейдёт порог», если покрытие
+дорастёт до 0.7, и прирост покрытия. Количества здесь не учитываются: купить
+ещё того, что уже есть, — не «новый ингредиент».
+Слоты рецептов кэшируются до смены recipes_revision, результат — до изменения холодильника.
+"""
+import json
+import threading
+
+from products_db import subscribe as subscribe_products
+from recipes_db import filter_recipe_ids, get_ingredient_keys, ingredient_names, recipes_revision
+from recommend import inventory
+
+THRESHOLD = 0.7
+
+_lock = threading.Lock()
+# recipes_revision -> [(recipe_id, [(ключи слота, по желанию), ...]), ...]
+_slots: tuple[str, list] | None = None
+# (recipes_revision, фильтры) -> результат; сбрасывается при изменении холодильника
+_results: dict[tuple[str, str], list[dict]] = {}
+
+
+def _recipe_slots(revision: str) -> list:
+    global _slots
+    if _slots is None or _slots[0] != revision:
+        by_recipe: dict[int, list] = {}
+        for (rid, ids, optional, _) in get_ingredient_keys():
+            by_recipe.setdefault(rid, []).append((frozenset(ids), optional))
+        _slots = (revision, list(by_recipe.items()))
+    return _slots[1]
+
+
+def _on_product_change(event: str, product: dict):
+    with _lock:
+        _results.clear()
+
+
+subscribe_products(_on_product_change)
+
+
+def one_more_ingredient(top_n: int = 10, filters: dict | None = None) -> list[dict]:
+    """Лучшие top_n ингредиентов, которых нет, по (откроет, перейдёт порог, прирост покрытия).
+
+    [{"ingredient_id", "name", "unlocks", "threshold", "coverage_gain", "recipe_ids"}, ...];
+    recipe_ids — рецепты, которые он открывает полностью. filters — как в recommend.suggest_recipes.
+    """
+    revision = recipes_revision()
+    stamp = (revision, json.dumps(filters or {}, sort_keys=True, ensure_ascii=False))
+    with _lock:
+        if any(r != revision for (r, _) in _results):
+            _results.clear()
+        if stamp not in _results:
+            _results[stamp] = _compute(_recipe_slots(revision), filters)
+        return _results[stamp][:top_n]
+
+
+def _compute(slots: list, filters: dict | None) -> list[dict]:
+    have = set(inventory()[0])
+    allowed = filter_recipe_ids(filters)
+    allowed = None if allowed is None else set(allowed)
+    stats: dict[int, list] = {}  # ключ -> [откроет, перейдёт порог, прирост покрытия, [рецепты]]
+
+    for rid, recipe_slots in slots:
+        if allowed is not None and rid not in allowed:
+            continue
+        counted = [s for s in recipe_slots if not s[1]] or recipe_slots  # как в recommend: без «по желанию»
+        missing = [keys for (keys, _) in counted if not keys & have]
+        if not missing:
+            continue
+        total = len(counted)
+        coverage = (total - len(missing)) / total
+        # сколько недостающих слотов закрывает каждый ключ
+        closes: dict[int, int] = {}
+        for keys in missing:
+            for k in keys - {0}:
+                closes[k] = closes.get(k, 0) + 1
+        for k, n in closes.items():
+            st = stats.setdefault(k, [0, 0, 0.0, []])
+            after = coverage + n / total
+            if n == len(missing):
+                st[0] += 1
+                st[3].append(rid)
+            if coverage < THRESHOLD <= after:
+                st[1] += 1
+            st[2] += n / total
+
+    names = ingredient_names(list(stats))
+    ranked = sorted(stats.items(), key=lambda kv: (-kv[1][0], -kv[1][1], -kv[1][2], kv[0]))
+    return [
+        {
+            "ingredient_id": k, "name": names.get(k, ""), "unlocks": u, "threshold": t,
+            "coverage_gain": g, "recipe_ids": ids,
+        }
+        for k, (u, t, g, ids) in ranked
+    ]
@@ -0,0 +1,151 @@
+"""Сопоставление названий ингредиентов рецептов и продуктов из холодильника.
+
+Название разбирается на слова, каждое слово сводится к основе лёгким стеммером
+('томаты' -> 'томат', 'куриные' -> 'курин'), ключ — отсортированный набор основ.
+Синонимы из ingredients.ALIASES сравниваются по такому же набору, поэтому 'помидор',
+'Помидоры' и 'помидоры' совпадают без отдельных записей.
+
+Рецепт: ключи считаются один раз при записи (recipes_db._index_recipes) через parse().
+Продукт: product_key_ids() — кроме полного ключа, ещё ключи без уточнений из _NEUTRAL_QUALIFIERS,
+так что 'лук красный' подходит к 'лук', 'яйца куриные' — к 'яйца'. Прилагательные, которые
+меняют продукт ('зелёный лук', 'цветная капуста', 'томатная паста'), не отбрасываются.
+Обе функции мемоизированы (lru_cache) по исходной строке.
+"""
+import re
+from functools import lru_cache
+from itertools import combinations
+
+from ingredients import ALIASES, fold, key_id
+
+# Увеличить при любом изменении разбора/стемминга/ALIASES: сохранённые ключи будут пересчитаны,
+# а каталог, собранный со старыми ключами, не подключится (его нужно пересобрать).
+KEYS_VERSION = 2
+
+_PARENS = re.compile(r"\(([^)]*)\)")
+_PERCENT = re.compile(r"\d+(?:[.,–-]\d+)?\s*%")
+_OPTIONAL = ("по желанию", "опционально")
+_ADJ_ENDINGS = (
+    "ыми", "ими", "ого", "его", "ому", "ему",
+    "ая", "яя", "ое", "ее", "ые", "ие", "ый", "ий", "ой", "ую", "юю", "ых", "их", "ым", "им",
+)
+_NOUN_ENDINGS = ("ами", "ями", "ов", "ев", "ей", "ам", "ям", "ах", "ях", "ом", "ем", "ью",
+                 "а", "я", "о", "е", "ы", "и", "у", "ю", "ь", "й")
+_MIN_STEM = 3
+# прилагательных, которые product_keys() пробует отбросить, не больше стольких
+_MAX_DROP = 3
+# уточнения, без которых продукт остаётся тем же (основы считаются ниже, после stem)
+_NEUTRAL_WORDS = (
+    "куриный", "перепелиный", "говяжий", "свиной", "красный", "репчатый", "твердый",
+    "консервированный", "свежий", "охлажденный", "замороженный", "очищенный", "отварной",
+    "домашний", "крупный", "мелкий", "молодой", "сладкий", "пшеничный",
+)
+
+
+def stem(word: str) -> str:
+    """Лёгкий стеммер: отрезает самое длинное падежное окончание, оставляя основу не короче 3 букв."""
+    for ending in _ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= _MIN_STEM:
+            return word[: -len(ending)]
+    return word
+
+
+_ENDINGS = tuple(sorted(set(_ADJ_ENDINGS + _NOUN_ENDINGS), key=len, reverse=True))
+_NEUTRAL_QUALIFIERS = frozenset(stem(w) for w in _NEUTRAL_WORDS)
+
+
+def _clean(s: str) -> str:
+    return " ".join(_PERCENT.sub(" ", _PARENS.sub(" ", s)).split())
+
+
+def _alternatives(s: str) -> list[str]:
+    """'майонез/йогурт' -> [майонез, йогурт]; общее слово переносится на короткую часть:
+    'оливковое/растительное масло' -> [оливковое масло, растительное масло],
+    'куриное филе/бедро' -> [куриное филе, куриное бедро].
+    """
+    if "/" not in s:
+        return [s]
+    parts = [p.strip() for p in s.split("/") if p.strip()]
+    if len(parts) == 2:
+        left, right = parts[0].split(), parts[1].split()
+        if len(left) == 1 and len(right) > 1 and left[0].endswith(_ADJ_ENDINGS):
+            parts[0] = " ".join(left + right[1:])
+        elif len(right) == 1 and len(left) > 1:
+            parts[1] = " ".join(left[:-1] + right)
+    return parts
+
+
+def signature(words: list[str]) -> str:
+    """Ключ набора слов: уникальные основы по алфавиту через пробел."""
+    return " ".join(sorted({stem(w) for w in words}))
+
+
+class Matcher:
+    """Таблица синонимов, скомпилированная в словарь по наборам основ."""
+
+    def __init__(self, aliases: dict[str, str]):
+        self._aliases: dict[str, str] = {}
+        for raw, target in aliases.items():
+            sig = signature(_clean(fold(raw)).split())
+            self._aliases.setdefault(sig, signature(_clean(fold(target)).split()))
+
+    def key(self, s: str) -> str:
+        """Ключ уже очищенной строки (без скобок и процентов), с учётом синонимов."""
+        sig = signature(s.split())
+        return self._aliases.get(sig, sig)
+
+    def recipe_keys(self, name: str) -> tuple[tuple[str, ...], bool]:
+        """Название ингредиента рецепта -> (ключи-альтернативы, необязательный ли).
+
+        Скобки убираются: '(по желанию)' помечает ингредиент необязательным, перечисление
+        через '/' в скобках ('рыбное филе (треска/хек/лосось)') добавляет альтернативы,
+        остальное ('(для формы)', '(готовое)') отбрасывается. Жирность '20%' тоже.
+        Первый ключ — основной; ключи без повторов.
+        """
+        s = fold(name)
+        optional = False
+        extra: list[str] = []
+        for note in _PARENS.findall(s):
+            if any(m in note for m in _OPTIONAL):
+                optional = True
+            elif "/" in note:
+                extra.extend(_alternatives(note))
+        keys: list[str] = []
+        for alt in _alternatives(_clean(s)) + extra:
+            k = self.key(alt)
+            if k not in keys:
+                keys.append(k)
+        return tuple(keys) or ("",), optional
+
+    def product_keys(self, name: str) -> tuple[str, ...]:
+        """Ключи, которые закрывает продукт: полный и без любых из (первых _MAX_DROP) нейтральных уточнений.
+
+        Уточнения ищутся в полном ключе, то есть после синонимов: 'зелёный лук' -> 'зелень'
+        не превращается ещё и в 'лук', а 'томаты консервированные' подходят и к 'томаты'.
+        """
+        full = self.key(_clean(fold(name)))
+        stems = full.split()
+        neutral = [i for i, st in enumerate(stems) if st in _NEUTRAL_QUALIFIERS][:_MAX_DROP]
+        keys = [full]
+        for n in range(1, len(neutral) + 1):
+            for drop in combinations(neutral, n):
+                # основы уже отсортированы и без повторов — это готовая подпись
+                rest = " ".join(st for i, st in enumerate(stems) if i not in drop)
+                if rest:
+                    k = self._aliases.get(rest, rest)
+                    if k not in keys:
+                        keys.append(k)
+        return tuple(keys)
+
+
+_matcher = Matcher(ALIASES)
+
+
+@lru_cache(maxsize=4096)
+def parse(name: str) -> tuple[tuple[str, ...], bool]:
+    return _matcher.recipe_keys(name)
+
+
+@lru_cache(maxsize=4096)
+def product_key_ids(name: str) -> tuple[int, ...]:
+    """id ключей продукта (см. Matcher.product_keys); первый — основной."""
+    return tuple(key_id(k) for k in _matcher.product_keys(name))
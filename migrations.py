@@ -0,0 +1,258 @@
+"""Нумерованные миграции схемы, версия хранится в PRAGMA user_version файла БД.
+
+Каждая миграция — функция fn(conn), выполняется в своей транзакции ровно один раз.
+Новую миграцию добавляем в конец нужного списка; старые не меняем.
+"""
+from datetime import datetime
+from db_pool import on_connect
+from ingredients import norm
+
+_registered: set[tuple[str, int]] = set()
+
+
+def schema_version(conn, schema: str = "main") -> int:
+    return conn.execute(f"PRAGMA {schema}.user_version").fetchone()[0]
+
+
+def migrate(conn, steps: list) -> int:
+    """Применяет к conn ещё не применённые шаги из steps; возвращает итоговую версию."""
+    target = len(steps)
+    if schema_version(conn) >= target:
+        return target
+    # IMMEDIATE: параллельное соединение подождёт, а потом увидит уже новую версию
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        current = schema_version(conn)
+        for version, step in enumerate(steps[current:], start=current + 1):
+            step(conn)
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return target
+
+
+def register(path: str, steps: list) -> None:
+    """Все соединения db_pool с path будут приведены к последней версии при открытии."""
+    key = (path, id(steps))
+    if key in _registered:
+        return
+    _registered.add(key)
+    on_connect(path, lambda conn: migrate(conn, steps))
+
+
+# --- app.db: профиль, настройки, пользовательские рецепты ------------------
+
+def _app_v1_base(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS user_profile (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            gender TEXT,         -- 'm' / 'f' / NULL
+            birth TEXT,          -- строкой 'ДД.ММ.ГГГГ'
+            height_cm REAL,
+            weight_kg REAL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS app_settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+    """)
+    _recipes_v1_base(conn)
+
+
+def _recipes_v1_base(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS recipes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL UNIQUE,
+            steps TEXT,
+            time_min INTEGER,
+            difficulty TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS recipe_ingredients (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            recipe_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            qty REAL,
+            unit TEXT,
+            FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_recipe ON recipe_ingredients(recipe_id)")
+
+
+def _recipes_v2_keys(conn):
+    # обратный индекс: нормализованный ключ ингредиента -> рецепты (n — сколько раз ключ встречается в рецепте)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS recipe_keys (
+            key TEXT NOT NULL,
+            recipe_id INTEGER NOT NULL,
+            n INTEGER NOT NULL,
+            PRIMARY KEY (key, recipe_id),
+            FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_recipe_keys_recipe ON recipe_keys(recipe_id)")
+    counts: dict[tuple, int] = {}
+    for (rid, name) in conn.execute("SELECT recipe_id, name FROM recipe_ingredients"):
+        k = (norm(name), rid)
+        counts[k] = counts.get(k, 0) + 1
+    conn.executemany(
+        "INSERT OR REPLACE INTO recipe_keys(key, recipe_id, n) VALUES(?,?,?)",
+        [(key, rid, n) for ((key, rid), n) in counts.items()],
+    )
+
+
+def _recipes_v3_ingredients(conn):
+    # словарь ключей ингредиентов; id = ingredients.key_id(key), поэтому одинаков в каталоге и в app.db.
+    # Сами ключи заполняет recipes_db._index_recipes (и пересчитывает при смене ingredients.KEYS_VERSION).
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS ingredients (
+            id INTEGER PRIMARY KEY,
+            key TEXT NOT NULL UNIQUE
+        )
+    """)
+    conn.execute("ALTER TABLE recipe_ingredients ADD COLUMN ingredient_id INTEGER")  # основной ключ
+    conn.execute("ALTER TABLE recipe_ingredients ADD COLUMN alt_ids TEXT")  # JSON [id, ...] альтернатив, обычно NULL
+    conn.execute("ALTER TABLE recipe_ingredients ADD COLUMN optional INTEGER NOT NULL DEFAULT 0")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_ingredient ON recipe_ingredients(ingredient_id)")
+    # обратный индекс теперь по id ключа (включая альтернативы)
+    conn.execute("DROP TABLE IF EXISTS recipe_keys")
+    conn.execute("""
+        CREATE TABLE recipe_keys (
+            ingredient_id INTEGER NOT NULL,
+            recipe_id INTEGER NOT NULL,
+            n INTEGER NOT NULL,
+            PRIMARY KEY (ingredient_id, recipe_id),
+            FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_recipe_keys_recipe ON recipe_keys(recipe_id)")
+
+
+def _recipes_v4_amounts(conn):
+    # количество в общей мере (units.normalize): amount в dim ('g', 'ml', 'шт', ...); NULL — не указано
+    conn.execute("ALTER TABLE recipe_ingredients ADD COLUMN amount REAL")
+    conn.execute("ALTER TABLE recipe_ingredients ADD COLUMN dim TEXT")
+
+
+def _recipes_v5_filters(conn):
+    # фильтры подбора: индексы по времени и сложности, маска тегов по ингредиентам (tags.py)
+    conn.execute("ALTER TABLE recipes ADD COLUMN tags INTEGER NOT NULL DEFAULT 0")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_recipes_time ON recipes(time_min)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_recipes_difficulty ON recipes(difficulty)")
+
+
+def _recipes_v6_nutrition(conn):
+    # пищевая ценность всего рецепта (nutrients.recipe_nutrients) и число порций
+    for col in ("kcal", "protein", "fat", "carbs"):
+        conn.execute(f"ALTER TABLE recipes ADD COLUMN {col} REAL NOT NULL DEFAULT 0")
+    conn.execute("ALTER TABLE recipes ADD COLUMN servings INTEGER NOT NULL DEFAULT 1")
+
+
+def _app_v7_shopping(conn):
+    # список покупок: выбранные рецепты и сводная потребность по ключу ингредиента и мере
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS shopping_recipes (
+            recipe_id INTEGER PRIMARY KEY,
+            added_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS shopping_list (
+            ingredient_id INTEGER NOT NULL,
+            dim TEXT NOT NULL,          -- мера units ('g', 'ml', 'шт'...), '' — количество не указано
+            amount REAL NOT NULL,       -- сумма по рецептам в этой мере
+            n INTEGER NOT NULL,         -- сколько ингредиентов рецептов сложено в строку
+            name TEXT NOT NULL,
+            alt_ids TEXT,               -- JSON альтернатив, как в recipe_ingredients
+            PRIMARY KEY (ingredient_id, dim)
+        ) WITHOUT ROWID
+    """)
+
+
+def _recipes_v8_minhash(conn):
+    # похожие рецепты (minhash.py): подпись и LSH-корзины её полос; в каталоге это шаг 7 (нет списка покупок)
+    conn.execute("ALTER TABLE recipes ADD COLUMN minhash BLOB")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS recipe_bands (
+            band INTEGER NOT NULL,
+            bucket INTEGER NOT NULL,
+            recipe_id INTEGER NOT NULL,
+            PRIMARY KEY (band, bucket, recipe_id),
+            FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_recipe_bands_recipe ON recipe_bands(recipe_id)")
+
+
+APP_DB = [
+    _app_v1_base,
+    _recipes_v2_keys,
+    _recipes_v3_ingredients,
+    _recipes_v4_amounts,
+    _recipes_v5_filters,
+    _recipes_v6_nutrition,
+    _app_v7_shopping,
+    _recipes_v8_minhash,
+]
+
+# Схема рецептов в собранном каталоге (build_catalog.py) — те же шаги, что и для рецептов в app.db.
+CATALOG_DB = [
+    _recipes_v1_base,
+    _recipes_v2_keys,
+    _recipes_v3_ingredients,
+    _recipes_v4_amounts,
+    _recipes_v5_filters,
+    _recipes_v6_nutrition,
+    _recipes_v8_minhash,
+]
+
+
+# --- products.db ------------------------------------------------------------
+
+def _products_v1_base(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS products (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            category TEXT,
+            exp_date TEXT  -- строкой: 'ДД.ММ.ГГГГ'
+        )
+    """)
+
+
+def _iso(exp_date):
+    try:
+        return datetime.strptime((exp_date or "").strip(), "%d.%m.%Y").date().isoformat()
+    except ValueError:
+        return None
+
+
+def _products_v2_exp_iso(conn):
+    # колонку могли добавить ещё до миграций (init_products_db)
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(products)")}
+    if "exp_iso" not in cols:
+        conn.execute("ALTER TABLE products ADD COLUMN exp_iso TEXT")  # 'ГГГГ-ММ-ДД'
+    rows = conn.execute("SELECT id, exp_date FROM products WHERE exp_iso IS NULL").fetchall()
+    conn.executemany("UPDATE products SET exp_iso = ? WHERE id = ?", [(_iso(d), pid) for (pid, d) in rows])
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_products_exp_iso ON products(exp_iso)")
+
+
+def _products_v3_qty(conn):
+    # сколько есть; NULL — количество не указано (считается, что хватает)
+    conn.execute("ALTER TABLE products ADD COLUMN qty REAL")
+    conn.execute("ALTER TABLE products ADD COLUMN unit TEXT")
+
+
+PRODUCTS_DB = [
+    _products_v1_base,
+    _products_v2_exp_iso,
+    _products_v3_qty,
+]
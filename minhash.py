@@ -0,0 +1,61 @@
+"""MinHash-подписи рецептов и LSH-корзины для поиска похожих без сравнения всех пар.
+
+Подпись — NUM_PERM минимумов универсальных хэшей (a*x + b) mod 2^61-1 по id ключей
+ингредиентов рецепта (без STAPLES: соль и вода есть почти везде и только сближают всё
+со всем); доля совпавших позиций двух подписей оценивает коэффициент Жаккара множеств.
+Подпись режется на BANDS полос по ROWS значений, хэш полосы — корзина: рецепты, совпавшие
+хотя бы в одной корзине, — кандидаты (порог примерно (1/BANDS)^(1/ROWS) ≈ 0.5).
+Считается при записи рецепта (recipes_db._index_recipes), хранится в recipes.minhash и recipe_bands.
+"""
+import hashlib
+import random
+import struct
+
+from ingredients import key_id
+from matcher import parse
+
+# Увеличить при изменении параметров/хэшей: подписи будут пересчитаны.
+MINHASH_VERSION = 1
+
+NUM_PERM = 64
+BANDS, ROWS = 16, 4
+STAPLES = ("соль", "вода", "перец черный", "сахар")
+
+_PRIME = (1 << 61) - 1
+_MASK32 = (1 << 32) - 1
+# фиксированное зерно: подписи каталога и оверлея должны совпадать между запусками
+_rng = random.Random(20240611)
+_COEFFS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+_STAPLE_IDS = frozenset(key_id(parse(n)[0][0]) for n in STAPLES)
+_FORMAT = f"<{NUM_PERM}I"
+
+
+def signature(ingredient_ids) -> tuple[int, ...] | None:
+    """MinHash множества id ключей (младшие 32 бита минимумов); None — пустое множество."""
+    xs = {x % _PRIME for x in ingredient_ids if x and x not in _STAPLE_IDS}
+    if not xs:
+        return None
+    return tuple(min((a * x + b) % _PRIME for x in xs) & _MASK32 for (a, b) in _COEFFS)
+
+
+def pack(sig: tuple[int, ...]) -> bytes:
+    return struct.pack(_FORMAT, *sig)
+
+
+def unpack(blob: bytes) -> tuple[int, ...]:
+    return struct.unpack(_FORMAT, blob)
+
+
+def bands(sig: tuple[int, ...]) -> list[tuple[int, int]]:
+    """[(номер полосы, корзина)]; корзина — 63-битный хэш значений полосы (как ingredients.key_id)."""
+    out = []
+    for band in range(BANDS):
+        chunk = struct.pack(f"<{ROWS}I", *sig[band * ROWS:(band + 1) * ROWS])
+        digest = hashlib.blake2b(chunk, digest_size=8).digest()
+        out.append((band, int.from_bytes(digest, "big") >> 1))
+    return out
+
+
+def similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Оценка коэффициента Жаккара по двум подписям."""
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERM
@@ -0,0 +1,112 @@
+"""Пищевая ценность: таблица КБЖУ ингредиентов и дневная норма по профилю.
+
+Таблица — на 100 г, записана названиями и один раз переводится в id ключей (как в units).
+recipe_nutrients() считает вектор (ккал, белки, жиры, углеводы) всего рецепта по количествам
+ингредиентов, приведённым units.normalize к граммам; рецепт делится на порции по массе.
+Векторы считаются при записи рецепта (recipes_db._index_recipes) и хранятся в recipes.
+"""
+from datetime import date, datetime
+
+from ingredients import key_id
+from matcher import parse
+from units import normalize
+
+# Увеличить при изменении таблиц/расчёта: пищевая ценность рецептов будет пересчитана.
+NUTRITION_VERSION = 1
+
+# ккал, белки, жиры, углеводы на 100 г
+NUTRIENTS = {
+    "авокадо": (160, 2.0, 15.0, 9.0), "анчоусы": (210, 29.0, 10.0, 0.0), "арахис": (567, 26.0, 49.0, 16.0),
+    "базилик": (23, 3.2, 0.6, 2.7), "баклажан": (25, 1.0, 0.2, 6.0), "банан": (89, 1.1, 0.3, 23.0),
+    "куриные бедра": (210, 18.0, 15.0, 0.0), "бекон": (540, 37.0, 42.0, 1.4), "белый хлеб": (265, 9.0, 3.2, 49.0),
+    "булочки": (280, 9.0, 4.5, 50.0), "говяжий бульон": (15, 2.0, 0.5, 0.5), "куриный бульон": (15, 2.0, 0.5, 0.5),
+    "вода": (0, 0.0, 0.0, 0.0), "говядина": (250, 26.0, 15.0, 0.0), "говяжий фарш": (254, 17.0, 20.0, 0.0),
+    "горошек": (81, 5.0, 0.4, 14.0), "готовый рис": (130, 2.7, 0.3, 28.0), "гречка": (343, 13.0, 3.4, 72.0),
+    "грибы": (22, 3.1, 0.3, 3.3), "дрожжи": (105, 13.0, 2.0, 8.0), "замороженные овощи": (65, 3.0, 0.5, 13.0),
+    "зелень": (40, 3.0, 0.5, 7.0), "йогурт": (60, 4.0, 3.0, 5.0), "кабачок": (17, 1.2, 0.3, 3.1),
+    "какао": (228, 20.0, 14.0, 58.0), "капуста": (25, 1.3, 0.1, 5.8), "картофель": (77, 2.0, 0.1, 17.0),
+    "кефир": (53, 3.0, 2.5, 4.0), "кокосовое молоко": (230, 2.3, 24.0, 6.0), "колбаса": (300, 12.0, 28.0, 2.0),
+    "тунец консервированный": (116, 26.0, 1.0, 0.0), "кофе": (2, 0.1, 0.0, 0.0),
+    "крабовые палочки": (95, 6.0, 1.0, 15.0), "лук красный": (40, 1.1, 0.1, 9.0), "креветки": (99, 24.0, 0.3, 0.2),
+    "кукуруза": (86, 3.3, 1.4, 19.0), "куриный фарш": (143, 17.0, 8.0, 0.0), "куриное филе": (113, 23.0, 1.9, 0.0),
+    "лаваш": (275, 9.0, 1.2, 56.0), "листы лазаньи": (350, 12.0, 1.5, 72.0), "лайм": (30, 0.7, 0.2, 11.0),
+    "лапша": (350, 12.0, 1.5, 72.0), "лимон": (29, 1.1, 0.3, 9.0), "лимонный сок": (22, 0.4, 0.2, 7.0),
+    "листья салата": (15, 1.4, 0.2, 2.9), "лосось": (208, 20.0, 13.0, 0.0), "лук": (40, 1.1, 0.1, 9.0),
+    "майонез": (680, 1.0, 75.0, 1.0), "маскарпоне": (429, 4.8, 44.0, 4.8), "масло": (880, 0.1, 99.0, 0.0),
+    "маслины": (115, 0.8, 11.0, 6.0), "мед": (304, 0.3, 0.0, 82.0), "молоко": (60, 3.2, 3.2, 4.7),
+    "морковь": (41, 0.9, 0.2, 10.0), "сыр моцарелла": (280, 28.0, 17.0, 3.0), "мука": (364, 10.0, 1.0, 76.0),
+    "нори": (35, 6.0, 0.3, 5.0), "нут": (364, 19.0, 6.0, 61.0), "овсянка": (379, 13.0, 6.5, 67.0),
+    "огурец": (15, 0.7, 0.1, 3.6), "орегано": (265, 9.0, 4.3, 69.0), "орехи": (654, 15.0, 65.0, 14.0),
+    "паприка": (282, 14.0, 13.0, 54.0), "паста": (371, 13.0, 1.5, 75.0), "паста том ям": (300, 5.0, 20.0, 25.0),
+    "пельмени": (275, 12.0, 13.0, 28.0), "перец": (27, 1.0, 0.3, 6.0), "перец сладкий": (27, 1.0, 0.3, 6.0),
+    "перец черный": (251, 10.0, 3.3, 64.0), "печенье савоярди": (390, 8.0, 4.0, 80.0),
+    "разрыхлитель": (53, 0.0, 0.0, 28.0), "рис": (360, 7.0, 0.7, 79.0), "рыба": (100, 20.0, 2.0, 0.0),
+    "рыбное филе": (90, 19.0, 1.0, 0.0), "сахар": (387, 0.0, 0.0, 100.0), "свекла": (43, 1.6, 0.2, 10.0),
+    "сельдерей": (16, 0.7, 0.2, 3.0), "сливки": (200, 2.5, 20.0, 3.5), "сметана": (200, 2.8, 20.0, 3.2),
+    "соевый соус": (53, 8.0, 0.6, 5.0), "соль": (0, 0.0, 0.0, 0.0), "томатный соус": (30, 1.5, 0.2, 6.0),
+    "сухие травы": (250, 10.0, 5.0, 50.0), "сухой чеснок": (330, 17.0, 0.7, 73.0), "сыр": (360, 25.0, 28.0, 1.5),
+    "сыр твердый": (360, 25.0, 28.0, 1.5), "сыр фета": (264, 14.0, 21.0, 4.0), "тахини": (595, 17.0, 54.0, 21.0),
+    "творог": (150, 17.0, 9.0, 2.0), "томаты": (18, 0.9, 0.2, 3.9), "тортильи": (300, 8.0, 7.0, 50.0),
+    "треска": (82, 18.0, 0.7, 0.0), "тыква": (26, 1.0, 0.1, 6.5), "фасоль": (100, 7.0, 0.5, 17.0),
+    "хек": (86, 17.0, 2.0, 0.0), "хлеб": (250, 8.0, 3.0, 48.0), "чеснок": (149, 6.4, 0.5, 33.0),
+    "чечевица": (352, 25.0, 1.0, 60.0), "чили": (40, 2.0, 0.4, 9.0), "яблоки": (52, 0.3, 0.2, 14.0),
+    "ягоды": (50, 1.0, 0.3, 12.0), "яйца": (155, 13.0, 11.0, 1.1),
+}
+# масса одной порции: рецепт делится на round(масса / SERVING_G) порций, не меньше одной
+SERVING_G = 350.0
+
+# Mifflin-St Jeor: 10*вес + 6.25*рост - 5*возраст + (5 для мужчин, -161 для женщин)
+_SEX_OFFSET = {"m": 5.0, "f": -161.0}
+ACTIVITY = 1.375  # лёгкая активность
+# доли калорий: белки, жиры, углеводы; ккал в грамме
+MACRO_SHARE = (0.2, 0.3, 0.5)
+_KCAL_PER_G = (4.0, 9.0, 4.0)
+DEFAULT_KCAL = 2000.0
+
+_ZERO = (0.0, 0.0, 0.0, 0.0)
+_NUTRIENTS = {key_id(parse(n)[0][0]): v for n, v in NUTRIENTS.items()}
+
+
+def recipe_nutrients(ingredients: list[tuple[int, float | None, str | None]]) -> tuple[tuple[float, ...], int]:
+    """((ккал, б, ж, у) всего рецепта, число порций) по [(id ключа, qty, unit), ...].
+
+    Без количества («по вкусу») и в мерах, не сводимых к массе, ингредиент не учитывается;
+    миллилитры без известной плотности считаются граммами.
+    """
+    total = [0.0, 0.0, 0.0, 0.0]
+    mass = 0.0
+    for (iid, qty, unit) in ingredients:
+        amount = normalize(iid, qty, unit)
+        if amount is None or amount[1] not in ("g", "ml"):
+            continue
+        grams = amount[0]
+        mass += grams
+        per100 = _NUTRIENTS.get(iid, _ZERO)
+        for i in range(4):
+            total[i] += per100[i] * grams / 100.0
+    return tuple(round(x, 1) for x in total), max(1, round(mass / SERVING_G))
+
+
+def _age(birth: str | None, today: date) -> int | None:
+    try:
+        b = datetime.strptime((birth or "").strip(), "%d.%m.%Y").date()
+    except ValueError:
+        return None
+    return today.year - b.year - ((today.month, today.day) < (b.month, b.day))
+
+
+def daily_targets(profile: dict, today: date | None = None) -> dict:
+    """Дневная норма по профилю (db.user_profile): {"kcal", "protein", "fat", "carbs", "complete"}.
+
+    Калории — Mifflin-St Jeor * ACTIVITY, БЖУ — доли MACRO_SHARE. Если в профиле не хватает
+    пола/даты рождения/роста/веса, берётся DEFAULT_KCAL и complete=False.
+    """
+    age = _age(profile.get("birth"), today or date.today())
+    w, h, sex = profile.get("weight_kg"), profile.get("height_cm"), profile.get("gender")
+    complete = bool(age is not None and w and h and sex in _SEX_OFFSET)
+    if complete:
+        kcal = (10.0 * float(w) + 6.25 * float(h) - 5.0 * age + _SEX_OFFSET[sex]) * ACTIVITY
+    else:
+        kcal = DEFAULT_KCAL
+    protein, fat, carbs = (kcal * share / per_g for share, per_g in zip(MACRO_SHARE, _KCAL_PER_G))
+    return {"kcal": kcal, "protein": protein, "fat": fat, "carbs": carbs, "complete": complete}
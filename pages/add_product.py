@@ -8,6 +8,7 @@ if PROJECT_ROOT not in sys.path:
 
 from ui.layout import page_layout
 from products_db import init_products_db, insert_product
+from db_executor import submit
 from ui.product_catalog import PRODUCT_CATEGORIES, category_options, product_options
 
 
@@ -32,6 +33,15 @@ class AddProductView(ft.Container):
 
         exp = ft.TextField(label="Срок годности до (ДД.ММ.ГГГГ)", width=420)
 
+        # количество необязательно: без него продукт считается имеющимся в достатке
+        qty = ft.TextField(label="Количество (необязательно)", width=270, keyboard_type=ft.KeyboardType.NUMBER)
+        unit_dd = ft.Dropdown(
+            label="Ед.",
+            width=140,
+            value="шт",
+            options=[ft.dropdown.Option(u) for u in ("шт", "г", "кг", "мл", "л")],
+        )
+
         def show_toast(msg: str, duration_ms: int = 1800):
             bg = "#16a34a"
 
@@ -86,6 +96,8 @@ class AddProductView(ft.Container):
 
         cat.on_change = on_category_change
 
+        save_btn = ft.ElevatedButton("Сохранить", icon=ft.Icons.SAVE)
+
         def on_save(_):
             category = (cat.value or "").strip()
             product_name = (name_dd.value or "").strip()
@@ -107,27 +119,51 @@ class AddProductView(ft.Container):
                 show_toast("Дата: ДД.ММ.ГГГГ")
                 return
 
-            data = {"name": product_name, "category": category, "exp_date": exp_date}
-            new_id = insert_product(data)
+            qty_text = (qty.value or "").strip().replace(",", ".")
+            amount = None
+            if qty_text:
+                try:
+                    amount = float(qty_text)
+                except ValueError:
+                    amount = -1.0
+                if amount <= 0:
+                    show_toast("Количество: положительное число")
+                    return
+
+            data = {
+                "name": product_name, "category": category, "exp_date": exp_date,
+                "qty": amount, "unit": unit_dd.value if amount is not None else None,
+            }
+            save_btn.disabled = True
+            page.update()
 
-            show_toast(f"Продукт сохранён (id={new_id})")
+            def on_saved(new_id):
+                show_toast(f"Продукт сохранён (id={new_id})")
 
-            cat.value = None
-            name_dd.value = None
-            name_dd.options = []
-            name_dd.disabled = True
-            name_dd.hint_text = "Сначала выберите категорию"
-            exp.value = ""
-            page.update()
+                cat.value = None
+                name_dd.value = None
+                name_dd.options = []
+                name_dd.disabled = True
+                name_dd.hint_text = "Сначала выберите категорию"
+                exp.value = ""
+                qty.value = ""
+                save_btn.disabled = False
+                page.update()
 
-            def go_back():
-                page.go("/search")
+                def go_back():
+                    page.go("/search")
 
-            t = threading.Timer(0.5, go_back)
-            t.daemon = True
-            t.start()
+                t = threading.Timer(0.5, go_back)
+                t.daemon = True
+                t.start()
+
+            def on_failed(_exc):
+                save_btn.disabled = False
+                show_toast("Не удалось сохранить продукт")
+
+            submit(insert_product, data, on_done=on_saved, on_error=on_failed)
 
-        save_btn = ft.ElevatedButton("Сохранить", icon=ft.Icons.SAVE, on_click=on_save)
+        save_btn.on_click = on_save
         cancel_btn = ft.OutlinedButton("Отмена", icon=ft.Icons.CLOSE, on_click=lambda _: page.go("/search"))
 
         form = ft.Column(
@@ -136,6 +172,7 @@ class AddProductView(ft.Container):
                 cat,
                 name_dd,
                 exp,
+                ft.Row([qty, unit_dd], spacing=10),
                 ft.Row([save_btn, cancel_btn], spacing=10),
             ],
             spacing=12,
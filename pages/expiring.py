@@ -1,14 +1,19 @@
 import flet as ft
 from ui.layout import page_layout
+from products_db import init_products_db, list_expired, list_expiring
 class ExpiringView(ft.Container):
     def __init__(self, page: ft.Page):
-        lst = ft.ListView(
-            expand=True,
-            controls=[
-                ft.ListTile(title=ft.Text("Продукт 1"), subtitle=ft.Text("до 18.09.2025")),
-                ft.ListTile(title=ft.Text("Продукт 2"), subtitle=ft.Text("до 19.09.2025")),
-            ],
-        )
+        init_products_db()
+        tiles = [
+            ft.ListTile(title=ft.Text(p["name"] or "—"), subtitle=ft.Text(f"просрочено с {p['exp_date']}"))
+            for p in list_expired(limit=100)
+        ] + [
+            ft.ListTile(title=ft.Text(p["name"] or "—"), subtitle=ft.Text(f"до {p['exp_date']}"))
+            for p in list_expiring(days=7, limit=100)
+        ]
+        if not tiles:
+            tiles = [ft.ListTile(title=ft.Text("Нет товаров с истекающим сроком"))]
+        lst = ft.ListView(expand=True, controls=tiles)
         super().__init__(
             expand=True,
             bgcolor=page.bgcolor,
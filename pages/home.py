@@ -1,10 +1,10 @@
 import flet as ft
-from datetime import datetime, date, timedelta
+from datetime import datetime
 import sys, os
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
-from products_db import init_products_db, list_products
+from products_db import init_products_db, expiry_stats, list_expiring
 from ui.layout import page_layout
 from ui.colors import PILL, STAT_BORDER
 
@@ -167,40 +167,21 @@ class HomeView(ft.Container):
             content=page_layout(page, "Welcome back.\nUser", body),
         )
         self._load_stats_and_expiring(initial=True)
-    def _parse_date(self, s: str):
-        s = (s or "").strip()
-        try:
-            return datetime.strptime(s, "%d.%m.%Y").date()
-        except Exception:
-            return None
     def _load_stats_and_expiring(self, initial: bool = False):
-        items = list_products(limit=2000)
-        today = date.today()
-        soon_limit = today + timedelta(days=3)
-        total = len(items)
-        expired = 0
-        soon = []
-        for p in items:
-            d = self._parse_date(p.get("exp_date"))
-            if not d:
-                continue
-            if d < today:
-                expired += 1
-            elif today <= d <= soon_limit:
-                soon.append((p.get("name") or "—", p.get("exp_date") or ""))
-        self.total_text.value = str(total)
-        self.expired_text.value = str(expired)
+        MAX_PER_COL = 4
+        stats = expiry_stats(soon_days=3)
+        shown = list_expiring(days=3, limit=MAX_PER_COL * 2)
+        self.total_text.value = str(stats["total"])
+        self.expired_text.value = str(stats["expired"])
         self.expiring_left.controls.clear()
         self.expiring_right.controls.clear()
-        sorted_soon = sorted(soon, key=lambda x: self._parse_date(x[1]) or date.max)
-        MAX_PER_COL = 4
-        if not sorted_soon:
+        if not shown:
             self.expiring_left.controls.append(
                 ft.Text("Нет товаров с истекающим сроком", color="white", size=14)
             )
         else:
-            shown = sorted_soon[: MAX_PER_COL * 2]
-            for i, (name, ds) in enumerate(shown):
+            for i, p in enumerate(shown):
+                name, ds = p.get("name") or "—", p.get("exp_date") or ""
                 item = ft.Row(
                     [
                         ft.Icon(ft.Icons.WARNING_AMBER, color="white"),
@@ -209,7 +190,7 @@ class HomeView(ft.Container):
                     spacing=8,
                 )
                 (self.expiring_left if i < MAX_PER_COL else self.expiring_right).controls.append(item)
-            rest = len(sorted_soon) - len(shown)
+            rest = stats["soon"] - len(shown)
             if rest > 0:
                 self.expiring_right.controls.append(
                     ft.Text(f"ещё {rest}…", color="white", size=14, weight="w600")
@@ -0,0 +1,139 @@
+import json
+import flet as ft
+from ui.layout import page_layout
+from settings_db import get_setting
+from planner import plan_day, plan_meals
+from recipes_db import ensure_recipe_catalog
+from db_executor import submit
+from pages.recipes import FILTERS_KEY
+from shopping_db import add_recipes
+
+WEEKDAYS = ("Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс")
+
+
+class PlannerView(ft.Container):
+    DAY_OPTIONS = (3, 5, 7)
+
+    def __init__(self, page: ft.Page):
+        self.page = page
+        ensure_recipe_catalog()
+        try:
+            # те же фильтры, что выбраны на странице рецептов
+            self.filters: dict = json.loads(get_setting(FILTERS_KEY, "{}"))
+        except ValueError:
+            self.filters = {}
+        self.days = 7
+
+        self.days_dd = ft.Dropdown(
+            label="Дней",
+            width=120,
+            dense=True,
+            value=str(self.days),
+            options=[ft.dropdown.Option(str(d)) for d in self.DAY_OPTIONS],
+            on_change=self._on_days,
+        )
+        self.plan_column = ft.Column(spacing=14)
+        self.unused_text = ft.Text("", size=12, color="#b45309")
+        self.day_column = ft.Column(spacing=8)
+
+        body = ft.Column(
+            [
+                ft.Row(
+                    [
+                        ft.Text("План: доесть до срока", size=20, weight="w700"),
+                        ft.Container(expand=True),
+                        ft.OutlinedButton("В список покупок", icon=ft.Icons.ADD_SHOPPING_CART, on_click=self._to_shopping),
+                        self.days_dd,
+                    ],
+                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                ),
+                self.unused_text,
+                self.plan_column,
+                ft.Divider(),
+                ft.Text("Меню на день по норме КБЖУ", size=20, weight="w700"),
+                self.day_column,
+            ],
+            spacing=14,
+            expand=True,
+            scroll=ft.ScrollMode.AUTO,
+        )
+        self._render(plan_meals(self.days, filters=self.filters), initial=True)
+        self._render_day(plan_day(filters=self.filters))
+
+        super().__init__(
+            expand=True,
+            bgcolor=page.bgcolor,
+            content=page_layout(page, "План питания", body),
+        )
+
+    def _on_days(self, e):
+        self.days = int(e.control.value)
+        # пересчёт плана — в потоке БД, отрисовка по готовности
+        submit(
+            plan_meals, self.days, filters=self.filters,
+            key="planner.plan", on_done=lambda plan: self._render(plan, initial=False),
+        )
+
+    def _to_shopping(self, e):
+        ids = [d["recipe"]["id"] for d in self._plan["days"]]
+        submit(add_recipes, ids, key="planner.shopping", on_done=lambda _: self.page.go("/shopping"))
+
+    def _day_card(self, day: dict) -> ft.Container:
+        is_dark = self.page.theme_mode == ft.ThemeMode.DARK
+        bg = "#171B26" if is_dark else "white"
+        br = "#2A3042" if is_dark else "#E5E6EB"
+        text_primary = "#E9ECF5" if is_dark else "#111827"
+        text_muted = "#AAB2C8" if is_dark else "#6B7280"
+
+        d = day["date"]
+        uses = ", ".join(f"{p['name']} (до {p['exp_date']})" for p in day["uses"]) or "—"
+        missing = ", ".join(i.get("name") or "—" for i in day["missing"]) or "—"
+        return ft.Container(
+            bgcolor=bg,
+            border=ft.border.all(1, br),
+            border_radius=14,
+            padding=16,
+            content=ft.Column(
+                [
+                    ft.Text(f"{WEEKDAYS[d.weekday()]}, {d.strftime('%d.%m')}", size=12, color=text_muted),
+                    ft.Text(day["recipe"].get("title", "Рецепт"), size=18, weight="w700", color=text_primary),
+                    ft.Text(f"Использует: {uses}", size=12, color="#16a34a"),
+                    ft.Text(f"Нужно докупить: {missing}", size=12, color=text_muted),
+                ],
+                spacing=6,
+            ),
+        )
+
+    def _render(self, plan: dict, initial: bool):
+        self._plan = plan
+        self.plan_column.controls = [self._day_card(d) for d in plan["days"]] or [
+            ft.Text("Нечего планировать: добавь продукты со сроком годности.", size=14)
+        ]
+        unused = ", ".join(p["name"] for p in plan["unused"])
+        self.unused_text.value = f"Не попали в план: {unused}" if unused else ""
+        if not initial:
+            self.plan_column.update()
+            self.unused_text.update()
+
+    def _render_day(self, day: dict):
+        t = day["targets"]
+        kcal, protein, fat, carbs = day["totals"]
+        lines = [
+            ft.Text(
+                f"Норма: {t['kcal']:.0f} ккал, Б {t['protein']:.0f} / Ж {t['fat']:.0f} / У {t['carbs']:.0f} г"
+                + ("" if t["complete"] else " (заполни профиль, чтобы посчитать по росту и весу)"),
+                size=13,
+            )
+        ]
+        for m in day["meals"]:
+            k, p, f, c = m["nutrition"]
+            lines.append(
+                ft.Text(f"• {m['recipe'].get('title', 'Рецепт')} — {k:.0f} ккал, Б {p:.0f} / Ж {f:.0f} / У {c:.0f}", size=14)
+            )
+        if day["meals"]:
+            lines.append(
+                ft.Text(f"Итого: {kcal:.0f} ккал, Б {protein:.0f} / Ж {fat:.0f} / У {carbs:.0f} г", size=13, weight="w600")
+            )
+        else:
+            lines.append(ft.Text("Из того, что есть, пока ничего не собрать.", size=14))
+        self.day_column.controls = lines
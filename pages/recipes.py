@@ -1,19 +1,22 @@
+import json
 import math
+import threading
+from itertools import islice
 import flet as ft
 from ui.layout import page_layout
-from settings_db import get_setting
-from recommend import suggest_recipes
-from recipes_db import (
-    init_recipes_db,
-    seed_demo_if_empty,
-    seed_world_recipes,
-    seed_more_world_recipes,
-    get_all_recipes,
-)
+from settings_db import get_setting, set_setting
+from recommend import iter_suggestions
+from recipes_db import count_recipes, ensure_recipe_catalog, get_recipe_by_id, similar_recipes
+from db_executor import submit
+from shopping_db import add_recipes, remove_recipes, shopping_recipe_ids
+from tags import DIETS
+
+FILTERS_KEY = "recipe_filters"
 
 
 class RecipesView(ft.Container):
     PAGE_SIZE = 3
+    TIME_LIMITS = (20, 40)
 
     def __init__(self, page: ft.Page):
         self.page = page
@@ -42,15 +45,15 @@ class RecipesView(ft.Container):
             )
             return
 
-        init_recipes_db()
-        seed_demo_if_empty()
-        seed_world_recipes()
-        seed_more_world_recipes()
-        all_recipes = get_all_recipes()
-        self.recipes_by_title = {r["title"].strip().lower(): r for r in all_recipes}
-        self.items: list[dict] = suggest_recipes(top_n=500)
-        self.page_index: int = 0
-        self.total_pages: int = max(1, math.ceil(len(self.items) / self.PAGE_SIZE))
+        # обычно уже выполнено фоном при старте; пишет в БД только при смене каталога
+        ensure_recipe_catalog()
+        try:
+            self.filters: dict = json.loads(get_setting(FILTERS_KEY, "{}"))
+        except ValueError:
+            self.filters = {}
+        self._stream_lock = threading.Lock()
+        self._reset_stream()
+        self._in_shopping: set[int] = set(shopping_recipe_ids())
 
         self.title_text = ft.Text("Рецепты из того, что есть", size=20, weight="w700")
         self.cards_column = ft.Column(spacing=14)
@@ -69,7 +72,7 @@ class RecipesView(ft.Container):
         self._render_page(initial=True)
 
         body = ft.Column(
-            [self.title_text, self.cards_column, ft.Container(height=8), pager],
+            [self.title_text, self._filters_bar(), self.cards_column, ft.Container(height=8), pager],
             spacing=14,
             expand=True,
         )
@@ -80,6 +83,84 @@ class RecipesView(ft.Container):
             content=page_layout(page, "Рецепты", body),
         )
 
+    def _reset_stream(self):
+        # подбор читается лениво: только показанные страницы и одна следующая про запас
+        with self._stream_lock:
+            self._stream = iter_suggestions(batch=self.PAGE_SIZE * 2, filters=self.filters)
+            self._exhausted = False
+            self.items: list[dict] = []
+        self.page_index: int = 0
+        self.total_pages: int = max(1, math.ceil(count_recipes(self.filters) / self.PAGE_SIZE))
+
+    def _set_filter(self, key: str, value):
+        if value:
+            self.filters[key] = value
+        else:
+            self.filters.pop(key, None)
+        set_setting(FILTERS_KEY, json.dumps(self.filters, ensure_ascii=False), debounce=True)
+        self._reset_stream()
+        self._render_page(initial=False)
+
+    def _filters_bar(self) -> ft.Row:
+        """Чипы фильтров: время, сложность, диеты и поле «без ингредиентов»."""
+        time_chips: list[ft.Chip] = []
+
+        def on_time(e, minutes: int):
+            for chip in time_chips:
+                if chip is not e.control:
+                    chip.selected = False
+                    chip.update()
+            self._set_filter("max_time", minutes if e.control.selected else None)
+
+        for minutes in self.TIME_LIMITS:
+            time_chips.append(
+                ft.Chip(
+                    label=ft.Text(f"до {minutes} мин"),
+                    selected=self.filters.get("max_time") == minutes,
+                    on_select=lambda e, m=minutes: on_time(e, m),
+                )
+            )
+
+        easy = ft.Chip(
+            label=ft.Text("легко"),
+            selected="легко" in (self.filters.get("difficulty") or ()),
+            on_select=lambda e: self._set_filter("difficulty", ["легко"] if e.control.selected else None),
+        )
+
+        def on_diet(e, diet: str):
+            diets = [d for d in self.filters.get("diet") or () if d != diet]
+            if e.control.selected:
+                diets.append(diet)
+            self._set_filter("diet", diets)
+
+        diet_chips = [
+            ft.Chip(
+                label=ft.Text(label),
+                selected=diet in (self.filters.get("diet") or ()),
+                on_select=lambda e, d=diet: on_diet(e, d),
+            )
+            for diet, (label, _) in DIETS.items()
+        ]
+
+        exclude = ft.TextField(
+            label="Без ингредиентов",
+            hint_text="через запятую: свинина, грибы",
+            value=", ".join(self.filters.get("exclude") or ()),
+            width=260,
+            dense=True,
+            on_submit=lambda e: self._set_filter(
+                "exclude", [x.strip() for x in (e.control.value or "").split(",") if x.strip()]
+            ),
+        )
+
+        return ft.Row(
+            [*time_chips, easy, *diet_chips, exclude],
+            spacing=8,
+            run_spacing=8,
+            wrap=True,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
     def _pill(self, text: str):
         is_dark = self.page.theme_mode == ft.ThemeMode.DARK
         bg = "#222B3F" if is_dark else "#F3F4F6"
@@ -98,6 +179,12 @@ class RecipesView(ft.Container):
             self.page.dialog.open = False
         self.page.update()
 
+    def _open_similar(self, recipe_id: int, title: str):
+        # похожий рецепт открывается вместо текущего; есть/докупить для него не считаем
+        if getattr(self.page, "dialog", None):
+            self.page.dialog.open = False
+        self._open_recipe_dialog(recipe_id, title, "—", "—")
+
     def _format_ingredients(self, ingredients: list[dict]) -> str:
         if not ingredients:
             return "—"
@@ -117,9 +204,9 @@ class RecipesView(ft.Container):
                 lines.append(f"• {name} — {qty_str} {unit}".strip())
         return "\n".join(lines)
 
-    def _open_recipe_dialog(self, title: str, have: str, missing: str):
-        key = (title or "").strip().lower()
-        full = self.recipes_by_title.get(key)
+    def _open_recipe_dialog(self, recipe_id: int, title: str, have: str, missing: str):
+        # в подборке рецепты без текста шагов — полный рецепт читаем только при открытии
+        full = get_recipe_by_id(recipe_id)
 
         if full is None:
             dialog_title = title or "Рецепт"
@@ -135,6 +222,15 @@ class RecipesView(ft.Container):
             time_text = f"Время приготовления: {tm} мин" if tm is not None else "Время приготовления: —"
             diff_text = f"Сложность: {full.get('difficulty') or '—'}"
 
+        similar = similar_recipes(recipe_id) if full is not None else []
+        similar_controls = [
+            ft.TextButton(
+                f"{r['title']} — {round(sim * 100)}% общих ингредиентов",
+                on_click=lambda e, rid=r["id"], t=r["title"]: self._open_similar(rid, t),
+            )
+            for (r, sim) in similar
+        ] or [ft.Text("—")]
+
         dialog = ft.AlertDialog(
             modal=True,
             title=ft.Text(dialog_title, weight="w700"),
@@ -151,6 +247,9 @@ class RecipesView(ft.Container):
                         ft.Divider(),
                         ft.Text("Приготовление:", weight="w700"),
                         ft.Text(steps_text, selectable=True, size=14),
+                        ft.Divider(),
+                        ft.Text("Похожие рецепты:", weight="w700"),
+                        *similar_controls,
                     ],
                     spacing=10,
                     tight=True,
@@ -210,8 +309,9 @@ class RecipesView(ft.Container):
                             ft.ElevatedButton(
                                 "Готовлю",
                                 icon=ft.Icons.RESTAURANT,
-                                on_click=lambda e, t=title, h=have, m=missing: self._open_recipe_dialog(t, h, m),
-                            )
+                                on_click=lambda e, rid=r.get("id"), t=title, h=have, m=missing: self._open_recipe_dialog(rid, t, h, m),
+                            ),
+                            self._shopping_button(r.get("id")),
                         ],
                         spacing=10,
                     ),
@@ -220,11 +320,43 @@ class RecipesView(ft.Container):
             ),
         )
 
+    def _shopping_button(self, recipe_id: int) -> ft.OutlinedButton:
+        def label(in_list: bool) -> str:
+            return "В списке покупок" if in_list else "В список покупок"
+
+        def toggle(e):
+            if recipe_id in self._in_shopping:
+                self._in_shopping.discard(recipe_id)
+                submit(remove_recipes, [recipe_id], key=f"shopping.{recipe_id}")
+            else:
+                self._in_shopping.add(recipe_id)
+                submit(add_recipes, [recipe_id], key=f"shopping.{recipe_id}")
+            in_list = recipe_id in self._in_shopping
+            e.control.text = label(in_list)
+            e.control.icon = ft.Icons.CHECK if in_list else ft.Icons.ADD_SHOPPING_CART
+            e.control.update()
+
+        in_list = recipe_id in self._in_shopping
+        return ft.OutlinedButton(
+            label(in_list),
+            icon=ft.Icons.CHECK if in_list else ft.Icons.ADD_SHOPPING_CART,
+            on_click=toggle,
+        )
+
+    def _take(self, n: int):
+        """Дочитывает подбор, пока в self.items не станет n элементов (или он не закончится)."""
+        with self._stream_lock:
+            if len(self.items) < n and not self._exhausted:
+                self.items.extend(islice(self._stream, n - len(self.items)))
+                self._exhausted = len(self.items) < n
+
     def _render_page(self, initial: bool = False):
         self.cards_column.controls.clear()
 
+        self._take((self.page_index + 1) * self.PAGE_SIZE)
         total = len(self.items)
-        self.total_pages = max(1, math.ceil(total / self.PAGE_SIZE))
+        if self._exhausted:
+            self.total_pages = max(1, math.ceil(total / self.PAGE_SIZE))
         self.page_index = max(0, min(self.page_index, self.total_pages - 1))
 
         if total == 0:
@@ -240,7 +372,8 @@ class RecipesView(ft.Container):
                     border_radius=14,
                     padding=16,
                     content=ft.Text(
-                        "Пока нет подходящих рецептов. Добавь продукты или рецепты.",
+                        "Пока нет подходящих рецептов. Добавь продукты или рецепты."
+                        if not self.filters else "Под выбранные фильтры рецептов нет.",
                         size=14,
                         color=col,
                     ),
@@ -258,6 +391,8 @@ class RecipesView(ft.Container):
             self.page_label.value = f"{self.page_index + 1} / {self.total_pages}"
             self.prev_btn.disabled = self.page_index == 0
             self.next_btn.disabled = self.page_index >= self.total_pages - 1
+            # следующую страницу готовим фоном, пока пользователь читает эту
+            submit(self._take, (self.page_index + 2) * self.PAGE_SIZE, key="recipes.prefetch")
 
         if not initial:
             self.cards_column.update()
@@ -8,6 +8,7 @@ if PROJECT_ROOT not in sys.path:
 from ui.layout import page_layout
 from ui.colors import PILL
 from products_db import init_products_db, list_products, delete_product
+from db_executor import submit
 
 
 class SearchView(ft.Container):
@@ -128,10 +129,18 @@ class SearchView(ft.Container):
         return self.CATEGORY_IMG.get(cat, self.DEFAULT_CAT_IMG)
 
     def _on_search_change(self, e: ft.ControlEvent):
+        # фильтрация идёт по уже загруженному списку — без запроса к БД на каждое нажатие
         self._query = (self.search.value or "").strip().lower()
         self.page_index = 0
         self._render_list()
-        self.listview.update()
+
+    def _reload(self):
+        """Перечитывает продукты в фоне; устаревшие перезагрузки отменяются."""
+        def on_loaded(items):
+            self._all = items
+            self._render_list()
+
+        submit(list_products, limit=500, key="search.products", on_done=on_loaded)
 
     def _filter_items(self):
         if not self._query:
@@ -156,7 +165,6 @@ class SearchView(ft.Container):
         self.next_btn.disabled = self.page_index >= self.total_pages - 1
 
     def _render_list(self, initial: bool = False):
-        self._all = list_products(limit=500)
         items = self._filter_items()
 
         self._update_pager_controls(len(items))
@@ -206,7 +214,11 @@ class SearchView(ft.Container):
 
 
         name = ft.Text(p["name"] or "—", size=16, weight="w600", color=self.text_primary)
-        sub = ft.Text(f"До {p['exp_date'] or '—'}", size=12, color=self.text_muted)
+        sub_text = f"До {p['exp_date'] or '—'}"
+        if p.get("qty") is not None:
+            q = p["qty"]
+            sub_text += f" · {int(q) if float(q).is_integer() else q} {p.get('unit') or ''}".rstrip()
+        sub = ft.Text(sub_text, size=12, color=self.text_muted)
 
         delete_btn = ft.IconButton(
             icon=ft.Icons.DELETE_OUTLINE,
@@ -230,12 +242,10 @@ class SearchView(ft.Container):
         )
 
     def _delete_now(self, p: dict):
-        try:
-            delete_product(p["id"])
+        def on_deleted(_=None):
             self._toast("Удалено")
-        except Exception:
-            self._toast("Удалено")
-        finally:
             if self.page_index > 0 and (self.page_index * self.PAGE_SIZE) >= (len(self._filter_items()) - 1):
                 self.page_index -= 1
-            self._render_list()
+            self._reload()
+
+        submit(delete_product, p["id"], on_done=on_deleted, on_error=on_deleted)
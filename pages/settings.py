@@ -6,14 +6,12 @@ class SettingsView(ft.Container):
     def __init__(self, page: ft.Page):
 
         def on_theme_change(e: ft.ControlEvent):
-            is_dark = e.control.value
-            page.theme_mode = ft.ThemeMode.DARK if is_dark else ft.ThemeMode.LIGHT
-            set_setting("theme", "dark" if is_dark else "light")
-            page.go(page.route)
+            # тему применяет подписчик в main.py
+            set_setting("theme", "dark" if e.control.value else "light", debounce=True)
 
         def on_rec_change(e: ft.ControlEvent):
             enabled = e.control.value
-            set_setting("recommend_recipes", "1" if enabled else "0")
+            set_setting("recommend_recipes", "1" if enabled else "0", debounce=True)
             page.snack_bar = ft.SnackBar(
                 ft.Text("Рекомендации включены" if enabled else "Рекомендации выключены"),
                 open=True,
@@ -0,0 +1,95 @@
+import flet as ft
+from ui.layout import page_layout
+from db_executor import submit
+from shopping_db import clear, get_shopping_list, remove_recipes, shopping_recipe_ids
+from recipes_db import get_recipes_by_ids
+from marginal import one_more_ingredient
+
+_DIM_LABELS = {"g": ("г", "кг"), "ml": ("мл", "л")}
+
+
+def format_amount(amount: float | None, dim: str | None) -> str:
+    """330.0 'g' -> '330 г', 1500 'g' -> '1.5 кг', 2 'шт' -> '2 шт'; без количества — ''."""
+    if amount is None:
+        return ""
+    small, big = _DIM_LABELS.get(dim, (dim or "", None))
+    if big and amount >= 1000:
+        amount, small = amount / 1000, big
+    value = f"{amount:.1f}".rstrip("0").rstrip(".") if amount < 10 else f"{amount:.0f}"
+    return f"{value} {small}".strip()
+
+
+class ShoppingView(ft.Container):
+    def __init__(self, page: ft.Page):
+        self.page = page
+        self.recipes_row = ft.Row(spacing=8, run_spacing=8, wrap=True)
+        self.items_column = ft.Column(spacing=4)
+        self.one_more_column = ft.Column(spacing=4)
+
+        body = ft.Column(
+            [
+                ft.Row(
+                    [
+                        ft.Text("Список покупок", size=20, weight="w700"),
+                        ft.Container(expand=True),
+                        ft.OutlinedButton("Очистить", icon=ft.Icons.DELETE_OUTLINE, on_click=self._clear),
+                    ],
+                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                ),
+                self.recipes_row,
+                ft.Divider(),
+                self.items_column,
+                ft.Divider(),
+                ft.Text("Докупить одно — и откроются новые рецепты", size=16, weight="w700"),
+                self.one_more_column,
+            ],
+            spacing=14,
+            expand=True,
+            scroll=ft.ScrollMode.AUTO,
+        )
+        self._render(initial=True)
+
+        super().__init__(
+            expand=True,
+            bgcolor=page.bgcolor,
+            content=page_layout(page, "Покупки", body),
+        )
+
+    def _render(self, initial: bool = False):
+        recipes = get_recipes_by_ids(shopping_recipe_ids(), with_steps=False)
+        # чип рецепта: крестик убирает его вклад из списка
+        self.recipes_row.controls = [
+            ft.Chip(label=ft.Text(r["title"]), on_delete=lambda e, rid=r["id"]: self._remove(rid))
+            for r in recipes
+        ]
+        items = get_shopping_list()
+        if not recipes:
+            self.items_column.controls = [ft.Text("Добавь рецепты кнопкой «В список покупок» на странице рецептов.")]
+        elif not items:
+            self.items_column.controls = [ft.Text("Всё нужное уже есть в холодильнике.")]
+        else:
+            self.items_column.controls = [
+                ft.Checkbox(label=f"{i['name']} {format_amount(i['amount'], i['dim'])}".strip())
+                for i in items
+            ]
+        self.one_more_column.controls = [
+            ft.Text(
+                f"• {x['name']} — " + (
+                    f"можно будет приготовить ещё {x['unlocks']} рец."
+                    if x["unlocks"] else f"{x['threshold']} рец. станут почти готовыми"
+                ),
+                size=13,
+            )
+            for x in one_more_ingredient(5) if x["unlocks"] or x["threshold"]
+        ] or [ft.Text("Подсказок пока нет.", size=13)]
+        if not initial:
+            self.recipes_row.update()
+            self.items_column.update()
+            self.one_more_column.update()
+
+    def _remove(self, recipe_id: int):
+        # и при ошибке перерисовываем: на экране останется то, что реально в списке
+        submit(remove_recipes, [recipe_id], on_done=lambda _: self._render(), on_error=lambda _: self._render())
+
+    def _clear(self, e):
+        submit(clear, on_done=lambda _: self._render(), on_error=lambda _: self._render())
@@ -7,6 +7,7 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 from ui.layout import page_layout
 from db import init_db, insert_profile, last_profile_or_empty
+from db_executor import submit
 
 class UserView(ft.Container):
     def __init__(self, page: ft.Page):
@@ -141,15 +142,18 @@ class UserView(ft.Container):
                 page.update()
                 return
 
-            try:
-                new_id = insert_profile(profile)
+            def on_saved(new_id):
                 notify(f"Профиль сохранён (id={new_id})")
-            except Exception:
+                save_btn.disabled = False
+                page.update()
+
+            def on_failed(_exc):
                 notify("Данные сохранены")
-            finally:
                 save_btn.disabled = False
                 page.update()
 
+            submit(insert_profile, profile, on_done=on_saved, on_error=on_failed)
+
         save_btn.on_click = on_save
 
         form = ft.Column(
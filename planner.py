@@ -0,0 +1,196 @@
+"""План «доесть до срока»: рецепты на ближайшие дни, которые используют истекающие продукты.
+
+Задача — взвешенное покрытие множества: элементы — ключи продуктов, у которых срок
+истекает в пределах горизонта (вес тем больше, чем ближе срок), множества — рецепты
+с этими ключами (из обратного индекса recipe_keys). Жадный выбор с ленивым пересчётом:
+выгода рецепта только убывает по мере покрытия, поэтому из кучи достаётся верхняя
+оценка и пересчитывается лишь она. Каждый недостающий ингредиент — штраф MISSING_PENALTY.
+Пока есть непокрытые истекающие продукты, берутся и рецепты с выгодой <= 0 (лучшие из них):
+лучше докупить, чем выбросить. Оставшиеся дни добиваются обычным подбором (recommend).
+
+plan_day() — меню на день под норму КБЖУ из профиля (nutrients.daily_targets): рюкзак
+по порциям рецептов, которые можно приготовить из того, что есть.
+"""
+import heapq
+import threading
+from datetime import date, timedelta
+
+from db import last_profile_or_empty
+from nutrients import daily_targets
+from recipes_db import find_recipe_ids, get_nutrition, get_recipes_by_ids, recipes_revision
+from recommend import inventory, match_recipe, products_by_key, suggest_recipes_cached
+
+# штраф за недостающий ингредиент, в долях веса самого срочного продукта
+MISSING_PENALTY = 0.25
+
+# plan_day: сколько лучших рецептов подбора рассматривать, шаг сетки ДП (ккал, г белка),
+# веса отклонений (ккал, б, ж, у) от нормы и вес покрытия продуктами
+DAY_CANDIDATES = 60
+KCAL_STEP, PROTEIN_STEP = 50.0, 5.0
+LOSS_WEIGHTS = (2.0, 1.0, 0.5, 0.5)
+COVERAGE_WEIGHT = 0.2
+
+_nutrition_lock = threading.Lock()
+_nutrition: tuple[str, dict[int, tuple[float, float, float, float]]] | None = None
+
+
+def _urgency(days_left: int, horizon: int) -> float:
+    """Вес истекающего продукта: 1 — истекает сегодня, ближе к 0 — к концу горизонта."""
+    return (horizon + 1 - days_left) / (horizon + 1)
+
+
+def _required_missing(m: dict) -> list[dict]:
+    return [i for i in m["missing"] if not i["optional"]]
+
+
+def plan_meals(days: int = 7, horizon: int | None = None, filters: dict | None = None, fill: bool = True) -> dict:
+    """План на days дней с сегодняшнего.
+
+    horizon — какие продукты считать истекающими (дней до срока, по умолчанию = days);
+    filters — как в recommend.suggest_recipes. Возвращает
+    {"days": [{"date", "recipe", "uses": [продукты], "missing": [ингредиенты], "coverage"}, ...],
+     "unused": [истекающие продукты, которые ни один рецепт плана не использует]}.
+    """
+    horizon = days if horizon is None else horizon
+    by_key = products_by_key()
+    have_map, stock = inventory(by_key)
+
+    # истекающие ключи и их продукты (просроченные не планируем)
+    expiring: dict[int, list[dict]] = {}
+    for k, prods in by_key.items():
+        soon = [p for p in prods if p.get("days_left") is not None and 0 <= p["days_left"] <= horizon]
+        if soon:
+            expiring[k] = soon
+    weight = {k: _urgency(min(p["days_left"] for p in prods), horizon) for k, prods in expiring.items()}
+
+    matches: dict[int, dict] = {}
+    covers: dict[int, frozenset[int]] = {}
+    if expiring:
+        for r in get_recipes_by_ids(find_recipe_ids(list(expiring), filters), with_steps=False):
+            if not r.get("ingredients"):
+                continue
+            m = match_recipe(r, have_map, stock)
+            keys = frozenset(k for i in r["ingredients"] for k in i["ingredient_ids"] if k in expiring)
+            if keys:
+                matches[r["id"]], covers[r["id"]] = m, keys
+
+    def gain(rid: int, covered: set[int]) -> float:
+        return sum(weight[k] for k in covers[rid] - covered) - MISSING_PENALTY * len(_required_missing(matches[rid]))
+
+    covered: set[int] = set()
+    picked: list[int] = []
+    # (-выгода, недостаёт, id): при равной выгоде — где меньше докупать, затем по id
+    heap = [(-gain(rid, covered), len(_required_missing(m)), rid) for rid, m in matches.items()]
+    heapq.heapify(heap)
+    while heap and len(picked) < days:
+        _, n_missing, rid = heapq.heappop(heap)
+        g = gain(rid, covered)
+        if heap and -g > heap[0][0]:
+            # оценка устарела — вернуть с актуальной выгодой и взять следующую
+            heapq.heappush(heap, (-g, n_missing, rid))
+            continue
+        if not covers[rid] - covered:
+            # ничего нового из истекающего не использует и уже не начнёт — выбрасываем
+            continue
+        picked.append(rid)
+        covered |= covers[rid]
+
+    # раньше — рецепты с продуктами, которые истекают раньше
+    picked.sort(key=lambda rid: min(p["days_left"] for k in covers[rid] for p in expiring[k]))
+    chosen = [matches[rid] for rid in picked]
+    if fill and len(chosen) < days:
+        taken = set(picked)
+        for m in suggest_recipes_cached(days + len(taken), filters):
+            if len(chosen) >= days:
+                break
+            if m["recipe"]["id"] not in taken and m["matched"]:
+                taken.add(m["recipe"]["id"])
+                chosen.append(m)
+
+    today = date.today()
+    used: set[int] = set()  # id продуктов (один продукт может закрывать несколько ключей)
+    plan = []
+    for offset, m in enumerate(chosen):
+        uses = {}
+        for k in sorted(covers.get(m["recipe"]["id"], ()), key=lambda k: -weight[k]):
+            uses.update((p["id"], p) for p in expiring[k] if p["id"] not in used)
+        used.update(uses)
+        plan.append({
+            "date": today + timedelta(days=offset),
+            "recipe": m["recipe"],
+            "uses": list(uses.values()),
+            "missing": m["missing"],
+            "coverage": m["coverage"],
+        })
+    unused = {p["id"]: p for prods in expiring.values() for p in prods if p["id"] not in used}
+    return {"days": plan, "unused": sorted(unused.values(), key=lambda p: p["days_left"])}
+
+
+def serving_vectors() -> dict[int, tuple[float, float, float, float]]:
+    """{recipe_id: (ккал, б, ж, у) на порцию}; кэш до смены набора рецептов (recipes_revision)."""
+    global _nutrition
+    revision = recipes_revision()
+    with _nutrition_lock:
+        if _nutrition is None or _nutrition[0] != revision:
+            _nutrition = (revision, {
+                rid: tuple(x / servings for x in (kcal, protein, fat, carbs))
+                for rid, (kcal, protein, fat, carbs, servings) in get_nutrition().items()
+            })
+        return _nutrition[1]
+
+
+def _loss(totals, targets: tuple[float, ...]) -> float:
+    return sum(w * ((x - t) / t) ** 2 for w, x, t in zip(LOSS_WEIGHTS, totals, targets) if t > 0)
+
+
+def plan_day(meals: int = 3, min_coverage: float = 0.7, filters: dict | None = None, profile: dict | None = None) -> dict:
+    """Меню на день: до meals порций разных рецептов, ближе всего к дневной норме КБЖУ.
+
+    Кандидаты — лучшие DAY_CANDIDATES рецептов подбора с покрытием не ниже min_coverage.
+    Рюкзак (ДП) по состояниям (число блюд, ккал и белок на сетке KCAL_STEP/PROTEIN_STEP);
+    в состоянии остаётся набор с наибольшим суммарным покрытием, из конечных выбирается
+    минимум отклонения от нормы. Возвращает {"targets", "meals": [{"recipe", "coverage",
+    "missing", "nutrition"}], "totals"}; nutrition/totals — (ккал, б, ж, у).
+    """
+    targets = daily_targets(profile if profile is not None else last_profile_or_empty())
+    goal = (targets["kcal"], targets["protein"], targets["fat"], targets["carbs"])
+    vectors = serving_vectors()
+    items = [
+        m for m in suggest_recipes_cached(DAY_CANDIDATES, filters)
+        if m["coverage"] >= min_coverage and vectors.get(m["recipe"]["id"], (0,))[0] > 0
+    ]
+
+    # (блюд, ккал/шаг, белок/шаг) -> (покрытие, индексы items, суммы КБЖУ)
+    limit = goal[0] * 1.3
+    states: dict[tuple[int, int, int], tuple[float, tuple[int, ...], tuple[float, ...]]] = {
+        (0, 0, 0): (0.0, (), (0.0, 0.0, 0.0, 0.0)),
+    }
+    for idx, m in enumerate(items):
+        vec = vectors[m["recipe"]["id"]]
+        for (n, _, _), (value, picks, totals) in list(states.items()):
+            if n >= meals:
+                continue
+            new_totals = tuple(a + b for a, b in zip(totals, vec))
+            if new_totals[0] > limit:
+                continue
+            key = (n + 1, round(new_totals[0] / KCAL_STEP), round(new_totals[1] / PROTEIN_STEP))
+            new_value = value + m["coverage"]
+            if key not in states or states[key][0] < new_value:
+                states[key] = (new_value, picks + (idx,), new_totals)
+
+    best = min(
+        (s for (n, _, _), s in states.items() if n > 0),
+        key=lambda s: _loss(s[2], goal) - COVERAGE_WEIGHT * s[0] / meals,
+        default=(0.0, (), (0.0, 0.0, 0.0, 0.0)),
+    )
+    return {
+        "targets": targets,
+        "meals": [
+            {
+                "recipe": items[i]["recipe"], "coverage": items[i]["coverage"],
+                "missing": items[i]["missing"], "nutrition": vectors[items[i]["recipe"]["id"]],
+            }
+            for i in best[1]
+        ],
+        "totals": best[2],
+    }
@@ -1,44 +1,136 @@
-import sqlite3
 from contextlib import closing
+from datetime import date, datetime, timedelta
+from db_pool import get_conn
+import migrations
 
 DB_PATH = "products.db"
+migrations.register(DB_PATH, migrations.PRODUCTS_DB)
+
+_subscribers: list = []
 
 def _conn():
-    return sqlite3.connect(DB_PATH)
+    return get_conn(DB_PATH)
+
+def to_iso(exp_date: str | None) -> str | None:
+    """'ДД.ММ.ГГГГ' -> 'ГГГГ-ММ-ДД' (сортируется как строка), иначе None."""
+    try:
+        return datetime.strptime((exp_date or "").strip(), "%d.%m.%Y").date().isoformat()
+    except ValueError:
+        return None
 
 def init_products_db():
-    with _conn() as conn, closing(conn.cursor()) as cur:
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS products (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                category TEXT,
-                exp_date TEXT  -- строкой: 'ДД.ММ.ГГГГ'
-            );
-        """)
-        conn.commit()
+    """Схема создаётся миграциями (migrations.PRODUCTS_DB) при открытии соединения."""
+    _conn()
+
+def subscribe(fn):
+    """fn(event, product) вызывается после insert_product ("insert") и delete_product ("delete").
+
+    product — {id, name, category, exp_date, qty, unit, exp_iso}. Возвращает функцию отписки.
+    """
+    _subscribers.append(fn)
+
+    def unsubscribe():
+        if fn in _subscribers:
+            _subscribers.remove(fn)
+    return unsubscribe
+
+def _notify(event: str, product: dict):
+    for fn in list(_subscribers):
+        fn(event, product)
 
 def insert_product(data: dict) -> int:
+    """data: name, category, exp_date и необязательные qty/unit (сколько есть, в единицах units)."""
+    exp_iso = to_iso(data.get("exp_date"))
     with _conn() as conn, closing(conn.cursor()) as cur:
         cur.execute("""
-            INSERT INTO products (name, category, exp_date)
-            VALUES (?, ?, ?)
-        """, (data.get("name"), data.get("category"), data.get("exp_date")))
+            INSERT INTO products (name, category, exp_date, exp_iso, qty, unit)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (data.get("name"), data.get("category"), data.get("exp_date"), exp_iso, data.get("qty"), data.get("unit")))
         conn.commit()
-        return cur.lastrowid
+        product_id = cur.lastrowid
+    _notify("insert", {
+        "id": product_id, "name": data.get("name"), "category": data.get("category"),
+        "exp_date": data.get("exp_date"), "qty": data.get("qty"), "unit": data.get("unit"), "exp_iso": exp_iso,
+    })
+    return product_id
+
+_COLS = "id, name, category, exp_date, qty, unit"
+
+def _row(r) -> dict:
+    return {"id": r[0], "name": r[1], "category": r[2], "exp_date": r[3], "qty": r[4], "unit": r[5]}
 
 def list_products(limit: int = 100):
     with _conn() as conn, closing(conn.cursor()) as cur:
-        rows = cur.execute("""
-            SELECT id, name, category, exp_date
+        rows = cur.execute(f"""
+            SELECT {_COLS}
             FROM products
             ORDER BY id DESC
             LIMIT ?
         """, (limit,)).fetchall()
-    return [{"id": r[0], "name": r[1], "category": r[2], "exp_date": r[3]} for r in rows]
+    return [_row(r) for r in rows]
+
+def list_products_by_expiry(limit: int = 100, today: date | None = None):
+    """Продукты по возрастанию срока годности (без даты — в начале).
+
+    К каждому добавляются exp_iso и days_left (None, если даты нет).
+    """
+    today = today or date.today()
+    with _conn() as conn, closing(conn.cursor()) as cur:
+        rows = cur.execute(f"""
+            SELECT {_COLS}, exp_iso,
+                   CAST(julianday(exp_iso) - julianday(?) AS INTEGER)
+            FROM products
+            ORDER BY exp_iso
+            LIMIT ?
+        """, (today.isoformat(), limit)).fetchall()
+    return [{**_row(r), "exp_iso": r[6], "days_left": r[7]} for r in rows]
+
+def list_expiring(days: int, limit: int = 100, today: date | None = None):
+    """Продукты, срок которых истекает в ближайшие days дней (включая сегодня)."""
+    today = today or date.today()
+    with _conn() as conn, closing(conn.cursor()) as cur:
+        rows = cur.execute(f"""
+            SELECT {_COLS}
+            FROM products
+            WHERE exp_iso BETWEEN ? AND ?
+            ORDER BY exp_iso
+            LIMIT ?
+        """, (today.isoformat(), (today + timedelta(days=days)).isoformat(), limit)).fetchall()
+    return [_row(r) for r in rows]
+
+def list_expired(limit: int = 100, today: date | None = None):
+    today = today or date.today()
+    with _conn() as conn, closing(conn.cursor()) as cur:
+        rows = cur.execute(f"""
+            SELECT {_COLS}
+            FROM products
+            WHERE exp_iso < ?
+            ORDER BY exp_iso
+            LIMIT ?
+        """, (today.isoformat(), limit)).fetchall()
+    return [_row(r) for r in rows]
+
+def expiry_stats(soon_days: int, today: date | None = None) -> dict:
+    """Одним запросом: всего продуктов, просрочено, истекает в ближайшие soon_days дней."""
+    today = today or date.today()
+    with _conn() as conn, closing(conn.cursor()) as cur:
+        total, expired, soon = cur.execute("""
+            SELECT COUNT(*),
+                   COALESCE(SUM(exp_iso < ?1), 0),
+                   COALESCE(SUM(exp_iso BETWEEN ?1 AND ?2), 0)
+            FROM products
+        """, (today.isoformat(), (today + timedelta(days=soon_days)).isoformat())).fetchone()
+    return {"total": total, "expired": expired, "soon": soon}
 
 def delete_product(product_id: int) -> None:
     """Удаляет продукт по id."""
     with _conn() as conn, closing(conn.cursor()) as cur:
+        row = None
+        if _subscribers:
+            row = cur.execute(
+                f"SELECT {_COLS}, exp_iso FROM products WHERE id = ?", (product_id,)
+            ).fetchone()
         cur.execute("DELETE FROM products WHERE id = ?", (product_id,))
         conn.commit()
+    if row:
+        _notify("delete", {**_row(row), "exp_iso": row[6]})
@@ -0,0 +1,265 @@
+"""Каталог рецептов как разреженная матрица «ингредиент рецепта × ключ» для подбора на NumPy.
+
+Покрытие, число совпадений и бонус за срок считаются для всех рецептов сразу несколькими
+векторными операциями над вектором «что есть» и вектором бонусов (можно и пачкой инвентарей).
+Матрица сохраняется в MATRIX_PATH (.npz рядом с app.db) и пересобирается, когда меняется
+recipes_db.recipes_revision(). NumPy необязателен: без него available() == False
+и recommend работает на обычном Python. Импортируется он при первом available()/get_matrix(),
+а не при загрузке модуля — чтобы не замедлять запуск приложения.
+"""
+import os
+import threading
+
+from recipes_db import DB_PATH, get_ingredient_keys, recipes_revision
+
+np = None  # numpy, после _import_numpy()
+_numpy_missing = False
+
+MATRIX_PATH = os.path.join(os.path.dirname(os.path.abspath(DB_PATH)), "recipes_matrix.npz")
+
+_lock = threading.Lock()
+_matrix: "RecipeMatrix | None" = None
+
+
+def _import_numpy() -> bool:
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:  # необязательная зависимость
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np is not None
+
+
+def available() -> bool:
+    return _import_numpy()
+
+
+class RecipeMatrix:
+    """CSR в виде плоских массивов.
+
+    recipe_ids[r] — id рецепта r, его слоты (строки-ингредиенты) — recipe_ptr[r]:recipe_ptr[r+1];
+    ключи слота s (основной + альтернативы) — cols[slot_ptr[s]:slot_ptr[s+1]], это номера
+    столбцов в keys (отсортированные id ключей); optional[s] — слот «по желанию»;
+    need[s] — сколько нужно в мере dims[need_dim[s]] (NaN и -1 — не указано).
+    """
+
+    FIELDS = ("recipe_ids", "recipe_ptr", "slot_ptr", "cols", "keys", "optional", "need", "need_dim", "dims")
+
+    def __init__(self, revision: str, **arrays):
+        self.revision = revision
+        for name in self.FIELDS:
+            setattr(self, name, arrays[name])
+
+    @classmethod
+    def build(cls, revision: str, rows: list[tuple]) -> "RecipeMatrix":
+        """rows — get_ingredient_keys(): (recipe_id, ingredient_ids, optional, need), сгруппированы по рецепту."""
+        recipe_ids, recipe_ptr, slot_ptr, flat, optional = [], [0], [0], [], []
+        need, need_dim, dims = [], [], {}
+        prev = None
+        for (rid, ids, opt, amount) in rows:
+            if rid != prev:
+                if prev is not None:
+                    recipe_ptr.append(len(optional))
+                recipe_ids.append(rid)
+                prev = rid
+            flat.extend(ids)
+            slot_ptr.append(len(flat))
+            optional.append(opt)
+            if amount is None:
+                need.append(np.nan)
+                need_dim.append(-1)
+            else:
+                need.append(amount[0])
+                need_dim.append(dims.setdefault(amount[1], len(dims)))
+        if prev is not None:
+            recipe_ptr.append(len(optional))
+
+        flat_arr = np.array(flat, dtype=np.int64)
+        keys = np.unique(flat_arr)
+        return cls(
+            revision,
+            recipe_ids=np.array(recipe_ids, dtype=np.int64),
+            recipe_ptr=np.array(recipe_ptr, dtype=np.int64),
+            slot_ptr=np.array(slot_ptr, dtype=np.int64),
+            cols=np.searchsorted(keys, flat_arr),
+            keys=keys,
+            optional=np.array(optional, dtype=bool),
+            need=np.array(need, dtype=np.float64),
+            need_dim=np.array(need_dim, dtype=np.int64),
+            dims=np.array(list(dims), dtype=str),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "RecipeMatrix":
+        with np.load(path, allow_pickle=False) as z:
+            return cls(str(z["revision"]), **{name: z[name] for name in cls.FIELDS})
+
+    def save(self, path: str) -> None:
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, revision=np.array(self.revision), **{name: getattr(self, name) for name in self.FIELDS})
+        os.replace(tmp, path)
+
+    def export(self, directory: str) -> None:
+        """Массивы отдельными .npy в directory — их можно открыть через mmap (open_mapped)."""
+        os.makedirs(directory, exist_ok=True)
+        for name in self.FIELDS:
+            np.save(os.path.join(directory, name + ".npy"), getattr(self, name))
+        # файл ревизии пишется последним: есть он — выгрузка полная
+        with open(os.path.join(directory, "revision"), "w", encoding="utf-8") as f:
+            f.write(self.revision)
+
+    @classmethod
+    def open_mapped(cls, directory: str) -> "RecipeMatrix | None":
+        """Матрица из export() только для чтения; страницы файлов общие для всех процессов. None — выгрузки нет."""
+        try:
+            with open(os.path.join(directory, "revision"), encoding="utf-8") as f:
+                revision = f.read()
+            arrays = {name: np.load(os.path.join(directory, name + ".npy"), mmap_mode="r") for name in cls.FIELDS}
+        except (OSError, ValueError):
+            return None
+        return cls(revision, **arrays)
+
+    def shard_bounds(self, n: int) -> list[tuple[int, int]]:
+        """Делит рецепты на n непрерывных диапазонов [lo, hi) примерно с равным числом слотов."""
+        n_recipes = len(self.recipe_ids)
+        n = max(1, min(n, n_recipes))
+        cuts = np.searchsorted(self.recipe_ptr, np.linspace(0, self.recipe_ptr[-1], n + 1)[1:-1])
+        edges = [0, *sorted(set(int(c) for c in cuts) - {0, n_recipes}), n_recipes]
+        return list(zip(edges[:-1], edges[1:]))
+
+    def shard(self, lo: int, hi: int) -> "RecipeMatrix":
+        """Рецепты lo:hi как отдельная матрица: большие массивы — срезы (без копирования), указатели пересчитаны."""
+        s0, s1 = int(self.recipe_ptr[lo]), int(self.recipe_ptr[hi])
+        e0, e1 = int(self.slot_ptr[s0]), int(self.slot_ptr[s1])
+        return RecipeMatrix(
+            self.revision,
+            recipe_ids=self.recipe_ids[lo:hi],
+            recipe_ptr=np.asarray(self.recipe_ptr[lo:hi + 1]) - s0,
+            slot_ptr=np.asarray(self.slot_ptr[s0:s1 + 1]) - e0,
+            cols=self.cols[e0:e1],
+            keys=self.keys,
+            optional=self.optional[s0:s1],
+            need=self.need[s0:s1],
+            need_dim=self.need_dim[s0:s1],
+            dims=self.dims,
+        )
+
+    def vectors(self, bonus_by_key: dict[int, int], stock_by_key: dict[int, dict | None] | None = None):
+        """Инвентарь -> (have[n_keys] bool, bonus[n_keys] float, avail[n_keys, n_dims] float).
+
+        bonus_by_key — {id ключа: бонус за срок}; stock_by_key — {id ключа: {мера: сколько}
+        или None, если количество не указано}. В avail inf — «сколько угодно», NaN — нет данных.
+        """
+        n_keys = len(self.keys)
+        have = np.zeros(n_keys, dtype=bool)
+        bonus = np.zeros(n_keys, dtype=np.float64)
+        avail = np.full((n_keys, len(self.dims)), np.inf)
+        if bonus_by_key:
+            ids = np.fromiter(bonus_by_key.keys(), dtype=np.int64, count=len(bonus_by_key))
+            vals = np.fromiter(bonus_by_key.values(), dtype=np.float64, count=len(bonus_by_key))
+            pos = np.minimum(np.searchsorted(self.keys, ids), max(n_keys - 1, 0))
+            found = (self.keys[pos] == ids) if n_keys else np.zeros(len(ids), dtype=bool)
+            have[pos[found]] = True
+            bonus[pos[found]] = vals[found]
+        dim_index = {d: i for i, d in enumerate(self.dims.tolist())}
+        for key, stock in (stock_by_key or {}).items():
+            c = int(np.searchsorted(self.keys, key))
+            if stock is None or c >= n_keys or self.keys[c] != key:
+                continue
+            avail[c] = np.nan
+            for dim, amount in stock.items():
+                if dim in dim_index:
+                    avail[c, dim_index[dim]] = amount
+        return have, bonus, avail
+
+    def score(self, have, bonus, avail=None) -> dict:
+        """Оценка всех рецептов: have/bonus — [n_keys] или пачка [k, n_keys], avail — [..., n_keys, n_dims].
+
+        Как и в recommend: слот засчитан, если есть любой его ключ, бонус и запас берутся
+        по первому найденному; слот закрыт на долю units.enough (сколько есть / сколько нужно);
+        слоты «по желанию» не входят в покрытие. Возвращает массивы hits (слотов с продуктом),
+        coverage и score формы [..., n_recipes].
+        """
+        n_entries = len(self.cols)
+        shape = have.shape[:-1]
+        if not len(self.recipe_ids):
+            empty = np.zeros(shape + (0,))
+            return {"hits": empty.astype(np.int64), "coverage": empty, "score": empty.astype(np.int64)}
+
+        hit_e = have[..., self.cols]
+        first = np.minimum.reduceat(np.where(hit_e, np.arange(n_entries), n_entries), self.slot_ptr[:-1], axis=-1)
+        slot_hit = first < n_entries
+        bonus_e = np.concatenate([bonus[..., self.cols], np.zeros(shape + (1,))], axis=-1)
+        slot_bonus = np.take_along_axis(bonus_e, first, axis=-1)
+
+        part = slot_hit.astype(np.float64)
+        if avail is not None and len(self.dims):
+            # запас ключа, которым закрыт слот, в мере слота
+            cols_e = np.append(self.cols, 0)[first]
+            flat = cols_e * len(self.dims) + np.maximum(self.need_dim, 0)
+            got = np.take_along_axis(avail.reshape(shape + (-1,)), flat, axis=-1)
+            need = self.need
+            known = (self.need_dim >= 0) & (need > 0) & np.isfinite(got)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(known, np.minimum(1.0, got / np.where(known, need, 1.0)), 1.0)
+            part = np.where(slot_hit, ratio, 0.0)
+
+        starts = self.recipe_ptr[:-1]
+        required = ~self.optional
+        hits = np.add.reduceat(slot_hit.astype(np.int64), starts, axis=-1)
+        req_got = np.add.reduceat(np.where(required, part, 0.0), starts, axis=-1)
+        all_got = np.add.reduceat(part, starts, axis=-1)
+        req = np.add.reduceat(required.astype(np.int64), starts)
+        total = np.diff(self.recipe_ptr)
+        coverage = np.where(req > 0, req_got / np.maximum(req, 1), all_got / total)
+        score = np.floor(coverage * 100 + np.add.reduceat(slot_bonus, starts, axis=-1)).astype(np.int64)
+        return {"hits": hits, "coverage": coverage, "score": score}
+
+    def rank(self, bonus_by_key: dict[int, int], stock_by_key: dict[int, dict | None], top_n: int, allowed=None):
+        """Лучшие top_n рецептов для одного инвентаря.
+
+        Возвращает ([(recipe_id, coverage, score), ...] в порядке выдачи, id всех рецептов с совпадениями).
+        Порядок — как у recommend: (coverage >= 0.7, score) по убыванию, при равенстве — по id.
+        allowed — id рецептов, прошедших фильтры (recipes_db.filter_recipe_ids); None — все.
+        """
+        top, candidate_ids = self.rank_vectors(*self.vectors(bonus_by_key, stock_by_key), top_n, allowed)
+        return top, candidate_ids.tolist()
+
+    def rank_vectors(self, have, bonus, avail, top_n: int, allowed=None):
+        """rank() по готовым vectors(); id рецептов с совпадениями — массивом."""
+        res = self.score(have, bonus, avail)
+        hit = res["hits"] > 0
+        if allowed is not None:
+            hit &= np.isin(self.recipe_ids, np.asarray(allowed, dtype=np.int64))
+        cand = np.nonzero(hit)[0]
+        cov, sc = res["coverage"][cand], res["score"][cand]
+        order = np.lexsort((self.recipe_ids[cand], -sc, -(cov >= 0.7).astype(np.int64)))[:top_n]
+        top = [(int(self.recipe_ids[cand[i]]), float(cov[i]), int(sc[i])) for i in order]
+        return top, np.asarray(self.recipe_ids[cand])
+
+
+def get_matrix() -> RecipeMatrix:
+    """Актуальная матрица: из памяти, из MATRIX_PATH или собранная заново."""
+    global _matrix
+    _import_numpy()
+    revision = recipes_revision()
+    with _lock:
+        if _matrix is not None and _matrix.revision == revision:
+            return _matrix
+        m = None
+        if os.path.exists(MATRIX_PATH):
+            try:
+                m = RecipeMatrix.load(MATRIX_PATH)
+            except (OSError, ValueError, KeyError):
+                m = None
+        if m is None or m.revision != revision:
+            m = RecipeMatrix.build(revision, get_ingredient_keys())
+            try:
+                m.save(MATRIX_PATH)
+            except OSError:
+                pass  # не удалось сохранить — соберём заново в следующем процессе
+        _matrix = m
+        return m
@@ -0,0 +1,111 @@
+"""Подбор рецептов в нескольких процессах для очень больших каталогов (100k+ рецептов).
+
+Матрица recipe_matrix выгружается в SHARDS_DIR отдельными .npy; процессы пула один раз
+при старте открывают её через mmap, поэтому страницы каталога общие и ничего не
+сериализуется на каждый вызов: в процессы уходят только векторы инвентаря, обратно —
+лучшие top_n своего шарда, которые сливаются здесь. Режим включается явно
+(recommend.suggest_recipes(backend="parallel")); каталог меньше PARALLEL_MIN_RECIPES
+считается в одном процессе — запуск и обмен с пулом там дороже самого подсчёта.
+"""
+import atexit
+import hashlib
+import heapq
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+import numpy as np
+
+import recipe_matrix
+from recipe_matrix import MATRIX_PATH, RecipeMatrix
+
+SHARDS_DIR = os.path.splitext(MATRIX_PATH)[0] + ".shards"
+# меньше — один процесс; и столько рецептов минимум на шард
+PARALLEL_MIN_RECIPES = 50_000
+MIN_SHARD_RECIPES = 20_000
+
+_lock = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+_pool_revision: str | None = None
+_bounds: list[tuple[int, int]] = []
+
+# --- в процессе пула ---------------------------------------------------------
+_worker_matrix: RecipeMatrix | None = None
+_worker_shards: dict[tuple[int, int], RecipeMatrix] = {}
+
+
+def _init_worker(directory: str) -> None:
+    global _worker_matrix
+    recipe_matrix.available()  # numpy в recipe_matrix импортируется лениво
+    _worker_matrix = RecipeMatrix.open_mapped(directory)
+
+
+def _rank_shard(lo: int, hi: int, have, bonus, avail, top_n: int, allowed):
+    shard = _worker_shards.get((lo, hi))
+    if shard is None:
+        shard = _worker_shards[(lo, hi)] = _worker_matrix.shard(lo, hi)
+    return shard.rank_vectors(have, bonus, avail, top_n, allowed)
+
+
+# --- в основном процессе -----------------------------------------------------
+
+def workers_for(n_recipes: int) -> int:
+    """Сколько процессов имеет смысл занять под каталог из n_recipes; 1 — считать без пула."""
+    if n_recipes < PARALLEL_MIN_RECIPES:
+        return 1
+    return max(1, min(os.cpu_count() or 1, n_recipes // MIN_SHARD_RECIPES))
+
+
+def _export_dir(revision: str) -> str:
+    return os.path.join(SHARDS_DIR, hashlib.sha1(revision.encode("utf-8")).hexdigest()[:16])
+
+
+def _ensure_pool(m: RecipeMatrix, workers: int):
+    """Пул под текущую ревизию матрицы: при смене каталога — новая выгрузка и новые процессы."""
+    global _pool, _pool_revision, _bounds
+    if _pool is not None and _pool_revision == m.revision and len(_bounds) == workers:
+        return _pool, _bounds
+    shutdown()
+    directory = _export_dir(m.revision)
+    mapped = RecipeMatrix.open_mapped(directory)
+    if mapped is None or mapped.revision != m.revision:
+        m.export(directory)
+    # старые выгрузки больше не нужны (открытые файлы на Windows не удалятся — не страшно)
+    for name in os.listdir(SHARDS_DIR):
+        if os.path.join(SHARDS_DIR, name) != directory:
+            shutil.rmtree(os.path.join(SHARDS_DIR, name), ignore_errors=True)
+    _pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(directory,))
+    _pool_revision = m.revision
+    _bounds = m.shard_bounds(workers)
+    return _pool, _bounds
+
+
+def rank(bonus_by_key: dict[int, int], stock_by_key: dict[int, dict | None], top_n: int, allowed=None):
+    """То же, что RecipeMatrix.rank, но по шардам в пуле процессов (если каталог достаточно большой)."""
+    m = recipe_matrix.get_matrix()
+    workers = workers_for(len(m.recipe_ids))
+    if workers < 2:
+        return m.rank(bonus_by_key, stock_by_key, top_n, allowed)
+    have, bonus, avail = m.vectors(bonus_by_key, stock_by_key)
+    if allowed is not None:
+        allowed = np.asarray(allowed, dtype=np.int64)
+    with _lock:
+        pool, bounds = _ensure_pool(m, workers)
+        futures = [pool.submit(_rank_shard, lo, hi, have, bonus, avail, top_n, allowed) for (lo, hi) in bounds]
+    parts = [f.result() for f in futures]
+    # тот же порядок, что в rank: (coverage >= 0.7, score) по убыванию, затем id
+    top = heapq.nsmallest(top_n, chain.from_iterable(t for (t, _) in parts), key=lambda x: (x[1] < 0.7, -x[2], x[0]))
+    candidate_ids = [int(rid) for (_, ids) in parts for rid in ids]
+    return top, candidate_ids
+
+
+def shutdown() -> None:
+    global _pool, _pool_revision
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool, _pool_revision = None, None
+
+
+atexit.register(shutdown)
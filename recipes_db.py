@@ -1,36 +1,217 @@
+import gzip
+import hashlib
+import json
+import os
 import sqlite3
+import sys
+import threading
 from contextlib import closing
+from pathlib import Path
+from db_pool import get_conn, on_connect
+import migrations
+from ingredients import key_id
+from matcher import KEYS_VERSION, parse
+from units import UNITS_VERSION, normalize
+from tags import TAGS_VERSION, diet_mask, key_tags
+from nutrients import NUTRITION_VERSION, recipe_nutrients
+import minhash
+from settings_db import init_settings_db, get_setting, set_setting
 
 DB_PATH = "app.db"
 
+_DATA_DIR = os.path.join(getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__))), "data")
 
-def _conn():
-    return sqlite3.connect(DB_PATH)
+# Готовый каталог встроенных рецептов (собирается build_catalog.py), подключается только на чтение.
+# id рецептов каталога начинаются с CATALOG_ID_BASE, чтобы не пересекаться с пользовательскими.
+CATALOG_PATH = os.path.join(_DATA_DIR, "recipes_catalog.db")
+CATALOG_ID_BASE = 1 << 40
+CATALOG_VERSION_KEY = "recipes_catalog_version"
+KEYS_VERSION_KEY = "recipe_keys_version"
+# версия производных данных ингредиентов: ключи (matcher) + количества (units) + теги (tags)
+# + пищевая ценность (nutrients) + подписи похожести (minhash)
+INDEX_VERSION = f"{KEYS_VERSION}.{UNITS_VERSION}.{TAGS_VERSION}.{NUTRITION_VERSION}.{minhash.MINHASH_VERSION}"
 
+_ALL = ("all_recipes", "all_recipe_ingredients")
+_OVERLAY = ("main.recipes", "main.recipe_ingredients")
+_CATALOG = ("catalog.recipes", "catalog.recipe_ingredients")
 
-def init_recipes_db():
-    """Создаёт таблицы под рецепты/ингредиенты."""
-    with _conn() as conn, closing(conn.cursor()) as c:
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS recipes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL UNIQUE,
-                steps TEXT,
-                time_min INTEGER,
-                difficulty TEXT
-            )
+
+def _conn():
+    return get_conn(DB_PATH)
+
+
+def _attach_catalog(conn):
+    """Подключает готовый каталог только на чтение и создаёт TEMP-представления поверх него.
+
+    all_recipes / all_recipe_ingredients = пользовательские рецепты (main) + каталог;
+    рецепт пользователя с тем же title перекрывает рецепт каталога.
+    all_ingredients — общий словарь ключей (id совпадают, см. ingredients.key_id).
+    Здесь же создаются временные таблицы инвентаря для score_recipes_sql (temp.inv, temp.inv_stock).
+    """
+    attached = False
+    if os.path.exists(CATALOG_PATH):
+        try:
+            conn.execute("ATTACH DATABASE ? AS catalog", (Path(CATALOG_PATH).as_uri() + "?mode=ro",))
+            attached = True
+        except sqlite3.Error:
+            attached = False
+    if attached and (
+        migrations.schema_version(conn, "catalog") != len(migrations.CATALOG_DB)
+        or _catalog_info(conn, "keys_version") != INDEX_VERSION
+    ):
+        # каталог собран под другую схему или другую нормализацию ключей — не используем его
+        conn.execute("DETACH DATABASE catalog")
+        attached = False
+
+    if attached:
+        conn.executescript("""
+            CREATE TEMP VIEW all_recipes AS
+                SELECT id, title, steps, time_min, difficulty, tags, kcal, protein, fat, carbs, servings, minhash
+                FROM main.recipes
+                UNION ALL
+                SELECT id, title, steps, time_min, difficulty, tags, kcal, protein, fat, carbs, servings, minhash
+                FROM catalog.recipes
+                WHERE title NOT IN (SELECT title FROM main.recipes);
+            CREATE TEMP VIEW all_recipe_ingredients AS
+                SELECT id, recipe_id, name, qty, unit, ingredient_id, alt_ids, optional, amount, dim FROM main.recipe_ingredients
+                UNION ALL
+                SELECT id, recipe_id, name, qty, unit, ingredient_id, alt_ids, optional, amount, dim FROM catalog.recipe_ingredients
+                WHERE recipe_id NOT IN (
+                    SELECT c.id FROM catalog.recipes c JOIN main.recipes m ON m.title = c.title
+                );
+            CREATE TEMP VIEW all_recipe_keys AS
+                SELECT ingredient_id, recipe_id, n FROM main.recipe_keys
+                UNION ALL
+                SELECT ingredient_id, recipe_id, n FROM catalog.recipe_keys
+                WHERE recipe_id NOT IN (
+                    SELECT c.id FROM catalog.recipes c JOIN main.recipes m ON m.title = c.title
+                );
+            CREATE TEMP VIEW all_ingredients AS
+                SELECT id, key FROM main.ingredients
+                UNION
+                SELECT id, key FROM catalog.ingredients;
+            -- без отсечения затенённых рецептов: так поиск по (band, bucket) идёт по индексам обеих баз,
+            -- а затенённые отпадают при соединении с all_recipes (similar_recipes)
+            CREATE TEMP VIEW all_recipe_bands AS
+                SELECT band, bucket, recipe_id FROM main.recipe_bands
+                UNION ALL
+                SELECT band, bucket, recipe_id FROM catalog.recipe_bands;
         """)
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS recipe_ingredients (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                recipe_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                qty REAL,
-                unit TEXT,
-                FOREIGN KEY (recipe_id) REFERENCES recipes(id) ON DELETE CASCADE
-            )
+    else:
+        conn.executescript("""
+            CREATE TEMP VIEW all_recipes AS
+                SELECT id, title, steps, time_min, difficulty, tags, kcal, protein, fat, carbs, servings, minhash
+                FROM main.recipes;
+            CREATE TEMP VIEW all_recipe_ingredients AS
+                SELECT id, recipe_id, name, qty, unit, ingredient_id, alt_ids, optional, amount, dim FROM main.recipe_ingredients;
+            CREATE TEMP VIEW all_recipe_keys AS
+                SELECT ingredient_id, recipe_id, n FROM main.recipe_keys;
+            CREATE TEMP VIEW all_ingredients AS
+                SELECT id, key FROM main.ingredients;
+            CREATE TEMP VIEW all_recipe_bands AS
+                SELECT band, bucket, recipe_id FROM main.recipe_bands;
         """)
-        conn.commit()
+    # один раз на соединение: в score_recipes_sql — только DELETE/INSERT, без DDL на каждый подбор
+    conn.executescript("""
+        CREATE TEMP TABLE IF NOT EXISTS inv (
+            ingredient_id INTEGER PRIMARY KEY,
+            bonus INTEGER NOT NULL,
+            unlimited INTEGER NOT NULL
+        );
+        CREATE TEMP TABLE IF NOT EXISTS inv_stock (
+            ingredient_id INTEGER NOT NULL,
+            dim TEXT NOT NULL,
+            amount REAL NOT NULL,
+            PRIMARY KEY (ingredient_id, dim)
+        ) WITHOUT ROWID;
+    """)
+
+
+def _catalog_info(c, key: str) -> str | None:
+    try:
+        row = c.execute("SELECT value FROM catalog.catalog_info WHERE key=?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+migrations.register(DB_PATH, migrations.APP_DB)
+on_connect(DB_PATH, _attach_catalog)
+
+
+def init_recipes_db():
+    """Схема создаётся миграциями (migrations.APP_DB) при открытии соединения."""
+    _conn()
+
+
+def _index_recipes(c, recipe_ids: list[int]) -> None:
+    """Пересчитывает производные данные рецептов оверлея.
+
+    Ключи ингредиентов (словарь ingredients, ingredient_id/alt_ids/optional в
+    recipe_ingredients), количество в общей мере (amount/dim), обратный индекс recipe_keys,
+    маску тегов recipes.tags, пищевую ценность (kcal/protein/fat/carbs/servings)
+    и подпись похожести recipes.minhash с корзинами recipe_bands.
+    """
+    if not recipe_ids:
+        return
+    ids_json = json.dumps(list(recipe_ids))
+    c.execute("DELETE FROM recipe_keys WHERE recipe_id IN (SELECT value FROM json_each(?))", (ids_json,))
+    c.execute("DELETE FROM recipe_bands WHERE recipe_id IN (SELECT value FROM json_each(?))", (ids_json,))
+    words: dict[int, str] = {}
+    rows, counts = [], {}
+    tags = dict.fromkeys(recipe_ids, 0)
+    amounts: dict[int, list] = {rid: [] for rid in recipe_ids}
+    for (ri_id, rid, name, qty, unit) in c.execute(
+        "SELECT id, recipe_id, name, qty, unit FROM recipe_ingredients "
+        "WHERE recipe_id IN (SELECT value FROM json_each(?))",
+        (ids_json,),
+    ).fetchall():
+        keys, optional = parse(name)
+        ids = [key_id(k) for k in keys]
+        words.update(zip(ids, keys))
+        amount, dim = normalize(ids[0], qty, unit) or (None, None)
+        rows.append((ids[0], json.dumps(ids[1:]) if len(ids) > 1 else None, int(optional), amount, dim, ri_id))
+        for i in ids:
+            counts[(i, rid)] = counts.get((i, rid), 0) + 1
+        for k in keys:
+            tags[rid] |= key_tags(k)
+        amounts[rid].append((ids[0], qty, unit))
+    c.executemany("INSERT OR IGNORE INTO ingredients(id, key) VALUES(?,?)", list(words.items()))
+    c.executemany("UPDATE recipe_ingredients SET ingredient_id=?, alt_ids=?, optional=?, amount=?, dim=? WHERE id=?", rows)
+    c.executemany(
+        "INSERT INTO recipe_keys(ingredient_id, recipe_id, n) VALUES(?,?,?)",
+        [(iid, rid, n) for ((iid, rid), n) in counts.items()],
+    )
+    c.executemany(
+        "UPDATE recipes SET tags=?, kcal=?, protein=?, fat=?, carbs=?, servings=? WHERE id=?",
+        [(tags[rid], *vec, servings, rid) for rid, (vec, servings) in
+         ((rid, recipe_nutrients(a)) for rid, a in amounts.items())],
+    )
+    keys_by_recipe: dict[int, set[int]] = {rid: set() for rid in recipe_ids}
+    for (iid, rid) in counts:
+        keys_by_recipe[rid].add(iid)
+    sigs = {rid: minhash.signature(keys) for rid, keys in keys_by_recipe.items()}
+    c.executemany(
+        "UPDATE recipes SET minhash=? WHERE id=?",
+        [(minhash.pack(sig) if sig else None, rid) for rid, sig in sigs.items()],
+    )
+    c.executemany(
+        "INSERT INTO recipe_bands(band, bucket, recipe_id) VALUES(?,?,?)",
+        [(band, bucket, rid) for rid, sig in sigs.items() if sig for (band, bucket) in minhash.bands(sig)],
+    )
+
+
+def _reindex_overlay(c) -> int:
+    """Пересчитывает ключи всех рецептов оверлея (после смены INDEX_VERSION) и чистит словарь."""
+    ids = [r[0] for r in c.execute("SELECT id FROM main.recipes")]
+    _index_recipes(c, ids)
+    c.execute("""
+        DELETE FROM main.ingredients
+        WHERE id NOT IN (SELECT ingredient_id FROM main.recipe_ingredients WHERE ingredient_id IS NOT NULL)
+          AND id NOT IN (SELECT j.value FROM main.recipe_ingredients r, json_each(r.alt_ids) j
+                         WHERE r.alt_ids IS NOT NULL)
+    """)
+    return len(ids)
 
 
 def add_recipe(title: str, steps: str, ingredients: list, time_min: int | None = None, difficulty: str | None = None) -> int:
@@ -45,58 +226,336 @@ def add_recipe(title: str, steps: str, ingredients: list, time_min: int | None =
                 "INSERT INTO recipe_ingredients(recipe_id, name, qty, unit) VALUES(?,?,?,?)",
                 [(rid, i.get("name"), i.get("qty"), i.get("unit")) for i in ingredients]
             )
+        _index_recipes(c, [rid])
         conn.commit()
         return int(rid)
 
 
-def get_all_recipes() -> list[dict]:
+def _load_recipes(c, recipe_ids: list[int] | None = None, with_steps: bool = True, tables: tuple = _ALL) -> list[dict]:
+    """Рецепты и их ингредиенты двумя запросами (без запроса на каждый рецепт).
+
+    recipe_ids=None — весь каталог; with_steps=False не читает текст шагов;
+    tables — (рецепты, ингредиенты), по умолчанию объединение оверлея и каталога.
+    У ингредиента, кроме name/qty/unit: ingredient_ids — id ключей (основной + альтернативы),
+    optional и need — (количество, мера) из units.normalize или None.
+    """
+    recipes_t, ingredients_t = tables
+    steps_col = "t.steps" if with_steps else "NULL"
+    if recipe_ids is None:
+        src, params = "{} t", ()
+    else:
+        # JOIN, а не IN (...): так условие проталкивается внутрь UNION ALL представлений
+        src, params = "json_each(?) j JOIN {} t ON t.{} = j.value", (json.dumps(list(recipe_ids)),)
+
+    rows = c.execute(
+        f"SELECT t.id, t.title, {steps_col}, t.time_min, t.difficulty "
+        f"FROM {src.format(recipes_t, 'id')} ORDER BY t.id",
+        params,
+    ).fetchall()
+    if not rows:
+        return []
+
+    ings_by_recipe: dict[int, list[dict]] = {}
+    for (rid, n, q, u, iid, alt, opt, amount, dim) in c.execute(
+        f"SELECT t.recipe_id, t.name, t.qty, t.unit, t.ingredient_id, t.alt_ids, t.optional, t.amount, t.dim "
+        f"FROM {src.format(ingredients_t, 'recipe_id')} ORDER BY t.recipe_id, t.id",
+        params,
+    ):
+        ids = [iid] + json.loads(alt) if alt else [iid]
+        ings_by_recipe.setdefault(rid, []).append(
+            {
+                "name": n, "qty": q, "unit": u, "ingredient_ids": ids, "optional": bool(opt),
+                "need": (amount, dim) if amount is not None else None,
+            }
+        )
+
+    return [
+        {
+            "id": rid,
+            "title": title,
+            "steps": steps or "",
+            "time_min": tm,
+            "difficulty": diff,
+            "ingredients": ings_by_recipe.get(rid, []),
+        }
+        for (rid, title, steps, tm, diff) in rows
+    ]
+
+
+def get_all_recipes(with_steps: bool = True) -> list[dict]:
+    """Весь каталог. with_steps=False не читает текст шагов (для подбора/скоринга)."""
     with _conn() as conn, closing(conn.cursor()) as c:
-        rows = c.execute("SELECT id, title, steps, time_min, difficulty FROM recipes").fetchall()
-        data = []
-        for (rid, title, steps, tm, diff) in rows:
-            ings = c.execute(
-                "SELECT name, qty, unit FROM recipe_ingredients WHERE recipe_id=?",
-                (rid,)
-            ).fetchall()
-            data.append({
-                "id": rid,
-                "title": title,
-                "steps": steps or "",
-                "time_min": tm,
-                "difficulty": diff,
-                "ingredients": [{"name": n, "qty": q, "unit": u} for (n, q, u) in ings],
-            })
-        return data
+        return _load_recipes(c, with_steps=with_steps)
 
 
-def get_recipe_by_id(recipe_id: int) -> dict | None:
+def get_recipes_by_ids(recipe_ids: list[int], with_steps: bool = True) -> list[dict]:
     with _conn() as conn, closing(conn.cursor()) as c:
-        row = c.execute(
-            "SELECT id, title, steps, time_min, difficulty FROM recipes WHERE id=?",
-            (recipe_id,),
-        ).fetchone()
-        if not row:
+        return _load_recipes(c, recipe_ids, with_steps=with_steps)
+
+
+def _exclude_ids(c, names) -> list[int]:
+    """id ключей, содержащих все слова одного из names: 'грибы' исключает и 'гриб', и 'гриб шампиньон'."""
+    wanted = [set(k.split()) for n in names or () for k in parse(n)[0] if k]
+    if not wanted:
+        return []
+    return [
+        iid for (iid, key) in c.execute("SELECT id, key FROM all_ingredients")
+        if any(w <= set(key.split()) for w in wanted)
+    ]
+
+
+def _filter_sql(c, filters: dict | None) -> tuple[str, list]:
+    """Условие на all_recipes r по фильтрам подбора: (SQL, параметры), пустая строка — без фильтров.
+
+    filters: max_time — не дольше стольких минут; difficulty — допустимые сложности;
+    diet — ключи tags.DIETS; exclude — названия ингредиентов, которых не должно быть.
+    Время и сложность идут по индексам recipes, диета — по маске recipes.tags.
+    """
+    if not filters:
+        return "", []
+    conds, params = [], []
+    if filters.get("max_time"):
+        conds.append("r.time_min <= ?")
+        params.append(int(filters["max_time"]))
+    difficulty = filters.get("difficulty")
+    if difficulty:
+        conds.append("r.difficulty IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps([difficulty] if isinstance(difficulty, str) else list(difficulty), ensure_ascii=False))
+    mask = diet_mask(filters.get("diet"))
+    if mask:
+        conds.append("(r.tags & ?) = 0")
+        params.append(mask)
+    excluded = _exclude_ids(c, filters.get("exclude"))
+    if excluded:
+        conds.append(
+            "NOT EXISTS (SELECT 1 FROM json_each(?) x JOIN all_recipe_keys xk "
+            "ON xk.ingredient_id = x.value WHERE xk.recipe_id = r.id)"
+        )
+        params.append(json.dumps(excluded))
+    return " AND ".join(conds), params
+
+
+def _filter_join(c, filters: dict | None, col: str = "k.recipe_id") -> tuple[str, list]:
+    """JOIN с all_recipes и WHERE по фильтрам для запроса по col; без фильтров — ничего."""
+    cond, params = _filter_sql(c, filters)
+    if not cond:
+        return "", []
+    return f" JOIN all_recipes r ON r.id = {col} WHERE {cond}", params
+
+
+def find_recipe_ids(ingredient_ids: list[int], filters: dict | None = None) -> list[int]:
+    """id рецептов, где есть хотя бы один из ключей (по обратному индексу) и которые проходят filters."""
+    with _conn() as conn, closing(conn.cursor()) as c:
+        join, params = _filter_join(c, filters)
+        return [r[0] for r in c.execute(
+            "SELECT DISTINCT k.recipe_id FROM json_each(?) j JOIN all_recipe_keys k ON k.ingredient_id = j.value"
+            f"{join} ORDER BY k.recipe_id",
+            (json.dumps(list(ingredient_ids)), *params),
+        )]
+
+
+def filter_recipe_ids(filters: dict | None) -> list[int] | None:
+    """id всех рецептов, проходящих filters (по возрастанию); None — фильтров нет."""
+    with _conn() as conn, closing(conn.cursor()) as c:
+        cond, params = _filter_sql(c, filters)
+        if not cond:
             return None
+        return [r[0] for r in c.execute(f"SELECT r.id FROM all_recipes r WHERE {cond} ORDER BY r.id", params)]
+
+
+def _fill_inventory(c, bonus_by_key: dict[int, int], stock_by_key: dict[int, dict | None]) -> None:
+    """Кладёт инвентарь во временные таблицы соединения (temp.inv, temp.inv_stock; созданы в _attach_catalog)."""
+    c.execute("DELETE FROM temp.inv")
+    c.execute("DELETE FROM temp.inv_stock")
+    c.executemany(
+        "INSERT INTO temp.inv(ingredient_id, bonus, unlimited) VALUES(?,?,?)",
+        [(k, b, int(stock_by_key.get(k) is None)) for k, b in bonus_by_key.items()],
+    )
+    c.executemany(
+        "INSERT INTO temp.inv_stock(ingredient_id, dim, amount) VALUES(?,?,?)",
+        [(k, dim, amount) for k, stock in stock_by_key.items() if stock for dim, amount in stock.items()],
+    )
+
+
+# Та же оценка, что recommend.match_recipe, одним запросом: слот закрывает первый из его ключей
+# (основной, затем alt_ids), который есть в inv; доля — запас / потребность, не больше 1.
+_SCORE_SQL = """
+    WITH cand AS (
+        SELECT DISTINCT k.recipe_id FROM temp.inv i JOIN all_recipe_keys k ON k.ingredient_id = i.ingredient_id{filter}
+    ),
+    slot AS (
+        SELECT t.recipe_id, t.optional, t.amount, t.dim,
+               CASE WHEN t.ingredient_id IN (SELECT ingredient_id FROM temp.inv) THEN t.ingredient_id
+                    ELSE (SELECT j.value FROM json_each(t.alt_ids) j
+                          WHERE j.value IN (SELECT ingredient_id FROM temp.inv) ORDER BY j.key LIMIT 1)
+               END AS hit
+        FROM cand JOIN all_recipe_ingredients t ON t.recipe_id = cand.recipe_id
+    ),
+    part AS (
+        SELECT s.recipe_id, s.optional, COALESCE(i.bonus, 0) AS bonus,
+               CASE WHEN s.hit IS NULL THEN 0.0
+                    WHEN s.amount IS NULL OR s.amount <= 0 OR i.unlimited THEN 1.0
+                    ELSE COALESCE(MIN(1.0, st.amount / s.amount), 1.0)
+               END AS got
+        FROM slot s
+        LEFT JOIN temp.inv i ON i.ingredient_id = s.hit
+        LEFT JOIN temp.inv_stock st ON st.ingredient_id = s.hit AND st.dim = s.dim
+    ),
+    agg AS (
+        SELECT recipe_id,
+               CASE WHEN SUM(NOT optional) > 0
+                    THEN TOTAL(CASE WHEN optional THEN 0.0 ELSE got END) / SUM(NOT optional)
+                    ELSE TOTAL(got) / COUNT(*)
+               END AS coverage,
+               SUM(bonus) AS bonus
+        FROM part GROUP BY recipe_id
+    )
+    SELECT recipe_id, coverage, CAST(coverage * 100 + bonus AS INTEGER) AS score
+    FROM agg
+    ORDER BY coverage >= 0.7 DESC, score DESC, recipe_id
+    LIMIT ?
+"""
+
+
+def score_recipes_sql(
+    bonus_by_key: dict[int, int], stock_by_key: dict[int, dict | None], top_n: int, filters: dict | None = None
+) -> list[tuple[int, float, int]]:
+    """Лучшие top_n рецептов для инвентаря, посчитанные в SQLite: [(recipe_id, coverage, score), ...].
+
+    bonus_by_key — {id ключа: бонус за срок} для всего, что есть; stock_by_key — запас по
+    мерам units (None — количество не указано). В Python рецепты не загружаются.
+    filters (см. _filter_sql) отсекают кандидатов до оценки.
+    """
+    with _conn() as conn, closing(conn.cursor()) as c:
+        _fill_inventory(c, bonus_by_key, stock_by_key)
+        join, params = _filter_join(c, filters)
+        rows = c.execute(_SCORE_SQL.format(filter=join), (*params, top_n)).fetchall()
+        conn.commit()
+    return [(rid, cov, score) for (rid, cov, score) in rows]
+
+
+def get_ingredient_keys() -> list[tuple[int, list[int], bool, tuple | None]]:
+    """(recipe_id, ingredient_ids, optional, need) для всех ингредиентов всех рецептов, по порядку рецептов."""
+    with _conn() as conn, closing(conn.cursor()) as c:
+        return [
+            (
+                rid, [iid or 0] + json.loads(alt) if alt else [iid or 0], bool(opt),
+                (amount, dim) if amount is not None else None,
+            )
+            for (rid, iid, alt, opt, amount, dim) in c.execute(
+                "SELECT recipe_id, ingredient_id, alt_ids, optional, amount, dim FROM all_recipe_ingredients "
+                "ORDER BY recipe_id, id"
+            )
+        ]
 
-        rid, title, steps, tm, diff = row
-        ings = c.execute(
-            "SELECT name, qty, unit FROM recipe_ingredients WHERE recipe_id=?",
-            (rid,),
-        ).fetchall()
+
+def ingredient_names(ingredient_ids: list[int]) -> dict[int, str]:
+    """{id ключа: название} — как ингредиент записан в рецептах, для ключей только из альтернатив — сам ключ."""
+    with _conn() as conn, closing(conn.cursor()) as c:
+        ids_json = json.dumps(list(ingredient_ids))
+        names = dict(c.execute(
+            "SELECT t.ingredient_id, MIN(t.name) FROM json_each(?) j "
+            "JOIN all_recipe_ingredients t ON t.ingredient_id = j.value GROUP BY t.ingredient_id",
+            (ids_json,),
+        ))
+        for (iid, key) in c.execute(
+            "SELECT i.id, i.key FROM json_each(?) j JOIN all_ingredients i ON i.id = j.value", (ids_json,)
+        ):
+            names.setdefault(iid, key)
+        return names
+
+
+def similar_recipes(recipe_id: int, top_n: int = 5, min_similarity: float = 0.2) -> list[tuple[dict, float]]:
+    """Похожие по ингредиентам рецепты: [(рецепт без шагов, оценка Жаккара), ...] по убыванию.
+
+    Кандидаты — рецепты, попавшие с recipe_id хотя бы в одну LSH-корзину (minhash.bands),
+    поэтому все пары не сравниваются; кандидаты ранжируются по совпадению подписей.
+    """
+    with _conn() as conn, closing(conn.cursor()) as c:
+        row = c.execute("SELECT minhash FROM all_recipes WHERE id=?", (recipe_id,)).fetchone()
+        if not row or row[0] is None:
+            return []
+        sig = minhash.unpack(row[0])
+        scored = [
+            (rid, minhash.similarity(sig, minhash.unpack(blob)))
+            for (rid, blob) in c.execute(
+                # условия на (band, bucket) в WHERE проталкиваются в обе части all_recipe_bands (поиск по PK),
+                # с json_each в JOIN представление было бы материализовано целиком
+                "SELECT r.id, r.minhash FROM ("
+                "  SELECT DISTINCT recipe_id AS id FROM all_recipe_bands"
+                f"  WHERE {' OR '.join(['(band = ? AND bucket = ?)'] * minhash.BANDS)}"
+                ") cand JOIN all_recipes r ON r.id = cand.id WHERE r.id != ? AND r.minhash IS NOT NULL",
+                [v for pair in minhash.bands(sig) for v in pair] + [recipe_id],
+            )
+        ]
+        top = sorted((x for x in scored if x[1] >= min_similarity), key=lambda x: (-x[1], x[0]))[:top_n]
+        by_id = {r["id"]: r for r in _load_recipes(c, [rid for (rid, _) in top], with_steps=False)}
+        return [(by_id[rid], sim) for (rid, sim) in top if rid in by_id]
+
+
+def get_nutrition() -> dict[int, tuple[float, float, float, float, int]]:
+    """{recipe_id: (ккал, белки, жиры, углеводы, порций)} всех рецептов с ингредиентами (на весь рецепт)."""
+    with _conn() as conn, closing(conn.cursor()) as c:
         return {
-            "id": rid,
-            "title": title,
-            "steps": steps or "",
-            "time_min": tm,
-            "difficulty": diff,
-            "ingredients": [{"name": n, "qty": q, "unit": u} for (n, q, u) in ings],
+            rid: (kcal, protein, fat, carbs, servings)
+            for (rid, kcal, protein, fat, carbs, servings) in c.execute(
+                "SELECT id, kcal, protein, fat, carbs, servings FROM all_recipes r "
+                "WHERE EXISTS (SELECT 1 FROM all_recipe_keys k WHERE k.recipe_id = r.id)"
+            )
         }
 
 
+def recipes_revision() -> str:
+    """Отпечаток набора рецептов для кэшей производных структур (см. recipe_matrix).
+
+    Меняется при смене каталога, INDEX_VERSION или любых ингредиентов оверлея.
+    """
+    with _conn() as conn, closing(conn.cursor()) as c:
+        h = hashlib.sha1()
+        for row in c.execute(
+            "SELECT recipe_id, ingredient_id, alt_ids, optional, amount, dim FROM main.recipe_ingredients ORDER BY id"
+        ):
+            h.update(repr(row).encode())
+        return f"{_catalog_version(c)}|{INDEX_VERSION}|{h.hexdigest()}"
+
+
+def get_recipes_excluding(
+    exclude_ids: list[int], limit: int, with_steps: bool = True, after_id: int | None = None,
+    filters: dict | None = None,
+) -> list[dict]:
+    """Первые limit рецептов с ингредиентами (по id), кроме exclude_ids и не прошедших filters.
+
+    after_id — продолжить после рецепта с этим id (постраничное чтение без OFFSET).
+    """
+    with _conn() as conn, closing(conn.cursor()) as c:
+        cond, params = _filter_sql(c, filters)
+        ids = [r[0] for r in c.execute(
+            "SELECT id FROM all_recipes r "
+            "WHERE id NOT IN (SELECT value FROM json_each(?)) AND id > ? "
+            "AND EXISTS (SELECT 1 FROM all_recipe_keys k WHERE k.recipe_id = r.id) "
+            f"{'AND ' + cond if cond else ''} ORDER BY id LIMIT ?",
+            (json.dumps(list(exclude_ids)), -1 if after_id is None else after_id, *params, limit),
+        )]
+        return _load_recipes(c, ids, with_steps=with_steps)
+
+
+def count_recipes(filters: dict | None = None) -> int:
+    """Сколько рецептов с ингредиентами (столько всего может попасть в подбор с такими filters)."""
+    with _conn() as conn, closing(conn.cursor()) as c:
+        join, params = _filter_join(c, filters)
+        return c.execute(f"SELECT COUNT(DISTINCT k.recipe_id) FROM all_recipe_keys k{join}", params).fetchone()[0]
+
+
+def get_recipe_by_id(recipe_id: int) -> dict | None:
+    with _conn() as conn, closing(conn.cursor()) as c:
+        found = _load_recipes(c, [recipe_id])
+        return found[0] if found else None
+
+
 def get_recipe_by_title(title: str) -> dict | None:
     with _conn() as conn, closing(conn.cursor()) as c:
         row = c.execute(
-            "SELECT id FROM recipes WHERE title=?",
+            "SELECT id FROM all_recipes WHERE title=?",
             (title,),
         ).fetchone()
         if not row:
@@ -130,3016 +589,166 @@ def upsert_recipe(title: str, steps: str, ingredients: list, time_min: int | Non
                     [(rid, i.get("name"), i.get("qty"), i.get("unit")) for i in ingredients],
                 )
 
+        _index_recipes(c, [rid])
         conn.commit()
         return int(rid)
 
-def seed_demo_if_empty():
-    with _conn() as conn, closing(conn.cursor()) as c:
-        cnt = c.execute("SELECT COUNT(*) FROM recipes").fetchone()[0]
-    if cnt > 0:
-        return
-
-    upsert_recipe(
-        "Омлет с сыром",
-        """Время: 10 минут
-Температура: средний огонь
-
-Шаги:
-1) Подготовка
-   - В миске разбей яйца.
-   - Добавь молоко, щепотку соли и перца.
-   - Взбей вилкой 20–30 секунд до однородности (без сильной пены).
-
-2) Разогрев сковороды
-   - Поставь сковороду на средний огонь.
-   - Прогрей 1–2 минуты, добавь немного масла.
-
-3) Жарка
-   - Вылей смесь на сковороду.
-   - Готовь 2–3 минуты, пока края схватятся.
-
-4) Сыр и доведение
-   - Посыпь тёртым сыром.
-   - Накрой крышкой на 30–60 секунд, чтобы сыр расплавился.
-
-5) Подача
-   - Сложи омлет пополам.
-   - Подавай сразу, пока он горячий.""",
-        [
-            {"name": "яйца", "qty": 3, "unit": "шт"},
-            {"name": "сыр", "qty": 50, "unit": "г"},
-            {"name": "молоко", "qty": 30, "unit": "мл"},
-            {"name": "масло", "qty": 1, "unit": "ч.л."},
-            {"name": "соль", "qty": 1, "unit": "щепотка"},
-            {"name": "перец", "qty": 1, "unit": "щепотка"},
-        ],
-        time_min=10,
-        difficulty="легко",
-    )
-
-    upsert_recipe(
-        "Салат греческий",
-        """Время: 12 минут
-Температура: не требуется (без готовки)
-
-Шаги:
-1) Подготовка овощей
-   - Огурец вымой и нарежь крупными полукольцами/кубиком.
-   - Помидоры нарежь дольками.
-   - Перец нарежь крупными полосками.
-   - Красный лук нарежь тонкими полукольцами (по желанию ошпарь 10 секунд кипятком и обсуши).
-
-2) Сборка
-   - В миске смешай овощи и маслины.
-   - Фету нарежь кубиками или разломай руками и выложи сверху.
-
-3) Заправка
-   - Полей оливковым маслом.
-   - Добавь соль и перец по вкусу.
-   - По желанию добавь щепотку орегано и немного лимонного сока.
-
-4) Подача
-   - Аккуратно перемешай (или оставь слои) и подавай сразу.""",
-        [
-            {"name": "помидоры", "qty": 2, "unit": "шт"},
-            {"name": "огурец", "qty": 1, "unit": "шт"},
-            {"name": "сыр фета", "qty": 100, "unit": "г"},
-            {"name": "маслины", "qty": 10, "unit": "шт"},
-            {"name": "оливковое масло", "qty": 2, "unit": "ст.л."},
-            {"name": "лук красный", "qty": 0.5, "unit": "шт"},
-            {"name": "орегано (по желанию)", "qty": 1, "unit": "щепотка"},
-        ],
-        time_min=12,
-        difficulty="легко",
-    )
-
-    upsert_recipe(
-        "Паста с томатным соусом",
-        """Время: 20 минут
-Температура: средний огонь
-
-Шаги:
-1) Отваривание пасты
-   - Вскипяти воду (примерно 2 литра на 200 г пасты).
-   - Посоли воду.
-   - Вари пасту до состояния al dente по инструкции на упаковке.
-   - Слей воду, оставь 100 мл воды от пасты.
-
-2) Томатный соус
-   - Разогрей сковороду на среднем огне, добавь оливковое масло.
-   - Мелко нарежь чеснок и прогрей 30–40 секунд, не давая ему потемнеть.
-   - Добавь томаты, соль, перец.
-   - Туши 8–10 минут, пока соус слегка не загустеет.
-
-3) Соединение
-   - Добавь пасту в соус и перемешай.
-   - Если густо, подлей немного воды от пасты.
-   - Прогрей 1–2 минуты.
-
-4) Подача
-   - По желанию добавь сыр и зелень.""",
-        [
-            {"name": "паста", "qty": 200, "unit": "г"},
-            {"name": "томаты", "qty": 300, "unit": "г"},
-            {"name": "чеснок", "qty": 2, "unit": "зубчик"},
-            {"name": "оливковое масло", "qty": 2, "unit": "ст.л."},
-            {"name": "соль", "qty": 1, "unit": "ч.л."},
-            {"name": "перец", "qty": 1, "unit": "щепотка"},
-        ],
-        time_min=20,
-        difficulty="средне",
-    )
-
-
-def seed_world_recipes() -> int:
-    added = 0
-
-    def put(title, steps, ings, time_min=None, difficulty=None):
-        nonlocal added
-        upsert_recipe(title, steps, ings, time_min, difficulty)
-        added += 1
-
-    put(
-        "Пицца Маргарита",
-        """Время: 35 минут (без учета подъёма теста)
-Духовка: 240–260°C, противень/камень разогреть заранее
-
-Шаги:
-1) Разогрев
-   - Включи духовку на максимум.
-   - Поставь внутрь противень/камень и прогрей минимум 20 минут.
-
-2) Соус
-   - Измельчи томаты (можно блендером).
-   - Посоли, добавь 1 ст.л. оливкового масла, перемешай.
-
-3) Формование основы
-   - Растяни тесто в круг 28–30 см (лучше руками).
-   - Переложи на пергамент, чтобы удобнее перенести на горячий противень.
-
-4) Сборка
-   - Нанеси тонкий слой соуса (не заливай).
-   - Разложи моцареллу кусочками.
-   - Часть базилика можно добавить до выпечки.
-
-5) Выпечка
-   - Перенеси пиццу на горячий противень.
-   - Выпекай 7–10 минут до румяных краев и расплавленного сыра.
-   - Если духовка слабая, пеки 12–15 минут при 220–230°C.
-
-6) Подача
-   - Достань, добавь свежий базилик и каплю масла.""",
-        [
-            {"name": "мука", "qty": 300, "unit": "г"},
-            {"name": "дрожжи", "qty": 7, "unit": "г"},
-            {"name": "томаты", "qty": 300, "unit": "г"},
-            {"name": "сыр моцарелла", "qty": 150, "unit": "г"},
-            {"name": "базилик", "qty": 1, "unit": "пучок"},
-            {"name": "оливковое масло", "qty": 2, "unit": "ст.л."},
-            {"name": "соль", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=35,
-        difficulty="средне",
-    )
-
-    put(
-        "Спагетти Карбонара",
-        """Время: 20 минут
-Температура: средний огонь (яйца нельзя перегревать)
-
-Шаги:
-1) Паста
-   - Вскипяти воду, посоли.
-   - Отвари пасту до al dente.
-   - Оставь 100 мл воды от пасты, остальное слей.
-
-2) Бекон
-   - Нарежь бекон кубиком.
-   - Обжарь на сухой сковороде 4–6 минут до румяности.
-   - Убавь огонь или сними сковороду, чтобы она немного остыла.
-
-3) Яично-сырная смесь
-   - В миске смешай яйца и тёртый сыр.
-   - Добавь щепотку свежемолотого перца.
-
-4) Соединение
-   - Добавь горячую пасту в сковороду к бекону, перемешай.
-   - Сними сковороду с огня.
-   - Влей яично-сырную смесь и быстро перемешай.
-   - Если соус густой, добавь немного воды от пасты.
-
-5) Подача
-   - Подавай сразу, сверху можно добавить ещё сыра и перца.""",
-        [
-            {"name": "паста", "qty": 250, "unit": "г"},
-            {"name": "яйца", "qty": 2, "unit": "шт"},
-            {"name": "сыр", "qty": 60, "unit": "г"},
-            {"name": "бекон", "qty": 120, "unit": "г"},
-            {"name": "перец чёрный", "qty": 1, "unit": "щепотка"},
-            {"name": "соль", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=20,
-        difficulty="средне",
-    )
-
-    put(
-        "Пад тай",
-        """Время: 25 минут
-Температура: средне-сильный огонь (вок/сковорода)
-
-Шаги:
-1) Лапша
-   - Замочи рисовую лапшу в тёплой воде на 10–15 минут, затем слей.
-
-2) Соус
-   - Смешай соевый соус, немного сахара/мёда и сок лайма.
-   - Попробуй и отрегулируй баланс кислого/солёного/сладкого.
-
-3) Жарка белка
-   - Разогрей сковороду, добавь масло.
-   - Обжарь курицу (или креветки) до готовности: курица 5–7 минут, креветки 2–3 минуты.
-
-4) Яйцо
-   - Сдвинь содержимое в сторону, вбей яйцо.
-   - Быстро перемешай до схватывания 30–60 секунд.
-
-5) Сборка
-   - Добавь лапшу и соус, перемешай 2–3 минуты, прогревая и выпаривая лишнюю влагу.
-   - Добавь часть арахиса.
-
-6) Подача
-   - Подавай с долькой лайма, сверху посыпь арахисом.""",
-        [
-            {"name": "рисовая лапша", "qty": 200, "unit": "г"},
-            {"name": "куриное филе", "qty": 200, "unit": "г"},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-            {"name": "арахис", "qty": 30, "unit": "г"},
-            {"name": "лайм", "qty": 1, "unit": "шт"},
-            {"name": "соевый соус", "qty": 2, "unit": "ст.л."},
-            {"name": "масло", "qty": 1, "unit": "ст.л."},
-        ],
-        time_min=25,
-        difficulty="средне",
-    )
-
-    put(
-        "Фо бо",
-        """Время: 40 минут (быстрая версия)
-Температура: слабое кипение
-
-Шаги:
-1) Бульон
-   - Подогрей говяжий бульон до слабого кипения.
-   - Добавь половинку лука и щепотку соли, провари 10 минут.
-
-2) Лапша
-   - Рисовую лапшу залей кипятком на 5–7 минут (или по инструкции), затем слей.
-
-3) Подготовка мяса
-   - Говядину нарежь очень тонкими ломтиками поперёк волокон.
-   - Если трудно резать, подморозь мясо 15–20 минут.
-
-4) Сборка миски
-   - В миску положи лапшу, сверху мясо и зелень.
-   - Залей кипящим бульоном: мясо дойдёт в горячем бульоне за 1–2 минуты.
-
-5) Подача
-   - Подай с лаймом и зеленью. По желанию добавь соевый соус или острый соус.""",
-        [
-            {"name": "говядина", "qty": 250, "unit": "г"},
-            {"name": "рисовая лапша", "qty": 200, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "лайм", "qty": 1, "unit": "шт"},
-            {"name": "зелень", "qty": 1, "unit": "пучок"},
-            {"name": "говяжий бульон", "qty": 1, "unit": "л"},
-        ],
-        time_min=40,
-        difficulty="средне",
-    )
-
-    put(
-        "Рамен шою",
-        """Время: 35 минут
-Температура: слабое кипение
-
-Шаги:
-1) Бульон
-   - Доведи бульон до слабого кипения и держи горячим.
-
-2) Лапша
-   - Отвари лапшу отдельно в кипящей воде до готовности по инструкции.
-   - Слей и промой очень быстро горячей водой (или не промывай, если не липнет).
-
-3) Основа (tare)
-   - В миску добавь соевый соус (и по желанию немного масла/сахара).
-   - Влей часть горячего бульона, размешай.
-
-4) Сборка
-   - Положи лапшу в миску.
-   - Долей бульон.
-   - Добавь яйцо и зелёный лук.
-
-5) Подача
-   - Подавай сразу, пока лапша упругая.""",
-        [
-            {"name": "куриный бульон", "qty": 1, "unit": "л"},
-            {"name": "лапша", "qty": 200, "unit": "г"},
-            {"name": "соевый соус", "qty": 3, "unit": "ст.л."},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-            {"name": "зелёный лук", "qty": 1, "unit": "пучок"},
-        ],
-        time_min=35,
-        difficulty="средне",
-    )
-
-    put(
-        "Том ям",
-        """Время: 25 минут
-Температура: умеренное кипение
-
-Шаги:
-1) Основа
-   - Доведи воду/бульон до кипения.
-   - Добавь пасту том ям (по вкусу) и размешай.
-
-2) Грибы
-   - Добавь нарезанные грибы, вари 3–4 минуты.
-
-3) Креветки
-   - Добавь креветки, вари 2–3 минуты до розового цвета.
-
-4) Кокосовое молоко
-   - Убавь огонь до слабого кипения, влей кокосовое молоко.
-   - Не кипяти сильно, прогрей 2–3 минуты.
-
-5) Вкус
-   - Добавь сок лайма, соль по необходимости.
-   - Чили добавляй аккуратно.
-
-6) Подача
-   - Подавай горячим, можно добавить зелень.""",
-        [
-            {"name": "креветки", "qty": 250, "unit": "г"},
-            {"name": "грибы", "qty": 150, "unit": "г"},
-            {"name": "лайм", "qty": 1, "unit": "шт"},
-            {"name": "кокосовое молоко", "qty": 200, "unit": "мл"},
-            {"name": "чили", "qty": 1, "unit": "шт"},
-            {"name": "паста том ям", "qty": 1, "unit": "ст.л."},
-            {"name": "вода/бульон", "qty": 800, "unit": "мл"},
-        ],
-        time_min=25,
-        difficulty="средне",
-    )
-
-    put(
-        "Паэлья",
-        """Время: 45 минут
-Температура: средний огонь, затем слабый
-
-Шаги:
-1) Подготовка
-   - Нарежь курицу и овощи.
-   - Подогрей бульон отдельно, чтобы он был горячим.
-
-2) Обжарка
-   - Разогрей сковороду, добавь масло.
-   - Обжарь курицу 5–7 минут до румяности.
-   - Добавь овощи, готовь 3–4 минуты.
-
-3) Рис
-   - Добавь рис, прогрей 1–2 минуты, чтобы он впитал масло.
-   - Добавь шафран/специи (если используешь).
-
-4) Бульон
-   - Влей горячий бульон так, чтобы покрывал рис.
-   - Убавь огонь и готовь 15–20 минут, не перемешивая часто.
-
-5) Морепродукты
-   - За 7–8 минут до готовности добавь креветки.
-
-6) Доведение и отдых
-   - Когда жидкость впитается, выключи огонь.
-   - Накрой и дай постоять 5 минут.
-
-7) Подача
-   - Подавай сразу.""",
-        [
-            {"name": "рис", "qty": 300, "unit": "г"},
-            {"name": "куриное филе", "qty": 200, "unit": "г"},
-            {"name": "креветки", "qty": 200, "unit": "г"},
-            {"name": "перец", "qty": 1, "unit": "шт"},
-            {"name": "томаты", "qty": 200, "unit": "г"},
-            {"name": "бульон", "qty": 800, "unit": "мл"},
-            {"name": "масло", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=45,
-        difficulty="средне",
-    )
-
-    put(
-        "Шакшука",
-        """Время: 20 минут
-Температура: средний огонь
-
-Шаги:
-1) Основа
-   - Нарежь лук и перец.
-   - Разогрей сковороду, добавь масло.
-   - Обжарь лук 2–3 минуты до мягкости, добавь перец, готовь ещё 2 минуты.
-
-2) Томаты
-   - Добавь томаты, соль, перец и специи.
-   - Туши 5–7 минут, пока соус немного не загустеет.
-
-3) Яйца
-   - Сделай 3 лунки ложкой.
-   - Аккуратно разбей яйца в лунки.
-   - Накрой крышкой и готовь 4–6 минут до желаемой степени готовности желтка.
-
-4) Подача
-   - Посыпь зеленью, подавай с хлебом.""",
-        [
-            {"name": "томаты", "qty": 400, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "чеснок", "qty": 2, "unit": "зубчик"},
-            {"name": "яйца", "qty": 3, "unit": "шт"},
-            {"name": "перец", "qty": 0.5, "unit": "шт"},
-            {"name": "масло", "qty": 1, "unit": "ст.л."},
-            {"name": "соль", "qty": 1, "unit": "щепотка"},
-        ],
-        time_min=20,
-        difficulty="легко",
-    )
-
-    put(
-        "Хумус",
-        """Время: 15 минут (если нут уже готов)
-Температура: не требуется
-
-Шаги:
-1) Подготовка
-   - Если нут сухой, замочи на ночь и отвари до мягкости (это занимает больше времени).
-   - Для быстрого варианта используй готовый нут.
-
-2) Измельчение
-   - В блендере смешай нут, тахини, чеснок, сок лимона, соль.
-   - Добавь 2–4 ст.л. воды, чтобы добиться кремовой текстуры.
-
-3) Доведение
-   - Влей оливковое масло и пробей ещё 15–20 секунд.
-   - Отрегулируй вкус: соль, лимон, тахини.
-
-4) Подача
-   - Переложи в тарелку, сделай ложкой углубление, добавь немного масла.""",
-        [
-            {"name": "нут", "qty": 250, "unit": "г"},
-            {"name": "тахини", "qty": 2, "unit": "ст.л."},
-            {"name": "лимон", "qty": 0.5, "unit": "шт"},
-            {"name": "чеснок", "qty": 1, "unit": "зубчик"},
-            {"name": "оливковое масло", "qty": 2, "unit": "ст.л."},
-            {"name": "соль", "qty": 1, "unit": "щепотка"},
-        ],
-        time_min=15,
-        difficulty="легко",
-    )
-
-    put(
-        "Салат Цезарь",
-        """Время: 20 минут
-Температура: для курицы (если добавляешь) средний огонь
-
-Шаги:
-1) Сухарики
-   - Нарежь батон кубиками.
-   - Обжарь на сковороде с каплей масла 3–5 минут или подсуши в духовке при 180°C 7–10 минут.
-
-2) Соус (упрощенный)
-   - Смешай яйцо (или желток), немного масла, щепотку соли, перца.
-   - Добавь измельчённый чеснок и анчоусы (по желанию).
-   - Добавь немного лимонного сока.
-
-3) Сборка
-   - Порви листья салата руками.
-   - Добавь сухарики, тёртый сыр.
-   - Полей соусом и аккуратно перемешай.
-
-4) Подача
-   - Сверху можно добавить ещё сыра и сухариков.""",
-        [
-            {"name": "листья салата", "qty": 1, "unit": "кочан"},
-            {"name": "сыр", "qty": 50, "unit": "г"},
-            {"name": "батон", "qty": 4, "unit": "ломтик"},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-            {"name": "анчоусы", "qty": 4, "unit": "шт"},
-            {"name": "чеснок", "qty": 1, "unit": "зубчик"},
-            {"name": "масло", "qty": 2, "unit": "ст.л."},
-            {"name": "лимонный сок", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=20,
-        difficulty="средне",
-    )
-
-    put(
-        "Тако",
-        """Время: 25 минут
-Температура: средний огонь
-
-Шаги:
-1) Подготовка
-   - Нарежь лук и томаты.
-   - Разогрей тортильи на сухой сковороде по 20–30 секунд с каждой стороны.
-
-2) Мясо
-   - Разогрей сковороду, добавь немного масла.
-   - Обжарь фарш/мясо 6–8 минут, разбивая комочки.
-   - Добавь соль, перец, специи (паприка, кумин, чили по желанию).
-   - Добавь немного томатов, готовь ещё 2 минуты.
-
-3) Сборка
-   - В тортилью выложи мясо, сверху лук, томаты, зелень.
-   - Добавь соус по вкусу.
-
-4) Подача
-   - Подавай сразу.""",
-        [
-            {"name": "говядина", "qty": 250, "unit": "г"},
-            {"name": "тортильи", "qty": 4, "unit": "шт"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "томаты", "qty": 150, "unit": "г"},
-            {"name": "перец", "qty": 1, "unit": "шт"},
-            {"name": "масло", "qty": 1, "unit": "ст.л."},
-            {"name": "соль", "qty": 1, "unit": "щепотка"},
-        ],
-        time_min=25,
-        difficulty="легко",
-    )
-
-    put(
-        "Фиш-н-чипс",
-        """Время: 35 минут
-Температура: масло для жарки 170–180°C (или сильный огонь)
-
-Шаги:
-1) Картофель
-   - Нарежь картофель брусочками.
-   - Промой и хорошо обсуши.
-   - Если есть время: замочи 20 минут в холодной воде, затем обсуши.
-
-2) Кляр
-   - Смешай муку, щепотку соли, яйцо.
-   - Разведи водой до консистенции густых сливок.
-
-3) Жарка картофеля
-   - Разогрей масло до 170–180°C.
-   - Жарь картофель партиями 6–8 минут до мягкости и лёгкой корочки.
-   - Дай стечь на бумаге.
-
-4) Жарка рыбы
-   - Обсуши рыбу, посоли, обваляй в муке, затем в кляре.
-   - Жарь 4–6 минут до золотистой корочки.
-
-5) Доведение картофеля
-   - По желанию быстро дожарь картофель 1–2 минуты в горячем масле до хруста.
-
-6) Подача
-   - Посоли и подавай сразу.""",
-        [
-            {"name": "рыба", "qty": 300, "unit": "г"},
-            {"name": "картофель", "qty": 400, "unit": "г"},
-            {"name": "мука", "qty": 120, "unit": "г"},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-            {"name": "масло растительное", "qty": 400, "unit": "мл"},
-            {"name": "соль", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=35,
-        difficulty="средне",
-    )
-
-    return added
-
-def seed_more_world_recipes() -> int:
-    added = 0
-
-    def put(title, steps, ings, time_min=None, difficulty=None):
-        nonlocal added
-        upsert_recipe(title, steps, ings, time_min, difficulty)
-        added += 1
-
-    put(
-        "Лазанья болоньезе",
-        """Время: 70 минут
-Духовка: 180°C
-
-Шаги:
-1) Соус болоньезе
-   - Обжарь лук 2–3 минуты.
-   - Добавь фарш, обжарь 6–8 минут.
-   - Добавь томаты, соль, перец, туши 15 минут.
-
-2) Соус бешамель
-   - Растопи сливочное масло на среднем огне.
-   - Всыпь муку, размешай 1 минуту.
-   - Постепенно влей молоко, постоянно помешивая.
-   - Доведи до загустения 5–7 минут, посоли.
-
-3) Сборка
-   - В форму: немного болоньезе, листы лазаньи, бешамель, сыр.
-   - Повтори слои 3–4 раза.
-   - Сверху должен быть соус и сыр.
-
-4) Запекание
-   - Запекай 35–40 минут при 180°C.
-   - Дай постоять 10 минут перед нарезкой.""",
-        [
-            {"name": "фарш говяжий", "qty": 400, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "чеснок", "qty": 2, "unit": "зубчик"},
-            {"name": "томаты", "qty": 400, "unit": "г"},
-            {"name": "листы лазаньи", "qty": 9, "unit": "шт"},
-            {"name": "молоко", "qty": 400, "unit": "мл"},
-            {"name": "мука", "qty": 2, "unit": "ст.л."},
-            {"name": "масло сливочное", "qty": 40, "unit": "г"},
-            {"name": "сыр", "qty": 120, "unit": "г"},
-            {"name": "соль", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=70,
-        difficulty="средне",
-    )
-    put(
-        "Ризотто с грибами",
-        """Время: 35 минут
-Температура: средний огонь (потом средне-слабый)
-
-Шаги:
-1) Подготовка
-   - Грибы нарежь пластинками.
-   - Лук нарежь мелко.
-   - Бульон держи горячим (не кипятить сильно), чтобы подливать тёплый.
-
-2) Обжарка основы
-   - Разогрей сковороду/сотейник, растопи сливочное масло.
-   - Обжарь лук 2–3 минуты до мягкости.
-
-3) Грибы
-   - Добавь грибы, готовь 5–7 минут, пока уйдёт влага и грибы слегка подрумянятся.
-
-4) Рис
-   - Добавь рис и прогрей 1–2 минуты, постоянно помешивая (рис должен стать полупрозрачным по краям).
-
-5) Доваривание
-   - Подливай бульон порциями по 1 половнику.
-   - После каждой порции мешай, пока жидкость почти полностью не впитается.
-   - Повторяй 15–18 минут, пока рис не станет мягким с лёгкой “сердцевиной”.
-
-6) Финал
-   - Добавь сыр и перемешай 30 секунд до кремовой текстуры.
-   - Дай постоять 1 минуту и подавай сразу.""",
-        [
-            {"name": "рис", "qty": 300, "unit": "г"},
-            {"name": "грибы", "qty": 250, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "масло сливочное", "qty": 40, "unit": "г"},
-            {"name": "куриный бульон", "qty": 1, "unit": "л"},
-            {"name": "сыр", "qty": 60, "unit": "г"},
-        ],
-        time_min=35, difficulty="средне"
-    )
-
-    put(
-        "Борщ",
-        """Время: 80 минут
-Температура: слабое кипение
-
-Шаги:
-1) Бульон
-   - Положи говядину в кастрюлю, залей водой.
-   - Доведи до кипения, сними пену.
-   - Убавь огонь до слабого кипения и вари 40–50 минут.
-
-2) Подготовка овощей
-   - Лук нарежь мелко, морковь натри/нарежь.
-   - Свёклу натри/нарежь соломкой.
-   - Картофель нарежь кубиком, капусту нашинкуй.
-
-3) Обжарка (зажарка)
-   - На сковороде обжарь лук 2–3 минуты.
-   - Добавь морковь, готовь 3 минуты.
-   - Добавь свёклу, готовь 5–7 минут.
-   - Добавь томаты, туши 5 минут.
-
-4) Сборка борща
-   - Достань мясо, нарежь кусочками и верни в кастрюлю.
-   - Добавь картофель, вари 10 минут.
-   - Добавь капусту, вари 7–10 минут до мягкости.
-   - Выложи зажарку и вари ещё 5–7 минут.
-
-5) Доведение
-   - Проверь вкус, при необходимости посоли/поперчи.
-   - Выключи и дай настояться 10 минут.
-
-6) Подача
-   - Подавай горячим, можно со сметаной и зеленью.""",
-        [
-            {"name": "говядина", "qty": 400, "unit": "г"},
-            {"name": "свёкла", "qty": 1, "unit": "шт"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "картофель", "qty": 3, "unit": "шт"},
-            {"name": "капуста", "qty": 300, "unit": "г"},
-            {"name": "томаты", "qty": 200, "unit": "г"},
-        ],
-        time_min=80, difficulty="средне"
-    )
-
-    put(
-        "Плов",
-        """Время: 70 минут
-Температура: средний огонь (потом слабый)
-
-Шаги:
-1) Подготовка
-   - Рис промой 4–5 раз до почти прозрачной воды.
-   - Лук нарежь полукольцами, морковь соломкой.
-   - Мясо нарежь кубиками.
-
-2) Основа (зирвак)
-   - Разогрей масло в казане/глубокой сковороде на среднем огне.
-   - Обжарь мясо 7–10 минут до румяной корочки.
-   - Добавь лук, готовь 3–4 минуты.
-   - Добавь морковь, готовь 5–6 минут, периодически помешивая.
-
-3) Томление
-   - Добавь специи по вкусу (если используешь).
-   - Влей воду так, чтобы она слегка покрывала мясо с овощами.
-   - Убавь огонь и туши 20 минут.
-
-4) Рис
-   - Ровным слоем выложи рис сверху, не перемешивая.
-   - Влей воду так, чтобы она покрывала рис примерно на 1–1.5 см.
-   - Воткни головку чеснока в центр.
-
-5) Доведение
-   - Готовь без крышки на среднем огне, пока вода почти не уйдёт (10–12 минут).
-   - Затем накрой крышкой, убавь огонь и томи 15 минут.
-
-6) Отдых и подача
-   - Выключи, дай постоять 10 минут.
-   - Аккуратно перемешай и подавай.""",
-        [
-            {"name": "рис", "qty": 400, "unit": "г"},
-            {"name": "говядина", "qty": 500, "unit": "г"},
-            {"name": "лук", "qty": 2, "unit": "шт"},
-            {"name": "морковь", "qty": 2, "unit": "шт"},
-            {"name": "чеснок", "qty": 1, "unit": "головка"},
-            {"name": "масло растительное", "qty": 80, "unit": "мл"},
-        ],
-        time_min=70, difficulty="средне"
-    )
-
-    put(
-        "Чили кон карне",
-        """Время: 40 минут
-Температура: средний огонь (потом слабый)
-
-Шаги:
-1) Подготовка
-   - Лук нарежь мелко.
-   - Если фасоль/кукуруза консервированные — слей жидкость.
-
-2) Обжарка
-   - Разогрей сковороду, добавь немного масла.
-   - Обжарь лук 2–3 минуты.
-   - Добавь фарш и жарь 6–8 минут, разбивая комочки, до изменения цвета.
-
-3) Соус
-   - Добавь томаты, перемешай.
-   - Убавь огонь, туши 10 минут.
-
-4) Фасоль и кукуруза
-   - Добавь фасоль и кукурузу.
-   - Туши ещё 10–15 минут до загустения.
-
-5) Доведение
-   - Добавь чили по вкусу (осторожно).
-   - Попробуй и отрегулируй вкус.
-
-6) Подача
-   - Подавай горячим. Хорошо подходит рис или хлеб.""",
-        [
-            {"name": "фарш говяжий", "qty": 400, "unit": "г"},
-            {"name": "фасоль", "qty": 300, "unit": "г"},
-            {"name": "кукуруза", "qty": 150, "unit": "г"},
-            {"name": "томаты", "qty": 400, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "чили", "qty": 1, "unit": "шт"},
-        ],
-        time_min=40, difficulty="легко"
-    )
-
-    put(
-        "Минестроне",
-        """Время: 35 минут
-Температура: слабое кипение
-
-Шаги:
-1) Подготовка
-   - Нарежь лук и морковь мелко.
-   - Сельдерей нарежь кубиком.
-   - Если фасоль готовая — слей жидкость.
-
-2) Обжарка овощей
-   - В кастрюле разогрей немного масла.
-   - Обжарь лук 2 минуты, добавь морковь и сельдерей, готовь ещё 3–4 минуты.
-
-3) Основа супа
-   - Добавь томаты и влей воду/бульон (если делаешь гуще — меньше жидкости).
-   - Доведи до слабого кипения и вари 10 минут.
-
-4) Фасоль и паста
-   - Добавь фасоль, вари 5 минут.
-   - Добавь пасту, вари до готовности пасты по времени на упаковке.
-
-5) Доведение
-   - Попробуй, отрегулируй вкус.
-   - Дай настояться 5 минут под крышкой.
-
-6) Подача
-   - Подавай горячим, можно посыпать сыром.""",
-        [
-            {"name": "томаты", "qty": 400, "unit": "г"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "сельдерей", "qty": 1, "unit": "стебель"},
-            {"name": "фасоль", "qty": 200, "unit": "г"},
-            {"name": "паста", "qty": 80, "unit": "г"},
-        ],
-        time_min=35, difficulty="легко"
-    )
-
-    put(
-        "Курица терияки",
-        """Время: 25 минут
-Температура: средний огонь
-
-Шаги:
-1) Подготовка
-   - Нарежь куриное филе тонкими полосками.
-   - Рис поставь вариться отдельно (если используешь в качестве гарнира).
-
-2) Обжарка курицы
-   - Разогрей сковороду на среднем огне, добавь немного масла.
-   - Обжарь курицу 6–8 минут до готовности, помешивая.
-
-3) Соус
-   - Влей соевый соус.
-   - Убавь огонь и прогрей 2–3 минуты, чтобы соус слегка загустел и покрыл курицу.
-
-4) Доведение
-   - Попробуй: если слишком солёно — добавь немного воды; если хочется слаще — добавь немного сахара/мёда (по желанию).
-
-5) Подача
-   - Подавай с рисом.
-   - Сверху посыпь зелёным луком.""",
-        [
-            {"name": "куриное филе", "qty": 350, "unit": "г"},
-            {"name": "соевый соус", "qty": 3, "unit": "ст.л."},
-            {"name": "рис", "qty": 200, "unit": "г"},
-            {"name": "зелёный лук", "qty": 1, "unit": "пучок"},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Гаспачо",
-        """Время: 15 минут + 30 минут охлаждение (по желанию)
-Температура: не требуется (холодный суп)
-
-Шаги:
-1) Подготовка
-   - Вымой и нарежь томаты, огурец, перец, лук.
-   - Чеснок очисти.
-
-2) Измельчение
-   - Сложи овощи в блендер.
-   - Добавь оливковое масло и немного воды (если нужно для консистенции).
-   - Измельчи до однородности.
-
-3) Доведение
-   - Попробуй и отрегулируй вкус (соль/кислота по желанию).
-   - Если хочешь более гладкую текстуру — протри через сито.
-
-4) Охлаждение
-   - Убери в холодильник минимум на 30 минут.
-
-5) Подача
-   - Подавай холодным, можно с кусочками овощей отдельно.""",
-        [
-            {"name": "томаты", "qty": 600, "unit": "г"},
-            {"name": "огурец", "qty": 1, "unit": "шт"},
-            {"name": "перец", "qty": 1, "unit": "шт"},
-            {"name": "лук", "qty": 0.5, "unit": "шт"},
-            {"name": "чеснок", "qty": 1, "unit": "зубчик"},
-            {"name": "оливковое масло", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=15, difficulty="легко"
-    )
-
-    put(
-        "Сырный крем-суп",
-        """Время: 30 минут
-Температура: слабое кипение
-
-Шаги:
-1) Подготовка
-   - Картофель нарежь кубиком.
-   - Лук нарежь мелко.
-
-2) Обжарка
-   - В кастрюле обжарь лук 2–3 минуты на небольшом количестве масла.
-
-3) Варка
-   - Добавь картофель и влей бульон.
-   - Доведи до кипения и вари 15–18 минут до мягкости картофеля.
-
-4) Измельчение
-   - Сними с огня и пробей суп блендером до однородности.
-
-5) Сливки и сыр
-   - Верни на слабый огонь, добавь сливки.
-   - Постепенно добавь сыр, помешивая, пока он полностью не расплавится.
-
-6) Доведение
-   - Прогрей 2–3 минуты, но не кипяти сильно.
-   - Подавай горячим.""",
-        [
-            {"name": "картофель", "qty": 400, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "куриный бульон", "qty": 800, "unit": "мл"},
-            {"name": "сливки", "qty": 150, "unit": "мл"},
-            {"name": "сыр", "qty": 120, "unit": "г"},
-        ],
-        time_min=30, difficulty="легко"
-    )
-
-    put(
-        "Куриный суп-лапша",
-        """Время: 35 минут
-Температура: слабое кипение
-
-Шаги:
-1) Основа
-   - Доведи куриный бульон до слабого кипения.
-
-2) Курица и овощи
-   - Нарежь курицу кусочками.
-   - Морковь нарежь тонко.
-   - Добавь курицу и морковь в бульон, вари 10–12 минут.
-
-3) Лапша
-   - Добавь лапшу и вари по времени на упаковке (обычно 6–10 минут).
-
-4) Доведение
-   - Добавь зелень в конце (за 1 минуту до выключения) или уже в тарелку.
-   - Дай постоять 5 минут под крышкой.
-
-5) Подача
-   - Подавай горячим.""",
-        [
-            {"name": "куриное филе", "qty": 300, "unit": "г"},
-            {"name": "куриный бульон", "qty": 1, "unit": "л"},
-            {"name": "лапша", "qty": 120, "unit": "г"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "зелень", "qty": 1, "unit": "пучок"},
-        ],
-        time_min=35, difficulty="легко"
-    )
-
-    put(
-        "Бургеры классические",
-        """Время: 25 минут
-Температура: средний/средне-сильный огонь
-
-Шаги:
-1) Подготовка
-   - Раздели фарш на 4 части и сформуй котлеты.
-   - Сделай небольшое углубление в центре котлеты, чтобы она не “вздулась”.
-
-2) Обжарка котлет
-   - Разогрей сковороду.
-   - Жарь котлеты 3–4 минуты с каждой стороны (для полной прожарки может потребоваться 8–10 минут суммарно).
-   - За 1 минуту до конца положи сыр на котлеты, чтобы он расплавился.
-
-3) Булочки
-   - Разрежь булочки и слегка поджарь на сухой сковороде 30–60 секунд.
-
-4) Сборка
-   - На нижнюю часть булочки положи соус, котлету с сыром.
-   - Добавь лук, огурец, по желанию дополнительные овощи.
-   - Накрой верхней половинкой.
-
-5) Подача
-   - Подавай сразу.""",
-        [
-            {"name": "фарш говяжий", "qty": 400, "unit": "г"},
-            {"name": "булочки", "qty": 4, "unit": "шт"},
-            {"name": "сыр", "qty": 4, "unit": "ломтик"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "огурец", "qty": 1, "unit": "шт"},
-            {"name": "томатный соус", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Шаверма куриная",
-        """Время: 25 минут
-Температура: средний огонь
-
-Шаги:
-1) Подготовка
-   - Нарежь курицу тонкими полосками.
-   - Огурец и томаты нарежь.
-   - Чеснок измельчи.
-
-2) Соус
-   - Смешай йогурт с чесноком.
-   - Дай постоять 5 минут, чтобы вкус раскрылся.
-
-3) Курица
-   - Разогрей сковороду, добавь немного масла.
-   - Обжарь курицу 6–8 минут до готовности.
-   - По желанию добавь специи (паприка, перец).
-
-4) Сборка
-   - Разложи лаваш.
-   - Смажь соусом.
-   - Выложи курицу и овощи.
-
-5) Заворачивание и прогрев
-   - Плотно заверни.
-   - Прогрей на сухой сковороде по 1–2 минуты с каждой стороны до лёгкой корочки.
-
-6) Подача
-   - Нарежь пополам и подавай.""",
-        [
-            {"name": "куриное филе", "qty": 350, "unit": "г"},
-            {"name": "лаваш", "qty": 2, "unit": "шт"},
-            {"name": "огурец", "qty": 1, "unit": "шт"},
-            {"name": "томаты", "qty": 2, "unit": "шт"},
-            {"name": "чеснок", "qty": 1, "unit": "зубчик"},
-            {"name": "йогурт", "qty": 150, "unit": "г"},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Суши-ролл Калифорния",
-        """Время: 45 минут
-Температура: не требуется (если рис уже сварен — быстрее)
-
-Шаги:
-1) Рис
-   - Промой рис несколько раз.
-   - Отвари до готовности по инструкции.
-   - Остуди до тёплого состояния (не горячий, чтобы нори не размокали).
-
-2) Подготовка начинки
-   - Огурец нарежь тонкими полосками.
-   - Крабовые палочки нарежь.
-   - Смешай крабовые палочки с майонезом.
-
-3) Сборка
-   - Положи лист нори на коврик.
-   - Равномерно распредели рис по нори тонким слоем, оставь 1–2 см свободного края.
-   - Выложи начинку полоской ближе к нижнему краю.
-
-4) Скручивание
-   - Скрути ролл, слегка прижимая, чтобы он держал форму.
-
-5) Нарезка
-   - Намочи нож водой.
-   - Нарежь ролл на 6–8 кусочков.
-
-6) Подача
-   - Подавай с соевым соусом.""",
-        [
-            {"name": "рис", "qty": 250, "unit": "г"},
-            {"name": "нори", "qty": 4, "unit": "лист"},
-            {"name": "огурец", "qty": 1, "unit": "шт"},
-            {"name": "крабовые палочки", "qty": 150, "unit": "г"},
-            {"name": "майонез", "qty": 2, "unit": "ст.л."},
-            {"name": "соевый соус", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=45, difficulty="средне"
-    )
-
-    put(
-        "Панкейки",
-        """Время: 20 минут
-Температура: средний огонь
-
-Шаги:
-1) Тесто
-   - В миске смешай яйцо и молоко.
-   - Добавь сахар и перемешай.
-   - Всыпь муку и разрыхлитель, размешай до однородности без крупных комков.
-   - Дай тесту постоять 5 минут.
-
-2) Жарка
-   - Разогрей сковороду на среднем огне.
-   - Смажь тонким слоем масла (или используй антипригарную).
-   - Выливай тесто небольшими кружками.
-
-3) Переворот
-   - Жарь до пузырьков на поверхности и схватывания краёв (примерно 1–2 минуты).
-   - Переверни и жарь ещё 30–60 секунд.
-
-4) Подача
-   - Подавай сразу, можно с мёдом, ягодами или джемом.""",
-        [
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-            {"name": "молоко", "qty": 250, "unit": "мл"},
-            {"name": "мука", "qty": 180, "unit": "г"},
-            {"name": "сахар", "qty": 1.5, "unit": "ст.л."},
-            {"name": "разрыхлитель", "qty": 1, "unit": "ч.л."},
-            {"name": "масло сливочное", "qty": 30, "unit": "г"},
-        ],
-        time_min=20, difficulty="легко"
-    )
-
-    put(
-        "Тирамису",
-        """Время: 30 минут + 4 часа охлаждение
-Температура: не требуется (холодный десерт)
-
-Шаги:
-1) Подготовка кофе
-   - Завари крепкий кофе и остуди до комнатной температуры.
-
-2) Крем
-   - Взбей сливки до мягких пиков.
-   - Отдельно размешай маскарпоне до мягкости.
-   - Соедини маскарпоне со сливками аккуратными движениями.
-
-3) Сборка слоёв
-   - Быстро обмакивай савоярди в кофе (1–2 секунды), чтобы не размокли.
-   - Выложи первый слой печенья.
-   - Сверху слой крема.
-   - Повтори 2–3 слоя (заканчивай кремом).
-
-4) Охлаждение
-   - Накрой и убери в холодильник минимум на 4 часа.
-
-5) Подача
-   - Перед подачей посыпь какао через сито.""",
-        [
-            {"name": "печенье савоярди", "qty": 200, "unit": "г"},
-            {"name": "маскарпоне", "qty": 250, "unit": "г"},
-            {"name": "сливки", "qty": 200, "unit": "мл"},
-            {"name": "кофе", "qty": 150, "unit": "мл"},
-            {"name": "какао", "qty": 1, "unit": "ст.л."},
-        ],
-        time_min=30, difficulty="легко"
-    )
-    put(
-        "Овсянка с бананом",
-        """Время: 10 минут
-Температура: слабое кипение (средне-слабый огонь)
-
-Шаги:
-1) Подготовка
-   - Влей молоко (или воду/смесь) в небольшую кастрюлю.
-   - Добавь щепотку соли (по желанию).
-
-2) Варка
-   - Доведи молоко до слабого кипения.
-   - Всыпь овсянку, перемешай.
-   - Вари 3–5 минут, помешивая, чтобы не пригорело.
-
-3) Доведение
-   - Сними с огня, накрой крышкой на 1 минуту.
-   - Банан нарежь кружочками.
-
-4) Подача
-   - Переложи кашу в тарелку.
-   - Добавь банан и мёд.
-   - По желанию посыпь орехами.""",
-        [
-            {"name": "овсянка", "qty": 60, "unit": "г"},
-            {"name": "молоко", "qty": 250, "unit": "мл"},
-            {"name": "банан", "qty": 1, "unit": "шт"},
-            {"name": "мёд", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=10, difficulty="легко"
-    )
-
-    put(
-        "Тосты с авокадо",
-        """Время: 10 минут
-Температура: средний огонь (для тостов)
-
-Шаги:
-1) Подготовка авокадо
-   - Разрежь авокадо, удали косточку.
-   - Вынь мякоть и разомни вилкой.
-   - Добавь щепотку соли и немного лимонного сока, перемешай.
-
-2) Тосты
-   - Поджарь хлеб в тостере или на сухой сковороде 1–2 минуты с каждой стороны.
-
-3) Сборка
-   - Намажь пасту из авокадо на тосты.
-   - По желанию добавь перец, зелень или ломтики помидора.""",
-        [
-            {"name": "хлеб", "qty": 2, "unit": "ломтик"},
-            {"name": "авокадо", "qty": 1, "unit": "шт"},
-            {"name": "лимон", "qty": 0.5, "unit": "шт"},
-        ],
-        time_min=10, difficulty="легко"
-    )
-
-    put(
-        "Сырники",
-        """Время: 25 минут
-Температура: средний огонь
-
-Шаги:
-1) Тесто
-   - В миске разомни творог вилкой (чтобы не было крупных комков).
-   - Добавь яйцо и сахар, перемешай.
-   - Всыпь муку постепенно и замеси мягкое тесто (не забивай мукой).
-
-2) Формовка
-   - Слегка присыпь стол мукой.
-   - Сформуй колбаску, нарежь на шайбы.
-   - Приплюсни и придай форму сырников.
-
-3) Жарка
-   - Разогрей сковороду, добавь масло.
-   - Жарь сырники 3–4 минуты с каждой стороны до румяной корочки.
-   - Если внутри сырые, убавь огонь и подержи под крышкой 2–3 минуты.
-
-4) Подача
-   - Подавай со сметаной, вареньем или мёдом.""",
-        [
-            {"name": "творог", "qty": 400, "unit": "г"},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-            {"name": "мука", "qty": 3, "unit": "ст.л."},
-            {"name": "сахар", "qty": 1, "unit": "ст.л."},
-            {"name": "масло растительное", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Драники",
-        """Время: 30 минут
-Температура: средний огонь
-
-Шаги:
-1) Подготовка
-   - Натрите картофель на мелкой/средней тёрке.
-   - Натрите лук (он уменьшит потемнение).
-   - При необходимости слегка отожми массу от лишнего сока (не полностью).
-
-2) Тесто
-   - Добавь яйцо, муку, соль.
-   - Перемешай до однородности.
-
-3) Жарка
-   - Разогрей сковороду с маслом.
-   - Выкладывай ложкой небольшие лепёшки.
-   - Жарь 3–4 минуты с каждой стороны до румяности.
-   - Убавь огонь, чтобы внутри успели пропечься.
-
-4) Подача
-   - Подавай горячими, обычно со сметаной.""",
-        [
-            {"name": "картофель", "qty": 500, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-            {"name": "мука", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=30, difficulty="легко"
-    )
-
-    put(
-        "Жареный рис с овощами",
-        """Время: 20 минут (если рис уже готов)
-Температура: средне-сильный огонь
-
-Шаги:
-1) Подготовка
-   - Лучше использовать заранее сваренный и охлаждённый рис.
-   - Нарежь лук, морковь, перец мелким кубиком.
-
-2) Обжарка овощей
-   - Разогрей сковороду, добавь масло.
-   - Обжарь лук 1–2 минуты.
-   - Добавь морковь и перец, готовь 3–4 минуты.
-
-3) Рис
-   - Добавь рис и хорошо перемешай.
-   - Жарь 3–5 минут, чтобы рис прогрелся и слегка подсушился.
-
-4) Соус
-   - Влей соевый соус, перемешай.
-   - Прогрей ещё 1 минуту.
-
-5) Подача
-   - Подавай сразу. По желанию добавь зелень.""",
-        [
-            {"name": "рис", "qty": 250, "unit": "г"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "перец", "qty": 1, "unit": "шт"},
-            {"name": "соевый соус", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=20, difficulty="легко"
-    )
-
-    put(
-        "Куриные котлеты",
-        """Время: 35 минут
-Температура: средний огонь
-
-Шаги:
-1) Фарш
-   - Мелко нарежь лук.
-   - Замочи хлеб (если используешь) в небольшом количестве воды/молока и отожми.
-   - Смешай куриный фарш, лук, яйцо, хлеб, соль и специи.
-
-2) Формовка
-   - Смочи руки водой.
-   - Сформуй котлеты одинакового размера.
-
-3) Жарка
-   - Разогрей сковороду, добавь масло.
-   - Обжарь котлеты 3–4 минуты с каждой стороны до корочки.
-
-4) Доведение до готовности
-   - Убавь огонь, накрой крышкой и доведи 8–10 минут.
-   - Внутри котлеты должны быть полностью готовые, без розового.
-
-5) Подача
-   - Подавай горячими с гарниром.""",
-        [
-            {"name": "куриный фарш", "qty": 500, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-            {"name": "хлеб", "qty": 1, "unit": "ломтик"},
-        ],
-        time_min=35, difficulty="легко"
-    )
-
-    put(
-        "Рыба в духовке с лимоном",
-        """Время: 25 минут
-Духовка: 190–200°C
-
-Шаги:
-1) Подготовка
-   - Разогрей духовку до 190–200°C.
-   - Рыбу обсуши бумажным полотенцем.
-
-2) Маринад
-   - Посоли и поперчи рыбу.
-   - Сбрызни оливковым маслом.
-   - Добавь ломтики лимона сверху или внутрь (если целая тушка/филе в фольге).
-
-3) Запекание
-   - Выложи рыбу на противень или в форму.
-   - Запекай 15–20 минут (в зависимости от толщины куска).
-   - Ориентир: рыба легко расслаивается вилкой.
-
-4) Подача
-   - Подавай сразу, можно добавить зелень.""",
-        [
-            {"name": "рыба", "qty": 400, "unit": "г"},
-            {"name": "лимон", "qty": 0.5, "unit": "шт"},
-            {"name": "оливковое масло", "qty": 1, "unit": "ст.л."},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Картофельное пюре",
-        """Время: 25 минут
-Температура: кипение (потом слабый огонь)
-
-Шаги:
-1) Варка картофеля
-   - Очисти картофель и нарежь крупными кусками.
-   - Залей холодной водой, добавь соль.
-   - Доведи до кипения и вари 15–18 минут до мягкости.
-
-2) Слив воды
-   - Слей воду полностью.
-   - Верни кастрюлю на слабый огонь на 30 секунд, чтобы выпарить лишнюю влагу (осторожно, не сжечь).
-
-3) Разминание
-   - Разомни картофель толкушкой.
-   - Подогрей молоко отдельно (не обязательно, но лучше для текстуры).
-   - Добавь сливочное масло и тёплое молоко порциями, перемешивая.
-
-4) Доведение
-   - Попробуй, отрегулируй соль.
-   - Подавай горячим.""",
-        [
-            {"name": "картофель", "qty": 600, "unit": "г"},
-            {"name": "молоко", "qty": 120, "unit": "мл"},
-            {"name": "масло сливочное", "qty": 30, "unit": "г"},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Гречка с грибами",
-        """Время: 25 минут
-Температура: средний огонь (затем слабый)
-
-Шаги:
-1) Гречка
-   - Промой гречку.
-   - Залей водой в пропорции примерно 1:2.
-   - Посоли, доведи до кипения.
-   - Убавь огонь и вари под крышкой 12–15 минут до впитывания воды.
-
-2) Грибы
-   - Нарежь грибы и лук.
-   - Обжарь лук 2 минуты, добавь грибы.
-   - Готовь 6–8 минут, пока уйдёт влага и грибы подрумянятся.
-
-3) Сборка
-   - Смешай гречку с грибами.
-   - Прогрей 1–2 минуты на слабом огне.
-
-4) Подача
-   - Подавай горячим, по желанию с зеленью.""",
-        [
-            {"name": "гречка", "qty": 250, "unit": "г"},
-            {"name": "грибы", "qty": 250, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Суп-пюре из тыквы",
-        """Время: 35 минут
-Температура: слабое кипение
-
-Шаги:
-1) Подготовка
-   - Тыкву нарежь кубиками.
-   - Лук нарежь мелко.
-
-2) Обжарка
-   - В кастрюле обжарь лук 2–3 минуты на небольшом количестве масла.
-
-3) Варка
-   - Добавь тыкву, влей бульон.
-   - Доведи до кипения и вари 15–18 минут до мягкости тыквы.
-
-4) Измельчение
-   - Сними с огня и пробей блендером до однородности.
-
-5) Сливки
-   - Верни на слабый огонь, влей сливки.
-   - Прогрей 2–3 минуты (не кипяти сильно).
-
-6) Подача
-   - Подавай горячим. По желанию добавь сухарики.""",
-        [
-            {"name": "тыква", "qty": 500, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "куриный бульон", "qty": 700, "unit": "мл"},
-            {"name": "сливки", "qty": 120, "unit": "мл"},
-        ],
-        time_min=35, difficulty="легко"
-    )
-
-    put(
-        "Овощное рагу",
-        """Время: 35 минут
-Температура: средний огонь (потом слабый)
-
-Шаги:
-1) Подготовка
-   - Нарежь кабачок, баклажан и перец кубиком.
-   - Лук нарежь мелко.
-   - Томаты нарежь кубиком или используй измельчённые.
-
-2) Обжарка
-   - Разогрей кастрюлю/сковороду, добавь масло.
-   - Обжарь лук 2–3 минуты.
-
-3) Тушение
-   - Добавь баклажан и перец, готовь 5 минут.
-   - Добавь кабачок и томаты.
-   - Посоли, перемешай, накрой крышкой.
-
-4) Доведение
-   - Туши 15–20 минут на слабом огне, иногда перемешивая.
-   - Если сухо, добавь 2–3 ст.л. воды.
-
-5) Подача
-   - Подавай горячим как гарнир или самостоятельное блюдо.""",
-        [
-            {"name": "кабачок", "qty": 1, "unit": "шт"},
-            {"name": "баклажан", "qty": 1, "unit": "шт"},
-            {"name": "перец", "qty": 1, "unit": "шт"},
-            {"name": "томаты", "qty": 300, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-        ],
-        time_min=35, difficulty="легко"
-    )
-
-    put(
-        "Запечённые овощи",
-        """Время: 40 минут
-Духовка: 200°C
-
-Шаги:
-1) Подготовка
-   - Разогрей духовку до 200°C.
-   - Картофель нарежь дольками, морковь кружочками, перец и лук крупно.
-
-2) Заправка
-   - Сложи овощи в миску.
-   - Добавь оливковое масло, соль, специи по вкусу.
-   - Хорошо перемешай, чтобы масло равномерно покрыло овощи.
-
-3) Запекание
-   - Разложи овощи на противне в один слой.
-   - Запекай 25–30 минут.
-   - В середине времени перемешай/переверни для равномерной корочки.
-
-4) Подача
-   - Подавай горячими.""",
-        [
-            {"name": "картофель", "qty": 300, "unit": "г"},
-            {"name": "морковь", "qty": 2, "unit": "шт"},
-            {"name": "перец", "qty": 1, "unit": "шт"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "оливковое масло", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=40, difficulty="легко"
-    )
-
-    put(
-        "Рисовая каша",
-        """Время: 25 минут
-Температура: слабое кипение
-
-Шаги:
-1) Подготовка
-   - Промой рис 2–3 раза.
-
-2) Варка
-   - Влей молоко в кастрюлю, доведи до слабого кипения.
-   - Всыпь рис, убавь огонь.
-   - Вари 18–20 минут, часто помешивая, чтобы не пригорело.
-
-3) Доведение
-   - Добавь сахар и масло, перемешай.
-   - Сними с огня, накрой крышкой на 2 минуты.
-
-4) Подача
-   - Подавай тёплой. По желанию добавь ягоды или мёд.""",
-        [
-            {"name": "рис", "qty": 80, "unit": "г"},
-            {"name": "молоко", "qty": 400, "unit": "мл"},
-            {"name": "сахар", "qty": 1, "unit": "ст.л."},
-            {"name": "масло сливочное", "qty": 10, "unit": "г"},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Яичница с помидорами",
-        """Время: 10 минут
-Температура: средний огонь
-
-Шаги:
-1) Помидоры
-   - Нарежь помидоры дольками/кубиком.
-   - Разогрей сковороду с небольшим количеством масла.
-   - Обжарь помидоры 2–3 минуты, слегка посоли.
-
-2) Яйца
-   - Убавь огонь до среднего.
-   - Вбей яйца рядом с помидорами.
-   - Посоли, поперчи.
-
-3) Доведение
-   - Готовь 3–5 минут до желаемой прожарки.
-   - Если хочешь более мягкую верхушку, накрой крышкой на 1 минуту.
-
-4) Подача
-   - Подавай сразу.""",
-        [
-            {"name": "яйца", "qty": 2, "unit": "шт"},
-            {"name": "помидоры", "qty": 2, "unit": "шт"},
-        ],
-        time_min=10, difficulty="легко"
-    )
-
-    put(
-        "Салат с тунцом",
-        """Время: 15 минут
-Температура: не требуется (кроме варки яиц)
-
-Шаги:
-1) Яйца
-   - Отвари яйца вкрутую 8–10 минут, остуди и очисти.
-   - Нарежь кубиком.
-
-2) Подготовка
-   - Огурец нарежь кубиком.
-   - Слей жидкость из тунца и разомни вилкой.
-   - С кукурузы слей рассол.
-
-3) Сборка
-   - Смешай тунец, яйца, огурец и кукурузу.
-   - Добавь заправку (йогурт/майонез), перемешай.
-
-4) Доведение
-   - Посоли и поперчи по вкусу.
-
-5) Подача
-   - Подавай сразу или охлади 10–15 минут.""",
-        [
-            {"name": "тунец консервированный", "qty": 1, "unit": "банка"},
-            {"name": "яйца", "qty": 2, "unit": "шт"},
-            {"name": "огурец", "qty": 1, "unit": "шт"},
-            {"name": "кукуруза", "qty": 150, "unit": "г"},
-        ],
-        time_min=15, difficulty="легко"
-    )
-
-    put(
-        "Пицца на лаваше",
-        """Время: 12 минут
-Духовка: 200–220°C
-
-Шаги:
-1) Подготовка
-   - Разогрей духовку до 200–220°C.
-   - Выложи лаваш на противень (лучше на пергамент).
-
-2) Основа
-   - Смажь лаваш томатным соусом тонким слоем.
-
-3) Начинка
-   - Выложи колбасу/другую начинку.
-   - Посыпь тёртым сыром.
-
-4) Запекание
-   - Запекай 8–10 минут, пока сыр не расплавится и края не станут хрустящими.
-
-5) Подача
-   - Нарежь и подавай сразу.""",
-        [
-            {"name": "лаваш", "qty": 1, "unit": "шт"},
-            {"name": "сыр", "qty": 120, "unit": "г"},
-            {"name": "томатный соус", "qty": 2, "unit": "ст.л."},
-            {"name": "колбаса", "qty": 120, "unit": "г"},
-        ],
-        time_min=12, difficulty="легко"
-    )
-
-    put(
-        "Кесадилья",
-        """Время: 15 минут
-Температура: средний огонь
-
-Шаги:
-1) Подготовка
-   - Если курица сырая, заранее обжарь/отвари и нарежь.
-   - Перец нарежь тонкими полосками.
-
-2) Сборка
-   - На тортилью выложи часть сыра.
-   - Сверху курицу и перец.
-   - Добавь ещё сыра (он склеит слои).
-   - Накрой второй тортильей.
-
-3) Обжарка
-   - Разогрей сухую сковороду.
-   - Жарь 2–3 минуты, пока низ не подрумянится.
-   - Аккуратно переверни и жарь ещё 2–3 минуты.
-
-4) Подача
-   - Переложи на доску, дай постоять 1 минуту.
-   - Нарежь на треугольники.""",
-        [
-            {"name": "тортильи", "qty": 2, "unit": "шт"},
-            {"name": "сыр", "qty": 150, "unit": "г"},
-            {"name": "куриное филе", "qty": 200, "unit": "г"},
-            {"name": "перец", "qty": 1, "unit": "шт"},
-        ],
-        time_min=15, difficulty="легко"
-    )
-
-    put(
-        "Сэндвич с курицей",
-        """Время: 15 минут
-Температура: средний огонь (гриль/сковорода)
-
-Шаги:
-1) Подготовка
-   - Если курица сырая, приготовь заранее (обжарь/отвари).
-   - Нарежь курицу ломтиками.
-   - Помидор нарежь кружками.
-
-2) Сборка
-   - На ломтик хлеба положи листья салата.
-   - Добавь курицу, сыр, помидор.
-   - Накрой вторым ломтиком хлеба.
-
-3) Прогрев
-   - Разогрей сковороду или гриль.
-   - Поджарь сэндвич 2–3 минуты с каждой стороны.
-   - Если есть пресс/груз, прижми, чтобы сыр расплавился быстрее.
-
-4) Подача
-   - Разрежь по диагонали и подавай.""",
-        [
-            {"name": "хлеб", "qty": 2, "unit": "ломтик"},
-            {"name": "куриное филе", "qty": 150, "unit": "г"},
-            {"name": "сыр", "qty": 1, "unit": "ломтик"},
-            {"name": "листья салата", "qty": 2, "unit": "лист"},
-            {"name": "помидоры", "qty": 1, "unit": "шт"},
-        ],
-        time_min=15, difficulty="легко"
-    )
-
-    put(
-        "Печёные яблоки",
-        """Время: 25 минут
-Духовка: 180°C
-
-Шаги:
-1) Подготовка
-   - Разогрей духовку до 180°C.
-   - Вымой яблоки.
-   - Удали сердцевину ножом/ложкой, не прорезая дно.
-
-2) Начинка
-   - Внутрь положи мёд.
-   - Добавь орехи (можно слегка измельчить).
-
-3) Запекание
-   - Поставь яблоки в форму.
-   - Влей на дно формы 2–3 ст.л. воды, чтобы не пересыхали.
-   - Запекай 15–20 минут до мягкости (зависит от сорта).
-
-4) Подача
-   - Подавай тёплыми. По желанию добавь йогурт.""",
-        [
-            {"name": "яблоки", "qty": 3, "unit": "шт"},
-            {"name": "мёд", "qty": 2, "unit": "ч.л."},
-            {"name": "орехи", "qty": 30, "unit": "г"},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Окрошка на кефире",
-        """Время: 20 минут (если картофель и яйца уже готовы)
-Температура: не требуется
-
-Шаги:
-1) Подготовка
-   - Отвари картофель в мундире, остуди и нарежь кубиком.
-   - Отвари яйца вкрутую, остуди и нарежь кубиком.
-   - Огурцы нарежь кубиком.
-   - Колбасу нарежь кубиком.
-   - Зелень мелко наруби.
-
-2) Сборка основы
-   - Сложи все нарезанные ингредиенты в большую миску.
-   - Посоли и перемешай.
-
-3) Заливка
-   - Влей кефир.
-   - Если нужно менее густо, добавь немного воды.
-
-4) Доведение
-   - Попробуй и отрегулируй соль.
-   - Убери в холодильник на 10–15 минут, если хочешь похолоднее.
-
-5) Подача
-   - Подавай охлаждённой.""",
-        [
-            {"name": "кефир", "qty": 700, "unit": "мл"},
-            {"name": "огурец", "qty": 2, "unit": "шт"},
-            {"name": "картофель", "qty": 3, "unit": "шт"},
-            {"name": "яйца", "qty": 3, "unit": "шт"},
-            {"name": "колбаса", "qty": 200, "unit": "г"},
-            {"name": "зелень", "qty": 1, "unit": "пучок"},
-        ],
-        time_min=20, difficulty="легко"
-    )
-
-    put(
-        "Блины",
-        """Время: 25 минут
-Температура: средний огонь
-
-Шаги:
-1) Тесто
-   - В миске взбей яйца с сахаром и щепоткой соли.
-   - Влей молоко, перемешай.
-   - Всыпь муку постепенно, размешай до однородности без комков.
-   - Добавь масло в тесто, перемешай.
-   - Дай постоять 5 минут.
-
-2) Жарка
-   - Разогрей сковороду.
-   - Первый раз слегка смажь маслом.
-   - Наливай тесто тонким слоем и быстро распределяй.
-   - Жарь 40–60 секунд, переверни и жарь ещё 20–40 секунд.
-
-3) Подача
-   - Подавай горячими со сметаной/вареньем/мёдом.""",
-        [
-            {"name": "молоко", "qty": 500, "unit": "мл"},
-            {"name": "яйца", "qty": 2, "unit": "шт"},
-            {"name": "мука", "qty": 220, "unit": "г"},
-            {"name": "сахар", "qty": 1, "unit": "ст.л."},
-            {"name": "масло растительное", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Салат Оливье",
-        """Время: 30 минут (если овощи и яйца уже сварены)
-Температура: не требуется
-
-Шаги:
-1) Подготовка
-   - Отвари картофель и морковь, остуди, очисти.
-   - Отвари яйца вкрутую, остуди, очисти.
-
-2) Нарезка
-   - Нарежь картофель, морковь, яйца, колбасу и огурцы кубиком.
-   - С горошка слей жидкость.
-
-3) Сборка
-   - Смешай всё в миске.
-   - Добавь горошек и майонез.
-   - Аккуратно перемешай.
-
-4) Доведение
-   - Посоли по вкусу (аккуратно, майонез и огурцы уже солёные).
-
-5) Подача
-   - Лучше охладить 30 минут, но можно подавать сразу.""",
-        [
-            {"name": "картофель", "qty": 3, "unit": "шт"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "яйца", "qty": 3, "unit": "шт"},
-            {"name": "колбаса", "qty": 250, "unit": "г"},
-            {"name": "огурец", "qty": 2, "unit": "шт"},
-            {"name": "горошек", "qty": 1, "unit": "банка"},
-            {"name": "майонез", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=30, difficulty="легко"
-    )
-
-    put(
-        "Гуакамоле",
-        """Время: 10 минут
-Температура: не требуется
-
-Шаги:
-1) Подготовка
-   - Разрежь авокадо, удали косточку.
-   - Мякоть переложи в миску и разомни вилкой.
-
-2) Овощи
-   - Мелко нарежь лук.
-   - Нарежь томаты мелким кубиком (по желанию можно убрать лишний сок).
-
-3) Смешивание
-   - Добавь лук и томаты к авокадо.
-   - Выжми лимонный сок, посоли и перемешай.
-
-4) Подача
-   - Подавай сразу, чтобы не темнело.
-   - Можно хранить под плёнкой в контакте с поверхностью.""",
-        [
-            {"name": "авокадо", "qty": 2, "unit": "шт"},
-            {"name": "лимон", "qty": 0.5, "unit": "шт"},
-            {"name": "томаты", "qty": 1, "unit": "шт"},
-            {"name": "лук", "qty": 0.5, "unit": "шт"},
-        ],
-        time_min=10, difficulty="легко"
-    )
-
-    put(
-        "Паста Альфредо",
-        """Время: 20 минут
-Температура: средний огонь (соус не кипятить сильно)
-
-Шаги:
-1) Паста
-   - Отвари пасту до al dente.
-   - Оставь 100 мл воды от пасты, остальное слей.
-
-2) Соус
-   - На сковороде растопи сливочное масло на среднем огне.
-   - Добавь мелко нарезанный чеснок, прогрей 20–30 секунд.
-   - Влей сливки, прогрей 2–3 минуты на среднем огне.
-
-3) Сыр
-   - Убавь огонь.
-   - Добавь тёртый сыр порциями, помешивая до растворения.
-   - Если густо, добавь немного воды от пасты.
-
-4) Соединение
-   - Добавь пасту в соус, перемешай 1–2 минуты.
-
-5) Подача
-   - Подавай сразу.""",
-        [
-            {"name": "паста", "qty": 250, "unit": "г"},
-            {"name": "сливки", "qty": 200, "unit": "мл"},
-            {"name": "сыр", "qty": 80, "unit": "г"},
-            {"name": "масло сливочное", "qty": 25, "unit": "г"},
-            {"name": "чеснок", "qty": 1, "unit": "зубчик"},
-        ],
-        time_min=20, difficulty="легко"
-    )
-
-    put(
-        "Курица с картофелем в духовке",
-        """Время: 55 минут
-Духовка: 200°C
-
-Шаги:
-1) Подготовка
-   - Разогрей духовку до 200°C.
-   - Картофель нарежь крупными кусками.
-   - Курицу нарежь кусочками (если филе).
-
-2) Маринад
-   - Смешай курицу и картофель в миске.
-   - Добавь оливковое масло, соль, специи по вкусу.
-   - Чеснок измельчи и добавь, перемешай.
-
-3) Запекание
-   - Переложи в форму/на противень одним слоем.
-   - Запекай 35–45 минут.
-   - В середине времени перемешай, чтобы равномерно подрумянилось.
-
-4) Проверка
-   - Картофель должен быть мягким, курица полностью готовой.
-
-5) Подача
-   - Подавай горячим.""",
-        [
-            {"name": "куриное филе", "qty": 350, "unit": "г"},
-            {"name": "картофель", "qty": 600, "unit": "г"},
-            {"name": "оливковое масло", "qty": 2, "unit": "ст.л."},
-            {"name": "чеснок", "qty": 2, "unit": "зубчик"},
-        ],
-        time_min=55, difficulty="легко"
-    )
-
-    put(
-        "Салат с крабовыми палочками",
-        """Время: 15 минут
-Температура: не требуется
-
-Шаги:
-1) Подготовка
-   - Если крабовые палочки заморожены, разморозь и обсуши.
-   - Отвари яйца вкрутую (если ещё не готовы), остуди и очисти.
-
-2) Нарезка
-   - Нарежь крабовые палочки кубиком.
-   - Нарежь яйца кубиком.
-   - Огурец нарежь кубиком.
-
-3) Сборка
-   - Слей жидкость с кукурузы.
-   - Смешай всё в миске.
-   - Добавь майонез, перемешай.
-
-4) Доведение
-   - При необходимости посоли (осторожно).
-   - Можно охладить 10–15 минут.
-
-5) Подача
-   - Подавай сразу или охлаждённым.""",
-        [
-            {"name": "крабовые палочки", "qty": 200, "unit": "г"},
-            {"name": "кукуруза", "qty": 150, "unit": "г"},
-            {"name": "яйца", "qty": 2, "unit": "шт"},
-            {"name": "огурец", "qty": 1, "unit": "шт"},
-            {"name": "майонез", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=15, difficulty="легко"
-    )
-
-    put(
-        "Смузи банановый",
-        """Время: 5 минут
-Температура: не требуется
-
-Шаги:
-1) Подготовка
-   - Банан очисти и нарежь кусочками.
-
-2) Смешивание
-   - В чашу блендера добавь банан, йогурт, молоко и мёд.
-   - Взбивай 30–60 секунд до полной однородности.
-
-3) Подача
-   - Перелей в стакан и подавай сразу.
-   - По желанию добавь лёд.""",
-        [
-            {"name": "банан", "qty": 1, "unit": "шт"},
-            {"name": "йогурт", "qty": 200, "unit": "г"},
-            {"name": "молоко", "qty": 150, "unit": "мл"},
-            {"name": "мёд", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=5, difficulty="легко"
-    )
-
-    put(
-        "Суп чечевичный",
-        """Время: 40 минут
-Температура: слабое кипение
-
-Шаги:
-1) Подготовка
-   - Чечевицу промой.
-   - Лук нарежь мелко, морковь натри/нарежь.
-
-2) Обжарка
-   - В кастрюле обжарь лук 2–3 минуты.
-   - Добавь морковь, готовь 2–3 минуты.
-
-3) Варка
-   - Добавь чечевицу и томаты.
-   - Влей воду/бульон (примерно 1–1.2 л).
-   - Доведи до кипения, убавь огонь.
-   - Вари 20–25 минут до мягкости чечевицы.
-
-4) Доведение
-   - Посоли, поперчи по вкусу.
-   - Если нужно гуще, слегка разомни часть чечевицы ложкой.
-
-5) Подача
-   - Подавай горячим.""",
-        [
-            {"name": "чечевица", "qty": 200, "unit": "г"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "томаты", "qty": 200, "unit": "г"},
-        ],
-        time_min=40, difficulty="легко"
-    )
-
-    put(
-        "Тушёная капуста",
-        """Время: 45 минут
-Температура: средний огонь (потом слабый)
-
-Шаги:
-1) Подготовка
-   - Капусту нашинкуй.
-   - Лук нарежь мелко.
-   - Морковь натри/нарежь.
-   - Томаты нарежь или используй измельчённые.
-
-2) Обжарка
-   - Разогрей сковороду/кастрюлю, добавь масло.
-   - Обжарь лук 2–3 минуты.
-   - Добавь морковь и готовь 2–3 минуты.
-
-3) Тушение
-   - Добавь капусту, перемешай.
-   - Влей 3–5 ст.л. воды, накрой крышкой.
-   - Туши 20–25 минут, периодически помешивая.
-
-4) Томаты
-   - Добавь томаты.
-   - Туши ещё 10–12 минут до мягкости и желаемой густоты.
-
-5) Доведение
-   - Посоли, поперчи по вкусу.
-   - Дай постоять 5 минут под крышкой.
-
-6) Подача
-   - Подавай горячей.""",
-        [
-            {"name": "капуста", "qty": 600, "unit": "г"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "томаты", "qty": 200, "unit": "г"},
-        ],
-        time_min=45, difficulty="легко"
-    )
-
-    put(
-        "Салат капустный",
-        """Время: 10 минут
-Температура: не требуется
-
-Шаги:
-1) Подготовка
-   - Капусту нашинкуй тонко.
-   - Морковь натри на крупной тёрке.
-
-2) Смешивание
-   - Сложи капусту и морковь в миску.
-   - Добавь щепотку соли.
-   - Помни руками 1 минуту, чтобы капуста стала мягче.
-
-3) Заправка
-   - Добавь оливковое масло.
-   - Перемешай.
-
-4) Подача
-   - Подавай сразу.""",
-        [
-            {"name": "капуста", "qty": 400, "unit": "г"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "оливковое масло", "qty": 1, "unit": "ст.л."},
-        ],
-        time_min=10, difficulty="легко"
-    )
-
-    put(
-        "Картофель по-деревенски",
-        """Время: 45 минут
-Духовка: 200–220°C
-
-Шаги:
-1) Подготовка
-   - Разогрей духовку до 200–220°C.
-   - Картофель хорошо вымой (можно не чистить).
-   - Нарежь дольками одинакового размера.
-
-2) Заправка
-   - Сложи картофель в миску.
-   - Добавь оливковое масло, паприку, соль.
-   - Перемешай, чтобы специи распределились равномерно.
-
-3) Запекание
-   - Разложи дольки на противне в один слой.
-   - Запекай 30–35 минут.
-   - В середине времени переверни/перемешай.
-
-4) Подача
-   - Подавай горячим, можно с соусом.""",
-        [
-            {"name": "картофель", "qty": 700, "unit": "г"},
-            {"name": "оливковое масло", "qty": 2, "unit": "ст.л."},
-            {"name": "паприка", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=45, difficulty="легко"
-    )
-
-    put(
-        "Рыбные котлеты",
-        """Время: 35 минут
-Температура: средний огонь
-
-Шаги:
-1) Фарш
-   - Рыбу измельчи (ножом или блендером короткими импульсами).
-   - Лук нарежь очень мелко или натри.
-   - Хлеб замочи в воде/молоке и отожми.
-
-2) Смешивание
-   - Соедини рыбу, лук, яйцо, хлеб, соль и специи.
-   - Хорошо перемешай до однородности.
-
-3) Формовка
-   - Смочи руки водой.
-   - Сформуй котлеты.
-
-4) Жарка
-   - Разогрей сковороду, добавь масло.
-   - Жарь 3–4 минуты с каждой стороны до корочки.
-
-5) Доведение
-   - Убавь огонь и доведи под крышкой 5–7 минут.
-
-6) Подача
-   - Подавай горячими.""",
-        [
-            {"name": "рыба", "qty": 400, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-            {"name": "хлеб", "qty": 1, "unit": "ломтик"},
-        ],
-        time_min=35, difficulty="легко"
-    )
-
-    put(
-        "Гречка с курицей",
-        """Время: 40 минут
-Температура: средний огонь (потом слабый)
-
-Шаги:
-1) Подготовка
-   - Гречку промой.
-   - Курицу нарежь кусочками.
-   - Лук нарежь мелко.
-
-2) Обжарка
-   - Разогрей сковороду/кастрюлю с маслом.
-   - Обжарь лук 2 минуты.
-   - Добавь курицу, жарь 6–8 минут до изменения цвета.
-
-3) Гречка и вода
-   - Добавь гречку, перемешай 1 минуту.
-   - Влей воду (примерно 1:2 по объёму к гречке).
-   - Посоли.
-
-4) Варка
-   - Доведи до кипения, убавь огонь, накрой крышкой.
-   - Вари 15–18 минут до впитывания воды.
-
-5) Отдых
-   - Выключи и дай постоять 5 минут под крышкой.
-
-6) Подача
-   - Перемешай и подавай горячим.""",
-        [
-            {"name": "гречка", "qty": 250, "unit": "г"},
-            {"name": "куриное филе", "qty": 300, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-        ],
-        time_min=40, difficulty="легко"
-    )
-
-    put(
-        "Рис с курицей и овощами",
-        """Время: 30 минут (если рис уже готов)
-Температура: средне-сильный огонь
-
-Шаги:
-1) Подготовка
-   - Если рис сырой, заранее отварить до готовности.
-   - Нарежь курицу кусочками.
-   - Нарежь морковь и перец тонко.
-
-2) Обжарка курицы
-   - Разогрей сковороду, добавь масло.
-   - Обжарь курицу 6–8 минут до готовности.
-
-3) Овощи
-   - Добавь морковь и перец, готовь 3–4 минуты.
-
-4) Рис и соус
-   - Добавь рис, перемешай.
-   - Влей соевый соус, прогрей 2–3 минуты.
-
-5) Подача
-   - Подавай сразу.""",
-        [
-            {"name": "рис", "qty": 250, "unit": "г"},
-            {"name": "куриное филе", "qty": 250, "unit": "г"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "перец", "qty": 1, "unit": "шт"},
-            {"name": "соевый соус", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=30, difficulty="легко"
-    )
-
-    put(
-        "Кекс в кружке",
-        """Время: 5 минут
-Микроволновка: 700–900 Вт
-
-Шаги:
-1) Смешивание
-   - В кружке смешай муку, какао и сахар.
-   - Добавь молоко и яйцо, хорошо размешай вилкой до однородности без комков.
-
-2) Выпечка
-   - Поставь в микроволновку на 60–90 секунд.
-   - Если сыровато, добавь ещё 10–20 секунд (смотри, чтобы не пересушить).
-
-3) Отдых
-   - Дай постоять 1 минуту, чтобы структура стабилизировалась.
-
-4) Подача
-   - Ешь тёплым прямо из кружки.""",
-        [
-            {"name": "мука", "qty": 4, "unit": "ст.л."},
-            {"name": "какао", "qty": 1, "unit": "ст.л."},
-            {"name": "сахар", "qty": 2, "unit": "ст.л."},
-            {"name": "молоко", "qty": 6, "unit": "ст.л."},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-        ],
-        time_min=5, difficulty="легко"
-    )
-
-    put(
-        "Пельмени со сметаной",
-        """Время: 15 минут
-Температура: кипение
-
-Шаги:
-1) Вода
-   - Вскипяти воду в кастрюле.
-   - Посоли.
-
-2) Варка
-   - Опусти пельмени в кипящую воду.
-   - Аккуратно перемешай, чтобы не прилипли ко дну.
-   - После всплытия вари 5–7 минут (или по инструкции на упаковке).
-
-3) Подача
-   - Слей воду.
-   - Подавай горячими со сметаной.""",
-        [
-            {"name": "пельмени", "qty": 400, "unit": "г"},
-            {"name": "сметана", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=15, difficulty="легко"
-    )
-
-    put(
-        "Йогурт с ягодами",
-        """Время: 5 минут
-Температура: не требуется
-
-Шаги:
-1) Подготовка
-   - Если ягоды замороженные, разморозь 5–10 минут (по желанию).
-
-2) Смешивание
-   - Переложи йогурт в миску.
-   - Добавь ягоды и мёд.
-   - Перемешай.
-
-3) Подача
-   - Подавай сразу.""",
-        [
-            {"name": "йогурт", "qty": 200, "unit": "г"},
-            {"name": "ягоды", "qty": 120, "unit": "г"},
-            {"name": "мёд", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=5, difficulty="легко"
-    )
-    put(
-    "Курица в сливочно-чесночном соусе",
-    """\
-Подготовка: 10 минут
-Готовка: 20 минут
-Сковорода: средний огонь
-
-1) Подготовьте курицу.
-   Филе обсушите, нарежьте крупными кусками или полосками.
-   Посолите, поперчите, можно добавить щепотку паприки.
-
-2) Обжарьте курицу.
-   Разогрейте сковороду, влейте 1–2 ст. л. масла.
-   Обжарьте курицу 5–7 минут до лёгкой румяности, помешивая.
-   Переложите на тарелку.
-
-3) Сделайте соус.
-   В той же сковороде растопите сливочное масло.
-   Добавьте мелко рубленый чеснок, прогрейте 20–30 секунд (не пережарить).
-   Влейте сливки, доведите до слабого кипения.
-
-4) Сгущение соуса.
-   Добавьте тёртый сыр (если используете) и перемешайте до растворения.
-   Убавьте огонь до минимума и готовьте 2–3 минуты, пока соус чуть загустеет.
-
-5) Доведите блюдо.
-   Верните курицу в соус, прогрейте 3–5 минут до полной готовности.
-   Попробуйте на соль, при необходимости досолите.
-
-6) Подача.
-   Подавайте с рисом/пастой/пюре, посыпав зеленью.""",
-    [
-        {"name": "куриное филе", "qty": 350, "unit": "г"},
-        {"name": "сливки 20%", "qty": 200, "unit": "мл"},
-        {"name": "чеснок", "qty": 2, "unit": "зубчик"},
-        {"name": "масло сливочное", "qty": 20, "unit": "г"},
-        {"name": "сыр твёрдый (по желанию)", "qty": 40, "unit": "г"},
-        {"name": "масло растительное", "qty": 1, "unit": "ст.л."},
-    ],
-    time_min=30, difficulty="легко"
-)
-
-    put(
-        "Запечённая курица с овощами",
-        """\
-    Подготовка: 15 минут
-    Духовка: 200°C
-    Запекание: 35–45 минут
-
-    1) Разогрейте духовку до 200°C.
-
-    2) Подготовьте овощи.
-    Картофель нарежьте дольками, морковь кружочками, лук крупными перьями.
-    Если используете брокколи/кабачок — добавьте крупными кусками.
-
-    3) Замаринуйте курицу.
-    Филе/бедро посолите, поперчите, добавьте паприку и сухие травы.
-    Смешайте с 1–2 ст. л. масла.
-
-    4) Смешайте на противне.
-    Выложите овощи, добавьте соль, перец и масло, перемешайте.
-    Сверху разложите курицу.
-
-    5) Запекайте.
-    Поставьте противень на среднюю полку.
-    Запекайте 35–45 минут, пока картофель мягкий, а курица готова.
-    Если верх подрумянился рано — накройте фольгой.
-
-    6) Проверка готовности.
-    Курица должна быть без розового сока. При наличии термометра — 74°C внутри.
-
-    7) Подача.
-    Дайте постоять 5 минут и подавайте.""",
-        [
-            {"name": "куриное филе/бедро", "qty": 400, "unit": "г"},
-            {"name": "картофель", "qty": 600, "unit": "г"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "оливковое масло", "qty": 2, "unit": "ст.л."},
-            {"name": "паприка", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=55, difficulty="легко"
-    )
-
-    put(
-        "Гречка по-купечески с курицей",
-        """\
-    Подготовка: 10 минут
-    Готовка: 25–30 минут
-    Казан/сковорода с крышкой: средний огонь
-
-    1) Подготовьте продукты.
-    Курицу нарежьте кубиком. Лук и морковь мелко нарежьте.
-
-    2) Обжарьте курицу.
-    Разогрейте масло, обжарьте курицу 5–6 минут до лёгкой румяности.
-
-    3) Добавьте овощи.
-    Добавьте лук и морковь, обжарьте ещё 3–4 минуты до мягкости.
-    При необходимости подлейте 1–2 ст. л. воды, чтобы не пригорело.
-
-    4) Подготовьте гречку.
-    Промойте гречку до прозрачной воды.
-
-    5) Тушение.
-    Всыпьте гречку в сковороду, перемешайте.
-    Влейте воду (примерно 1:2 по объёму: 1 часть гречки — 2 части воды).
-    Посолите, добавьте лавровый лист/специи.
-
-    6) Доведите до готовности.
-    Доведите до кипения, накройте крышкой, убавьте огонь до минимума.
-    Томите 15–18 минут, пока вода не впитается.
-
-    7) Настаивание.
-    Выключите огонь и дайте постоять 5 минут под крышкой.
-    Разрыхлите вилкой, подавайте.""",
-        [
-            {"name": "гречка", "qty": 250, "unit": "г"},
-            {"name": "куриное филе", "qty": 300, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "масло растительное", "qty": 1, "unit": "ст.л."},
-            {"name": "вода", "qty": 500, "unit": "мл"},
-        ],
-        time_min=40, difficulty="легко"
-    )
-
-    put(
-        "Рыба в фольге с лимоном и травами",
-        """\
-    Подготовка: 10 минут
-    Духовка: 190°C
-    Запекание: 18–25 минут (зависит от толщины)
-
-    1) Разогрейте духовку до 190°C.
-
-    2) Подготовьте рыбу.
-    Филе промокните бумажным полотенцем.
-    Посолите, поперчите с двух сторон.
-
-    3) Соберите фольгу.
-    На лист фольги положите рыбу.
-    Сверху — ломтики лимона, чеснок (по желанию), зелень/сухие травы.
-    Полейте 1 ст. л. масла.
-
-    4) Запекайте.
-    Заверните фольгу конвертом, чтобы не вытек сок.
-    Выпекайте 18–25 минут.
-
-    5) Финиш (по желанию).
-    Аккуратно откройте фольгу и поставьте ещё на 3–5 минут,
-    чтобы верх слегка подсох (не обязательно).
-
-    6) Подача.
-    Подавайте с рисом/овощами. Сок из фольги используйте как соус.""",
-        [
-            {"name": "рыбное филе (треска/хек/лосось)", "qty": 400, "unit": "г"},
-            {"name": "лимон", "qty": 0.5, "unit": "шт"},
-            {"name": "оливковое масло", "qty": 1, "unit": "ст.л."},
-            {"name": "чеснок (по желанию)", "qty": 1, "unit": "зубчик"},
-            {"name": "зелень/сухие травы", "qty": 1, "unit": "щепотка"},
-        ],
-        time_min=30, difficulty="легко"
-    )
-    put(
-        "Рис с овощами и яйцом",
-        """\
-    Подготовка: 10 минут
-    Готовка: 15 минут
-    Сковорода/вок: средний огонь
-
-    Подготовьте рис.
-    Лучше использовать заранее сваренный и охлаждённый рис. Если рис свежий — разрыхлите и дайте ему подсохнуть 5 минут.
-
-    Подготовьте овощи.
-    Морковь нарежьте мелким кубиком, лук — мелко, чеснок — измельчите.
-
-    Обжарьте овощи.
-    Разогрейте масло, обжарьте лук 1–2 минуты, добавьте морковь ещё на 2–3 минуты. Добавьте чеснок и прогрейте 20–30 секунд.
-
-    Сделайте яйцо.
-    Сдвиньте овощи к краю, вбейте яйца, быстро перемешайте до небольших кусочков.
-
-    Добавьте рис.
-    Всыпьте рис, перемешайте и обжаривайте 3–5 минут.
-
-    Заправьте.
-    Влейте соевый соус, при необходимости досолите. Добавьте перец, можно чуть кунжута.
-
-    Подача.
-    Подавайте сразу, можно посыпать зелёным луком.""",
-        [
-            {"name": "рис готовый", "qty": 350, "unit": "г"},
-            {"name": "яйца", "qty": 2, "unit": "шт"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "лук", "qty": 0.5, "unit": "шт"},
-            {"name": "чеснок", "qty": 1, "unit": "зубчик"},
-            {"name": "соевый соус", "qty": 2, "unit": "ст.л."},
-            {"name": "масло растительное", "qty": 1, "unit": "ст.л."},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Картофель по-деревенски в духовке",
-        """\
-    Подготовка: 10 минут
-    Духовка: 220°C
-    Запекание: 30–40 минут
-
-    Разогрейте духовку до 220°C. Противень прогрейте заранее.
-
-    Подготовьте картофель.
-    Хорошо вымойте, нарежьте дольками одинакового размера.
-
-    Обсушите.
-    Промокните полотенцем, чтобы корочка получилась румяной.
-
-    Приправьте.
-    Смешайте картофель с маслом, солью, паприкой и сухим чесноком. Можно добавить розмарин.
-
-    Запекайте.
-    Разложите одним слоем на горячий противень. Запекайте 30–40 минут, перевернув дольки один раз в середине приготовления.
-
-    Подача.
-    Подавайте с соусом (сметана+чеснок) или с кетчупом.""",
-        [
-            {"name": "картофель", "qty": 700, "unit": "г"},
-            {"name": "оливковое/растительное масло", "qty": 2, "unit": "ст.л."},
-            {"name": "паприка", "qty": 1, "unit": "ч.л."},
-            {"name": "чеснок сухой (или свежий)", "qty": 0.5, "unit": "ч.л."},
-            {"name": "соль", "qty": None, "unit": ""},
-        ],
-        time_min=45, difficulty="легко"
-    )
-
-    put(
-        "Овощной суп быстрый",
-        """\
-    Подготовка: 10 минут
-    Готовка: 20–25 минут
-    Кастрюля: средний огонь
-
-    Подготовьте овощи.
-    Нарежьте картофель кубиком, морковь — кружочками, лук — мелко.
-
-    Обжарьте основу.
-    В кастрюле разогрейте масло, обжарьте лук 2 минуты, добавьте морковь ещё 2–3 минуты.
-
-    Добавьте картофель и воду.
-    Выложите картофель, влейте воду/бульон, посолите. Доведите до кипения.
-
-    Варка.
-    Убавьте огонь и варите 12–15 минут до мягкости картофеля.
-
-    Добавьте остальное.
-    Добавьте замороженные овощи или нарезанный кабачок/перец. Варите ещё 5–7 минут.
-
-    Финиш.
-    Добавьте зелень, перец. Дайте постоять под крышкой 5 минут.
-
-    Подача.
-    Подавайте со сметаной или без.""",
-        [
-            {"name": "картофель", "qty": 3, "unit": "шт"},
-            {"name": "морковь", "qty": 1, "unit": "шт"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "овощи замороженные (по желанию)", "qty": 250, "unit": "г"},
-            {"name": "вода/бульон", "qty": 1200, "unit": "мл"},
-            {"name": "масло растительное", "qty": 1, "unit": "ст.л."},
-        ],
-        time_min=35, difficulty="легко"
-    )
-
-    put(
-        "Куриные котлеты сочные",
-        """\
-    Подготовка: 10 минут
-    Готовка: 20 минут
-    Сковорода: средний огонь
-
-    Подготовьте массу.
-    Смешайте куриный фарш с тёртым луком, яйцом, солью и перцем. Добавьте замоченный в воде/молоке хлеб и отожмите.
-
-    Отдохнуть.
-    Дайте массе постоять 5 минут, чтобы котлеты лучше держали форму.
-
-    Сформуйте котлеты.
-    Смочите руки водой, сформуйте котлеты одинакового размера.
-
-    Обжарьте.
-    Разогрейте масло, обжарьте котлеты 3–4 минуты с каждой стороны до румяной корочки.
-
-    Доведите до готовности.
-    Добавьте 3–4 ст. л. воды, накройте крышкой и потомите 6–8 минут на слабом огне.
-
-    Подача.
-    Подавайте с пюре/рисом и салатом.""",
-        [
-            {"name": "куриный фарш", "qty": 500, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-            {"name": "хлеб белый", "qty": 1, "unit": "ломтик"},
-            {"name": "масло растительное", "qty": 1, "unit": "ст.л."},
-        ],
-        time_min=30, difficulty="легко"
-    )
-
-    put(
-        "Омлет пышный в духовке",
-        """\
-    Подготовка: 5 минут
-    Духовка: 180°C
-    Запекание: 15–20 минут
-
-    Разогрейте духовку до 180°C.
-
-    Подготовьте смесь.
-    В миске аккуратно смешайте яйца, молоко и соль. Не взбивайте слишком сильно, чтобы омлет не опал.
-
-    Форма.
-    Смажьте форму маслом, влейте смесь. Можно добавить сыр или зелень.
-
-    Запекайте.
-    Поставьте форму на среднюю полку и запекайте 15–20 минут, пока омлет не схватится и слегка не подрумянится.
-
-    Подача.
-    Нарежьте порционно и подавайте сразу.""",
-        [
-            {"name": "яйца", "qty": 4, "unit": "шт"},
-            {"name": "молоко", "qty": 200, "unit": "мл"},
-            {"name": "соль", "qty": None, "unit": ""},
-            {"name": "масло сливочное (для формы)", "qty": 10, "unit": "г"},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Кесадилья с курицей и сыром",
-        """\
-    Подготовка: 10 минут
-    Готовка: 10 минут
-    Сковорода: средний огонь
-
-    Подготовьте начинку.
-    Курицу нарежьте мелко. Если сыра много — натрите.
-
-    Сборка.
-    На одну тортилью насыпьте часть сыра, выложите курицу и овощи, сверху ещё немного сыра. Накройте второй тортильей.
-
-    Обжарка.
-    На сухой сковороде прогрейте кесадилью 2–3 минуты, переверните и прогрейте ещё 2–3 минуты до расплавления сыра.
-
-    Подача.
-    Нарежьте на треугольники. Можно подать с йогуртом или соусом.""",
-        [
-            {"name": "тортильи", "qty": 2, "unit": "шт"},
-            {"name": "куриное филе (готовое)", "qty": 200, "unit": "г"},
-            {"name": "сыр", "qty": 150, "unit": "г"},
-            {"name": "перец сладкий (по желанию)", "qty": 0.5, "unit": "шт"},
-        ],
-        time_min=20, difficulty="легко"
-    )
-
-    put(
-        "Паста с чесноком и сливками",
-        """\
-    Подготовка: 5 минут
-    Готовка: 15 минут
-    Плита: средний огонь
-
-    Сварите пасту.
-    В кипящей подсоленной воде сварите пасту до состояния аль денте. Сохраните 100 мл воды от варки.
-
-    Сделайте соус.
-    На сковороде растопите масло, добавьте чеснок и прогрейте 20–30 секунд. Влейте сливки, доведите до слабого кипения.
-
-    Смешайте.
-    Добавьте пасту в соус, перемешайте. Если густо — добавьте немного воды от варки.
-
-    Финиш.
-    Добавьте тёртый сыр, перец. Прогрейте 1 минуту.
-
-    Подача.
-    Подавайте сразу.""",
-        [
-            {"name": "паста", "qty": 250, "unit": "г"},
-            {"name": "сливки 20%", "qty": 200, "unit": "мл"},
-            {"name": "чеснок", "qty": 2, "unit": "зубчик"},
-            {"name": "масло сливочное", "qty": 20, "unit": "г"},
-            {"name": "сыр", "qty": 60, "unit": "г"},
-        ],
-        time_min=20, difficulty="легко"
-    )
-
-    put(
-        "Рыба на сковороде с корочкой",
-        """\
-    Подготовка: 5 минут
-    Готовка: 10–12 минут
-    Сковорода: средний огонь
-
-    Подготовьте рыбу.
-    Филе обсушите, посолите, поперчите. При желании слегка обваляйте в муке.
-
-    Обжарьте.
-    Разогрейте масло. Положите рыбу и жарьте 3–4 минуты до корочки, переверните.
-
-    Доведите.
-    Жарьте ещё 3–4 минуты. Если кусок толстый — накройте крышкой на 2 минуты.
-
-    Подача.
-    Сбрызните лимоном, подавайте с гарниром.""",
-        [
-            {"name": "рыбное филе", "qty": 400, "unit": "г"},
-            {"name": "мука (по желанию)", "qty": 1, "unit": "ст.л."},
-            {"name": "масло растительное", "qty": 1, "unit": "ст.л."},
-            {"name": "лимон", "qty": 0.5, "unit": "шт"},
-        ],
-        time_min=20, difficulty="легко"
-    )
-
-    put(
-        "Творожные сырники",
-        """\
-    Подготовка: 10 минут
-    Готовка: 15 минут
-    Сковорода: средний огонь
-
-    Смешайте массу.
-    Разомните творог, добавьте яйцо, сахар и щепотку соли. Всыпьте муку, перемешайте до густой массы.
-
-    Сформуйте сырники.
-    Слегка присыпьте руки мукой, сформуйте шайбочки.
-
-    Обжарьте.
-    Разогрейте масло. Жарьте по 3–4 минуты с каждой стороны до румяности.
-
-    Доведите (по желанию).
-    Чтобы внутри точно пропеклись, накройте крышкой на 2 минуты на слабом огне.
-
-    Подача.
-    Подавайте со сметаной, мёдом или вареньем.""",
-        [
-            {"name": "творог", "qty": 400, "unit": "г"},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-            {"name": "мука", "qty": 3, "unit": "ст.л."},
-            {"name": "сахар", "qty": 1, "unit": "ст.л."},
-            {"name": "масло растительное", "qty": 1, "unit": "ст.л."},
-        ],
-        time_min=25, difficulty="легко"
-    )
-
-    put(
-        "Суп-пюре из тыквы со сливками",
-        """\
-    Подготовка: 10 минут
-    Готовка: 25 минут
-    Кастрюля: средний огонь
-
-    Подготовьте овощи.
-    Тыкву нарежьте кубиком, лук — мелко.
-
-    Обжарьте лук.
-    В кастрюле разогрейте масло, обжарьте лук 2–3 минуты до мягкости.
-
-    Добавьте тыкву и бульон.
-    Выложите тыкву, влейте бульон/воду так, чтобы только покрывало. Посолите.
-
-    Варка.
-    Доведите до кипения, варите 15–18 минут до мягкости.
-
-    Пробейте.
-    Снимите с огня, пробейте блендером до однородности.
-
-    Сливки.
-    Верните на огонь, добавьте сливки, прогрейте 2–3 минуты, не кипятите сильно.
-
-    Подача.
-    Подавайте с сухариками или семечками.""",
-        [
-            {"name": "тыква", "qty": 500, "unit": "г"},
-            {"name": "лук", "qty": 1, "unit": "шт"},
-            {"name": "бульон/вода", "qty": 700, "unit": "мл"},
-            {"name": "сливки 10–20%", "qty": 120, "unit": "мл"},
-            {"name": "масло сливочное/растительное", "qty": 20, "unit": "г"},
-        ],
-        time_min=35, difficulty="легко"
-    )
-
-    put(
-        "Курица в духовке с картофелем",
-        """\
-    Подготовка: 10 минут
-    Духовка: 200°C
-    Запекание: 40–50 минут
-
-    Разогрейте духовку до 200°C.
-
-    Подготовьте картофель.
-    Нарежьте крупными кубиками или дольками. Посолите и перемешайте с маслом.
-
-    Подготовьте курицу.
-    Посолите, поперчите, добавьте паприку и сухие травы. Перемешайте с маслом.
-
-    Сборка.
-    Выложите картофель в форму, сверху — курицу. Можно добавить чеснок дольками.
-
-    Запекайте.
-    Запекайте 40–50 минут. В середине приготовления перемешайте картофель.
-
-    Проверка.
-    Курица должна быть готова (без розового сока), картофель мягкий.
+def _plain(ings: list[dict]) -> list[dict]:
+    """Только исходные поля ингредиентов, без вычисленных ключей."""
+    return [{"name": i["name"], "qty": i["qty"], "unit": i["unit"]} for i in ings]
+
+
+def _bulk_load(c, recipes: list[dict]) -> dict:
+    """Вставляет/обновляет рецепты пачками executemany; неизменённые не трогает."""
+    incoming = {}
+    for r in recipes:
+        ings = [{"name": i.get("name"), "qty": i.get("qty"), "unit": i.get("unit")} for i in r.get("ingredients") or []]
+        incoming[r["title"]] = (r.get("steps") or "", r.get("time_min"), r.get("difficulty"), ings)
+
+    existing = {r["title"]: r for r in _load_recipes(c, tables=_OVERLAY)}
+    to_insert, to_update, unchanged = [], [], 0
+    for title, (steps, tm, diff, ings) in incoming.items():
+        cur = existing.get(title)
+        if cur is None:
+            to_insert.append(title)
+        elif (cur["steps"], cur["time_min"], cur["difficulty"], _plain(cur["ingredients"])) == (steps, tm, diff, ings):
+            unchanged += 1
+        else:
+            to_update.append((cur["id"], title))
 
-    Подача.
-    Дайте постоять 5 минут и подавайте.""",
-        [
-            {"name": "куриное филе/бедро", "qty": 400, "unit": "г"},
-            {"name": "картофель", "qty": 600, "unit": "г"},
-            {"name": "оливковое масло", "qty": 2, "unit": "ст.л."},
-            {"name": "чеснок (по желанию)", "qty": 2, "unit": "зубчик"},
-            {"name": "паприка", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=60, difficulty="легко"
-    )
+    if to_update:
+        c.executemany(
+            "UPDATE recipes SET steps=?, time_min=?, difficulty=? WHERE id=?",
+            [(*incoming[t][:3], rid) for (rid, t) in to_update],
+        )
+        c.executemany("DELETE FROM recipe_ingredients WHERE recipe_id=?", [(rid,) for (rid, _) in to_update])
 
-    put(
-        "Овсянка с бананом и мёдом",
-        """\
-    Подготовка: 2 минуты
-    Готовка: 8–10 минут
-    Кастрюля: слабый огонь
-
-    Доведите молоко (или воду) до кипения.
-
-    Добавьте овсянку.
-    Всыпьте хлопья, перемешайте и варите 6–8 минут на слабом огне, помешивая.
-
-    Финиш.
-    Снимите с огня, добавьте щепотку соли. Нарежьте банан и добавьте в кашу.
-
-    Подача.
-    Полейте мёдом, можно добавить орехи или корицу.""",
-        [
-            {"name": "овсяные хлопья", "qty": 60, "unit": "г"},
-            {"name": "молоко/вода", "qty": 250, "unit": "мл"},
-            {"name": "банан", "qty": 1, "unit": "шт"},
-            {"name": "мёд", "qty": 1, "unit": "ч.л."},
-        ],
-        time_min=10, difficulty="легко"
-    )
+    ids = {t: rid for (rid, t) in to_update}
+    if to_insert:
+        c.executemany(
+            "INSERT INTO recipes(title, steps, time_min, difficulty) VALUES(?,?,?,?)",
+            [(t, *incoming[t][:3]) for t in to_insert],
+        )
+        ids.update(
+            (t, rid) for (rid, t) in c.execute(
+                "SELECT id, title FROM recipes WHERE title IN (SELECT value FROM json_each(?))",
+                (json.dumps(to_insert, ensure_ascii=False),),
+            )
+        )
 
-    put(
-        "Блины тонкие на молоке",
-        """\
-    Подготовка: 10 минут
-    Готовка: 20–25 минут
-    Сковорода: средний огонь
-
-    Сделайте тесто.
-    Смешайте яйца, сахар и щепотку соли. Влейте половину молока и перемешайте.
-
-    Добавьте муку.
-    Всыпьте муку порциями, размешайте до однородности без комков.
-
-    Долейте молоко.
-    Влейте оставшееся молоко, добавьте масло и перемешайте. Тесто должно быть жидким.
-
-    Дайте постоять.
-    Оставьте тесто на 5–10 минут.
-
-    Жарка.
-    Разогрейте сковороду, слегка смажьте маслом.
-    Наливайте тонкий слой теста, жарьте 40–60 секунд, переворачивайте и ещё 20–30 секунд.
-
-    Подача.
-    Подавайте с начинкой, сметаной или вареньем.""",
-        [
-            {"name": "молоко", "qty": 500, "unit": "мл"},
-            {"name": "яйца", "qty": 2, "unit": "шт"},
-            {"name": "мука", "qty": 220, "unit": "г"},
-            {"name": "сахар", "qty": 1, "unit": "ст.л."},
-            {"name": "масло растительное", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=35, difficulty="легко"
+    c.executemany(
+        "INSERT INTO recipe_ingredients(recipe_id, name, qty, unit) VALUES(?,?,?,?)",
+        [(rid, i["name"], i["qty"], i["unit"]) for (t, rid) in ids.items() for i in incoming[t][3]],
     )
+    _index_recipes(c, list(ids.values()))
+    return {"inserted": len(to_insert), "updated": len(to_update), "unchanged": unchanged}
 
-    put(
-        "Салат с тунцом и яйцом",
-        """\
-    Подготовка: 10 минут
-    Готовка: 10 минут (если яйца уже сварены)
-
-    Сварите яйца.
-    Варите 8–10 минут после закипания, охладите и очистите.
-
-    Подготовьте продукты.
-    Огурец нарежьте кубиком. Тунец слейте и разомните вилкой.
-
-    Сборка.
-    Смешайте тунец, огурец, кукурузу и нарезанные яйца.
-
-    Заправка.
-    Добавьте майонез или йогурт, посолите и поперчите. Перемешайте аккуратно.
-
-    Подача.
-    Подавайте сразу или охладите 10 минут в холодильнике.""",
-        [
-            {"name": "тунец консервированный", "qty": 1, "unit": "банка"},
-            {"name": "яйца", "qty": 2, "unit": "шт"},
-            {"name": "огурец", "qty": 1, "unit": "шт"},
-            {"name": "кукуруза", "qty": 150, "unit": "г"},
-            {"name": "майонез/йогурт", "qty": 2, "unit": "ст.л."},
-        ],
-        time_min=20, difficulty="легко"
-    )
 
-    put(
-        "Кекс в кружке (микроволновка)",
-        """\
-    Подготовка: 3 минуты
-    Готовка: 1–2 минуты
-    Микроволновка: 800–900 Вт
-
-    Смешайте сухие ингредиенты в кружке.
-    Мука, сахар и какао — тщательно перемешайте.
-
-    Добавьте жидкие.
-    Добавьте молоко и яйцо, перемешайте до однородности без комков.
-
-    Готовка.
-    Поставьте в микроволновку на 60–90 секунд.
-    Если середина сыровата — добавьте ещё 10–15 секунд.
-
-    Отдых.
-    Дайте постоять 1 минуту, чтобы кекс стабилизировался.
-
-    Подача.
-    Можно посыпать сахарной пудрой или добавить ложку йогурта.""",
-        [
-            {"name": "мука", "qty": 4, "unit": "ст.л."},
-            {"name": "какао", "qty": 1, "unit": "ст.л."},
-            {"name": "сахар", "qty": 2, "unit": "ст.л."},
-            {"name": "молоко", "qty": 6, "unit": "ст.л."},
-            {"name": "яйца", "qty": 1, "unit": "шт"},
-        ],
-        time_min=5, difficulty="легко"
-    )
+def bulk_load_recipes(recipes: list[dict]) -> dict:
+    """Записывает набор рецептов в пользовательский оверлей одной транзакцией.
 
-    return added
+    Рецепты сопоставляются по title. Возвращает {"inserted", "updated", "unchanged"}.
+    """
+    with _conn() as conn, closing(conn.cursor()) as c:
+        stats = _bulk_load(c, recipes)
+        conn.commit()
+        return stats
+
+
+# Исходник встроенного каталога: gzip-JSON со списком
+# {"title", "steps", "ingredients": [{"name", "qty", "unit"}], "time_min", "difficulty"}.
+# Из него build_catalog.py собирает CATALOG_PATH; в рантайме он нужен только если
+# собранного каталога нет (тогда рецепты заливаются в app.db, как раньше).
+# Чтобы поправить рецепты: распаковать, отредактировать, упаковать обратно (gzip, mtime=0)
+# и пересобрать каталог.
+SEED_PATH = os.path.join(_DATA_DIR, "recipes_seed.json.gz")
+
+# Увеличить, если поменялся сам формат/логика сидирования (а не только рецепты).
+SEED_VERSION = 2
+SEED_HASH_KEY = "recipes_seed_hash"
+
+_catalog_lock = threading.Lock()
+_catalog_ready = False
+
+
+def seed_catalog() -> list[dict]:
+    """Встроенный каталог рецептов (демо + мировая кухня)."""
+    with gzip.open(SEED_PATH, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def catalog_hash() -> str:
+    """Хэш файла каталога — без распаковки и разбора JSON."""
+    with open(SEED_PATH, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return f"{SEED_VERSION}:{digest}"
+
+
+def _catalog_version(c) -> str | None:
+    """Версия подключённого каталога или None, если каталог не подключён."""
+    if not c.execute("SELECT 1 FROM pragma_database_list WHERE name='catalog'").fetchone():
+        return None
+    return _catalog_info(c, "version") or ""
+
+
+def _same_recipe(a: dict, b: dict) -> bool:
+    keys = ("steps", "time_min", "difficulty")
+    return all(a[k] == b[k] for k in keys) and _plain(a["ingredients"]) == _plain(b["ingredients"])
+
+
+def _prune_overlay(c) -> int:
+    """Убирает из app.db копии рецептов, которые раньше сидировались туда и теперь есть в каталоге.
+
+    Отличающиеся от каталога рецепты остаются — они перекрывают каталожные.
+    """
+    stock = {r["title"]: r for r in _load_recipes(c, tables=_CATALOG)}
+    dup = [
+        (r["id"],) for r in _load_recipes(c, tables=_OVERLAY)
+        if r["title"] in stock and _same_recipe(r, stock[r["title"]])
+    ]
+    c.executemany("DELETE FROM main.recipe_keys WHERE recipe_id=?", dup)
+    c.executemany("DELETE FROM main.recipe_bands WHERE recipe_id=?", dup)
+    c.executemany("DELETE FROM main.recipe_ingredients WHERE recipe_id=?", dup)
+    c.executemany("DELETE FROM main.recipes WHERE id=?", dup)
+    return len(dup)
+
+
+def ensure_recipe_catalog() -> bool:
+    """Готовит каталог рецептов к чтению; в обычном запуске ничего не пишет.
+
+    С подключённым каталогом: при смене его версии один раз чистит оверлей от старых
+    засеянных копий. Без каталога: заливает SEED_PATH в app.db, если изменился его хэш.
+    При смене INDEX_VERSION (matcher/units) пересчитывает ключи и количества ингредиентов оверлея.
+    Повторные вызовы в том же процессе ничего не делают (или ждут уже идущий вызов).
+    Возвращает True, если что-то было записано.
+    """
+    global _catalog_ready
+    with _catalog_lock:
+        if _catalog_ready:
+            return False
+        init_recipes_db()
+        init_settings_db()
+        changed = False
+        with _conn() as conn, closing(conn.cursor()) as c:
+            version = _catalog_version(c)
+        if version is not None:
+            if get_setting(CATALOG_VERSION_KEY) != version:
+                with _conn() as conn, closing(conn.cursor()) as c:
+                    _prune_overlay(c)
+                    conn.commit()
+                set_setting(CATALOG_VERSION_KEY, version)
+                changed = True
+        elif os.path.exists(SEED_PATH):
+            h = catalog_hash()
+            if get_setting(SEED_HASH_KEY) != h:
+                bulk_load_recipes(seed_catalog())
+                set_setting(SEED_HASH_KEY, h)
+                changed = True
+        if get_setting(KEYS_VERSION_KEY) != INDEX_VERSION:
+            with _conn() as conn, closing(conn.cursor()) as c:
+                _reindex_overlay(c)
+                conn.commit()
+            set_setting(KEYS_VERSION_KEY, INDEX_VERSION)
+            changed = True
+        _catalog_ready = True
+        return changed
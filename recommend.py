@@ -1,121 +1,320 @@
-from datetime import datetime, date
-from products_db import list_products
-from recipes_db import get_all_recipes
-
-ALIASES = {
-    "авокадо": "авокадо",
-    "анчоусы": "анчоусы",
-    "батон": "хлеб",
-    "бекон": "бекон",
-    "болгарский перец": "перец",
-    "бульон": "куриный бульон",
-    "горошек": "горошек",
-    "греческий йогурт": "йогурт",
-    "дрожжи": "дрожжи",
-    "зеленый лук": "зелень",
-    "зелёный лук": "зелень",
-    "зелень": "зелень",
-    "какао-порошок": "какао",
-    "капуста": "капуста",
-    "кефир 1%": "кефир",
-    "кефир 2,5%": "кефир",
-    "кефир": "кефир",
-    "колбаса": "колбаса",
-    "консервированный тунец": "тунец консервированный",
-    "краб-палочки": "крабовые палочки",
-    "крабовые палочки": "крабовые палочки",
-    "лаваш тонкий": "лаваш",
-    "лаваш": "лаваш",
-    "лепешки": "тортильи",
-    "листы лазаньи": "листы лазаньи",
-    "лук репчатый": "лук",
-    "макароны": "паста",
-    "масло растительное": "масло",
-    "масло сливочное": "масло",
-    "мед": "мёд",
-    "моцарелла": "сыр моцарелла",
-    "нори лист": "нори",
-    "нори": "нори",
-    "овсяные хлопья": "овсянка",
-    "огурцы": "огурец",
-    "оливковое масло": "масло",
-    "паприка": "паприка",
-    "пельмешки": "пельмени",
-    "пельмени": "пельмени",
-    "перец болгарский": "перец",
-    "помидор": "томаты",
-    "помидоры": "томаты",
-    "рис арборио": "рис",
-    "рисовая лапша": "лапша",
-    "растительное масло": "масло",
-    "сметана 15%": "сметана",
-    "сметана 20%": "сметана",
-    "сметана": "сметана",
-    "соус терияки": "соевый соус",
-    "спагетти": "паста",
-    "сливки": "сливки",
-    "сыр пармезан": "сыр",
-    "сыр моцарелла": "сыр моцарелла",
-    "сыр фета": "сыр фета",
-    "тахини": "тахини",
-    "томат": "томаты",
-    "томатная паста": "томаты",
-    "томаты": "томаты",
-    "тортилья": "тортильи",
-    "тунец": "тунец консервированный",
-    "тунец консервированный": "тунец консервированный",
-    "хлеб тостовый": "хлеб",
-    "хлеб": "хлеб",
-    "хлопья овсяные": "овсянка",
-    "терияки": "соевый соус",
-    "яйца куриные": "яйца",
-    "яйцо": "яйца",
-    "ягоды": "ягоды",
-    "йогурт натуральный": "йогурт",
-    "йогурт": "йогурт",
-}
-
-
-def norm(s: str) -> str:
-    k = (s or "").strip().lower()
-    return ALIASES.get(k, k)
-
-def _parse_date(s: str):
-    try:
-        return datetime.strptime((s or "").strip(), "%d.%m.%Y").date()
-    except Exception:
-        return None
+import heapq
+import threading
+from datetime import date
+from itertools import islice
+from products_db import list_products_by_expiry, subscribe as subscribe_products
+from recipes_db import (
+    filter_recipe_ids,
+    find_recipe_ids,
+    get_recipes_by_ids,
+    get_recipes_excluding,
+    recipes_revision,
+    score_recipes_sql,
+)
+from matcher import product_key_ids
+from units import enough, normalize
+
+
+def _product_keys(p: dict) -> tuple[int, ...]:
+    """id ключей, которые закрывает продукт (matcher: стемминг, синонимы, без уточнений)."""
+    name = (p.get("name") or "").strip()
+    return product_key_ids(name) if name else ()
+
+
+def _pick(prods: list[dict]) -> dict:
+    """Из продуктов одного ключа (по сроку) — первый с датой, иначе первый."""
+    return next((p for p in prods if p.get("days_left") is not None), prods[0])
+
+
+def _group_products(prods: list[dict]) -> dict[int, list[dict]]:
+    by_key: dict[int, list[dict]] = {}
+    for p in prods:
+        for key in _product_keys(p):
+            by_key.setdefault(key, []).append(p)
+    return by_key
 
-def suggest_recipes(top_n: int = 10):
-    """Возвращает [{recipe, score, coverage, have[], missing[]}, ...]."""
+
+def _load_products() -> list[dict]:
     try:
-        prods = list_products(limit=2000)
+        return list_products_by_expiry(limit=2000)
     except Exception:
-        prods = []
-    have_map = {norm(p.get("name")): p for p in prods if (p.get("name") or "").strip()}
-    today = date.today()
-
-    out = []
-    for r in get_all_recipes():
-        ings = r.get("ingredients", [])
-        if not ings:
+        return []
+
+
+def _stock(prods: list[dict]) -> dict[str, float] | None:
+    """Сколько есть продуктов одного ключа, по мерам units; None — у кого-то количество не указано."""
+    total: dict[str, float] = {}
+    for p in prods:
+        amount = normalize(_product_keys(p)[0], p.get("qty"), p.get("unit"))
+        if amount is None:
+            return None
+        total[amount[1]] = total.get(amount[1], 0.0) + amount[0]
+    return total
+
+
+def products_by_key() -> dict[int, list[dict]]:
+    """{id ключа: продукты холодильника с этим ключом} в порядке срока годности."""
+    return _group_products(_load_products())
+
+
+def inventory(by_key: dict[int, list[dict]] | None = None) -> tuple[dict[int, dict], dict[int, dict | None]]:
+    """({id ключа: продукт}, {id ключа: запас}); при дублях берём продукт с самым близким сроком.
+
+    by_key — уже сгруппированные products_by_key(), если они нужны вызывающему и сами по себе.
+    """
+    # список отсортирован по сроку
+    by_key = products_by_key() if by_key is None else by_key
+    return {k: _pick(v) for k, v in by_key.items()}, {k: _stock(v) for k, v in by_key.items()}
+
+
+def _bonus(p: dict) -> int:
+    days = p.get("days_left")
+    return max(0, 10 - days) if days is not None else 0
+
+
+def match_recipe(r: dict, have_map: dict, stock: dict) -> dict:
+    """Оценка рецепта по inventory(): {recipe, coverage, score, have[], missing[], matched}."""
+    # ключи и количества ингредиентов посчитаны при записи рецепта (need):
+    # здесь только сравнение id и деление на готовый запас
+    ings = r.get("ingredients", [])
+    hits, missing, bonus, matched, required = [], [], 0, 0, 0
+    got = required_got = 0.0
+    for i in ings:
+        key = next((k for k in i["ingredient_ids"] if k in have_map), None)
+        if not i["optional"]:
+            required += 1
+        if key is None:
+            missing.append(i)
             continue
+        matched += 1
+        bonus += _bonus(have_map[key])
+        part = enough(i["need"], stock.get(key))
+        got += part
+        if not i["optional"]:
+            required_got += part
+        # есть, но не хватает — тоже «докупить»
+        (hits if part >= 1.0 else missing).append(i)
+
+    # необязательные ингредиенты ("по желанию") на покрытие не влияют
+    coverage = required_got / required if required else got / len(ings)
+    score = int(coverage * 100 + bonus)
+    return {"recipe": r, "coverage": coverage, "score": score, "have": hits, "missing": missing, "matched": matched}
+
+
+def _zero(r: dict) -> dict:
+    return {"recipe": r, "coverage": 0.0, "score": 0, "have": [], "missing": list(r["ingredients"]), "matched": 0}
+
+
+def _rank_key(x: dict):
+    # (coverage >= 0.7, score) по убыванию, при равенстве — по id рецепта
+    return (x["coverage"] < 0.7, -x["score"], x["recipe"]["id"])
+
+
+def _suggest_python(have_map: dict, stock: dict, top_n: int, filters: dict | None = None):
+    # оцениваем только рецепты, где есть хоть один продукт из холодильника (обратный индекс)
+    candidate_ids = find_recipe_ids(list(have_map), filters) if have_map else []
+    scored = (
+        match_recipe(r, have_map, stock)
+        for r in get_recipes_by_ids(candidate_ids, with_steps=False) if r.get("ingredients")
+    )
+    return heapq.nsmallest(top_n, scored, key=_rank_key), candidate_ids
+
+
+def _materialize(top: list[tuple[int, float, int]], have_map: dict, stock: dict) -> list[dict]:
+    """[(recipe_id, coverage, score)] готовой выдачи -> результаты; из БД читаются только эти рецепты."""
+    by_id = {r["id"]: r for r in get_recipes_by_ids([rid for (rid, _, _) in top], with_steps=False)}
+    return [
+        {**match_recipe(by_id[rid], have_map, stock), "coverage": coverage, "score": score}
+        for (rid, coverage, score) in top
+    ]
+
+
+def _numpy_available() -> bool:
+    # recipe_matrix/recipe_shards (и numpy) грузятся только при выборе их подбора, не при запуске
+    import recipe_matrix
+    return recipe_matrix.available()
+
+
+def _suggest_numpy(have_map: dict, stock: dict, top_n: int, filters: dict | None = None):
+    import recipe_matrix
+    # все рецепты оцениваются векторно, отфильтрованные не попадают в кандидаты
+    top, candidate_ids = recipe_matrix.get_matrix().rank(
+        {k: _bonus(p) for k, p in have_map.items()}, stock, top_n, filter_recipe_ids(filters)
+    )
+    return _materialize(top, have_map, stock), candidate_ids
+
+
+def _suggest_parallel(have_map: dict, stock: dict, top_n: int, filters: dict | None = None):
+    # то же, что numpy, но шарды каталога считаются в пуле процессов (recipe_shards)
+    import recipe_shards
+    top, candidate_ids = recipe_shards.rank(
+        {k: _bonus(p) for k, p in have_map.items()}, stock, top_n, filter_recipe_ids(filters)
+    )
+    return _materialize(top, have_map, stock), candidate_ids
+
+
+def _suggest_sql(have_map: dict, stock: dict, top_n: int, filters: dict | None = None):
+    # оценка, сортировка и LIMIT — одним запросом в SQLite по временной таблице инвентаря
+    if not have_map:
+        return [], []
+    top = score_recipes_sql({k: _bonus(p) for k, p in have_map.items()}, stock, top_n, filters)
+    return _materialize(top, have_map, stock), find_recipe_ids(list(have_map), filters)
+
+
+def suggest_recipes(top_n: int = 10, backend: str = "auto", filters: dict | None = None):
+    """Возвращает [{recipe, score, coverage, have[], missing[]}, ...].
+
+    coverage учитывает количество: ингредиент, которого есть меньше, чем нужно, закрыт частично
+    и попадает в missing. Продукты без указанного количества считаются имеющимися в достатке.
+
+    filters — ограничения на рецепты, отсекаются до оценки (см. recipes_db._filter_sql):
+    {"max_time": 20, "difficulty": ["легко"], "diet": ["vegetarian"], "exclude": ["свинина"]}.
+
+    backend: "python" — цикл по рецептам-кандидатам, "numpy" — разреженная матрица
+    (recipe_matrix), "sql" — GROUP BY в SQLite (recipes_db.score_recipes_sql),
+    "parallel" — numpy по шардам в нескольких процессах (recipe_shards; для каталогов
+    в сотни тысяч рецептов, маленькие всё равно считаются в одном процессе),
+    "auto" — numpy, если он установлен, иначе python. Результат одинаковый.
+    """
+    have_map, stock = inventory()
+    if backend == "parallel" and _numpy_available():
+        out, candidate_ids = _suggest_parallel(have_map, stock, top_n, filters)
+    elif backend == "numpy" or (backend == "auto" and _numpy_available()):
+        out, candidate_ids = _suggest_numpy(have_map, stock, top_n, filters)
+    elif backend == "sql":
+        out, candidate_ids = _suggest_sql(have_map, stock, top_n, filters)
+    else:
+        out, candidate_ids = _suggest_python(have_map, stock, top_n, filters)
+    if len(out) < top_n:
+        # рецепты без совпадений идут в конец, догружаем их только если не хватило
+        out.extend(
+            _zero(r)
+            for r in get_recipes_excluding(candidate_ids, top_n - len(out), with_steps=False, filters=filters)
+        )
+    return out
+
+
+class SuggestionCache:
+    """Подбор рецептов, который поддерживается по изменениям холодильника, а не считается заново.
+
+    Хранит результат match_recipe для всех рецептов с совпадениями. insert_product/delete_product
+    (через products_db.subscribe) пересчитывают только рецепты с ключами изменённого продукта,
+    и только если сменился продукт, который этот ключ представляет, или запас. Целиком кэш сбрасывается
+    при смене набора рецептов (recipes_revision) или даты (бонус за срок зависит от сегодня).
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._stamp: tuple | None = None
+        self._products: dict[int, list[dict]] = {}
+        self._have: dict[int, dict] = {}
+        self._stock: dict[int, dict | None] = {}
+        self._entries: dict[int, dict] = {}
+
+    def _rebuild(self, stamp: tuple):
+        self._products = _group_products(_load_products())
+        self._have = {k: _pick(v) for k, v in self._products.items()}
+        self._stock = {k: _stock(v) for k, v in self._products.items()}
+        candidate_ids = find_recipe_ids(list(self._have)) if self._have else []
+        self._entries = {
+            r["id"]: match_recipe(r, self._have, self._stock)
+            for r in get_recipes_by_ids(candidate_ids, with_steps=False) if r.get("ingredients")
+        }
+        self._stamp = stamp
+
+    def on_product_change(self, event: str, product: dict):
+        keys = _product_keys(product)
+        if not keys:
+            return
+        with self._lock:
+            if self._stamp is None:
+                return
+            today = self._stamp[1]
+            if today != date.today():
+                self._stamp = None
+                return
+
+            iso = product.get("exp_iso")
+            changed = []
+            for key in keys:
+                prods = [p for p in self._products.get(key, []) if p["id"] != product["id"]]
+                if event == "insert":
+                    p = {**product, "days_left": (date.fromisoformat(iso) - today).days if iso else None}
+                    # тот же порядок, что у list_products_by_expiry: без даты — в начале
+                    pos = sum(1 for q in prods if (q.get("exp_iso") or "") <= (iso or ""))
+                    prods.insert(pos, p)
+                if prods:
+                    self._products[key] = prods
+                else:
+                    self._products.pop(key, None)
+
+                prev, prev_stock = self._have.get(key), self._stock.get(key)
+                new = _pick(prods) if prods else None
+                new_stock = _stock(prods) if prods else None
+                if (prev and prev["id"]) == (new and new["id"]) and prev_stock == new_stock:
+                    continue
+                if new is None:
+                    self._have.pop(key, None)
+                    self._stock.pop(key, None)
+                else:
+                    self._have[key] = new
+                    self._stock[key] = new_stock
+                changed.append(key)
+            if not changed:
+                return
+
+            affected = find_recipe_ids(changed)
+            recipes = {rid: self._entries[rid]["recipe"] for rid in affected if rid in self._entries}
+            recipes.update(
+                (r["id"], r) for r in get_recipes_by_ids([rid for rid in affected if rid not in recipes], with_steps=False)
+            )
+            for rid, r in recipes.items():
+                m = match_recipe(r, self._have, self._stock) if r.get("ingredients") else None
+                if m and m["matched"]:
+                    self._entries[rid] = m
+                else:
+                    self._entries.pop(rid, None)
+
+    def iter_ranked(self, batch: int = 50, filters: dict | None = None):
+        """Подбор в порядке выдачи, лениво.
+
+        Рецепты с совпадениями достаются из кучи по одному (heapify O(n), дальше O(log n)
+        на штуку), рецепты без совпадений дочитываются из БД пачками по batch.
+        filters отсекают рецепты ещё до построения кучи (см. suggest_recipes).
+        Работает по снимку кэша на момент первого next().
+        """
+        stamp = (recipes_revision(), date.today())
+        allowed = filter_recipe_ids(filters)
+        allowed = None if allowed is None else set(allowed)
+        with self._lock:
+            if self._stamp != stamp:
+                self._rebuild(stamp)
+            heap = [(_rank_key(m), m) for rid, m in self._entries.items() if allowed is None or rid in allowed]
+            candidate_ids = list(self._entries)
+        heapq.heapify(heap)  # ключи уникальны (в конце id), до сравнения словарей не доходит
+        while heap:
+            yield heapq.heappop(heap)[1]
+        after_id = None
+        while True:
+            rows = get_recipes_excluding(candidate_ids, batch, with_steps=False, after_id=after_id, filters=filters)
+            yield from (_zero(r) for r in rows)
+            if len(rows) < batch:
+                return
+            after_id = rows[-1]["id"]
+
+    def top(self, top_n: int, filters: dict | None = None) -> list[dict]:
+        return list(islice(self.iter_ranked(batch=max(1, top_n), filters=filters), top_n))
+
+
+_cache = SuggestionCache()
+subscribe_products(_cache.on_product_change)
+
+
+def iter_suggestions(batch: int = 50, filters: dict | None = None):
+    """Генератор подбора (те же элементы и порядок, что у suggest_recipes) — для постраничного вывода."""
+    return _cache.iter_ranked(batch, filters)
+
 
-        hits, missing, bonus = [], [], 0
-        for i in ings:
-            key = norm(i.get("name"))
-            if key in have_map:
-                hits.append(i)
-                d = _parse_date(have_map[key].get("exp_date"))
-                if d:
-                    days = (d - today).days
-                    bonus += max(0, 10 - days)
-            else:
-                missing.append(i)
-
-        coverage = len(hits) / len(ings)
-        score = int(coverage * 100 + bonus)
-        out.append({"recipe": r, "coverage": coverage, "score": score, "have": hits, "missing": missing})
-
-    out.sort(key=lambda x: (x["coverage"] >= 0.7, x["score"]), reverse=True)
-    return out[:top_n]
+def suggest_recipes_cached(top_n: int = 10, filters: dict | None = None):
+    """То же, что suggest_recipes, но из SuggestionCache: повторный вызов — чтение готового top-k."""
+    return _cache.top(top_n, filters)
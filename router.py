@@ -5,6 +5,8 @@ from pages.user import UserView
 from pages.add_product import AddProductView
 from pages.expiring import ExpiringView
 from pages.recipes import RecipesView
+from pages.planner import PlannerView
+from pages.shopping import ShoppingView
 
 class Router:
     def __init__(self, page):
@@ -27,5 +29,9 @@ class Router:
             return ExpiringView(self.page)
         elif r == "/recipes":
             return RecipesView(self.page)
+        elif r == "/planner":
+            return PlannerView(self.page)
+        elif r == "/shopping":
+            return ShoppingView(self.page)
         else:
             return HomeView(self.page)
@@ -1,28 +1,109 @@
-import sqlite3
+import atexit
+import threading
+from db_pool import get_conn
+from db_executor import submit
+import migrations
 
 DB_NAME = "app.db"
+migrations.register(DB_NAME, migrations.APP_DB)
+
+# Через сколько секунд после последнего set_setting(..., debounce=True) изменения пишутся в БД.
+DEBOUNCE_S = 0.4
+
+_lock = threading.RLock()
+_cache: dict[str, str] | None = None
+_pending: dict[str, str] = {}
+_timer: threading.Timer | None = None
+_subscribers: dict[str, list] = {}
 
 def init_settings_db():
-    with sqlite3.connect(DB_NAME) as con:
-        con.execute("""
-            CREATE TABLE IF NOT EXISTS app_settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            )
-        """)
-        con.commit()
+    """Схема создаётся миграциями (migrations.APP_DB) при открытии соединения."""
+    get_conn(DB_NAME)
 
-def set_setting(key: str, value: str):
-    with sqlite3.connect(DB_NAME) as con:
-        con.execute(
+def _load() -> dict[str, str]:
+    """Читает app_settings в память один раз за процесс."""
+    global _cache
+    if _cache is None:
+        with _lock:
+            if _cache is None:
+                init_settings_db()
+                with get_conn(DB_NAME) as con:
+                    _cache = dict(con.execute("SELECT key, value FROM app_settings"))
+    return _cache
+
+def _write(items: dict[str, str]):
+    if not items:
+        return
+    with get_conn(DB_NAME) as con:
+        con.executemany(
             "INSERT INTO app_settings(key, value) VALUES(?, ?) "
             "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-            (key, value),
+            list(items.items()),
         )
         con.commit()
 
+def _flush_later():
+    # Timer только отмеряет паузу: запись идёт в рабочем потоке db_executor с его
+    # долгоживущим соединением, а не в новом соединении короткоживущего потока Timer
+    submit(flush, key="settings_flush")
+
+def flush():
+    """Сразу записывает отложенные (debounce) изменения."""
+    global _timer
+    with _lock:
+        if _timer is not None:
+            _timer.cancel()
+            _timer = None
+        items = dict(_pending)
+        _pending.clear()
+    _write(items)
+
+def _notify(key: str, old: str | None, value: str):
+    if old != value:
+        for fn in list(_subscribers.get(key, ())):
+            fn(value)
+
+def cache_setting(key: str, value: str):
+    """Обновляет кэш для key, уже записанного в app_settings в чужой транзакции (вызывать после её commit)."""
+    cache = _load()
+    with _lock:
+        old = cache.get(key)
+        cache[key] = value
+        _pending.pop(key, None)
+    _notify(key, old, value)
+
+def set_setting(key: str, value: str, debounce: bool = False):
+    """Меняет настройку в памяти и пишет в БД: сразу или, при debounce=True, пачкой чуть позже."""
+    global _timer
+    cache = _load()
+    with _lock:
+        old = cache.get(key)
+        cache[key] = value
+        if debounce:
+            _pending[key] = value
+            if _timer is not None:
+                _timer.cancel()
+            _timer = threading.Timer(DEBOUNCE_S, _flush_later)
+            _timer.daemon = True
+            _timer.start()
+        else:
+            _pending.pop(key, None)
+    if not debounce:
+        _write({key: value})
+    _notify(key, old, value)
+
 def get_setting(key: str, default: str = "") -> str:
-    with sqlite3.connect(DB_NAME) as con:
-        cur = con.execute("SELECT value FROM app_settings WHERE key=?", (key,))
-        row = cur.fetchone()
-        return row[0] if row else default
+    return _load().get(key, default)
+
+def subscribe(key: str, fn):
+    """fn(value) вызывается при каждом изменении key. Возвращает функцию отписки."""
+    with _lock:
+        _subscribers.setdefault(key, []).append(fn)
+
+    def unsubscribe():
+        with _lock:
+            if fn in _subscribers.get(key, ()):
+                _subscribers[key].remove(fn)
+    return unsubscribe
+
+atexit.register(flush)
@@ -0,0 +1,172 @@
+"""Список покупок по выбранным рецептам.
+
+shopping_list хранит сводную потребность выбранных рецептов (shopping_recipes) по ключу
+ингредиента и мере units: добавление/удаление рецептов прибавляет/вычитает их вклад
+одним сгруппированным запросом, а не пересчитывает список целиком. Запас холодильника
+вычитается при чтении (get_shopping_list), поэтому список не устаревает от покупок.
+Если набор рецептов поменялся (recipes_revision), список пересобирается из shopping_recipes
+при следующем изменении списка (или в фоне, если его первым прочитал get_shopping_list).
+"""
+import json
+from contextlib import closing
+
+from db_executor import submit
+from db_pool import get_conn
+from recipes_db import DB_PATH, recipes_revision
+from recommend import inventory
+from settings_db import cache_setting, get_setting
+
+REVISION_KEY = "shopping_revision"
+_EPS = 1e-6
+
+# вклад рецептов json_each(?) в список: обязательные ингредиенты по (ключ, мера)
+_CONTRIB_SQL = """
+    SELECT t.ingredient_id, COALESCE(t.dim, '') AS dim, TOTAL(t.amount) AS amount, COUNT(*) AS n,
+           MIN(t.name) AS name, MAX(t.alt_ids) AS alt_ids
+    FROM json_each(?) j JOIN all_recipe_ingredients t ON t.recipe_id = j.value
+    WHERE NOT t.optional AND t.ingredient_id IS NOT NULL
+    GROUP BY t.ingredient_id, COALESCE(t.dim, '')
+"""
+
+
+def _conn():
+    return get_conn(DB_PATH)
+
+
+def _add(c, recipe_ids: list[int]) -> None:
+    c.execute(f"""
+        INSERT INTO shopping_list(ingredient_id, dim, amount, n, name, alt_ids)
+        SELECT ingredient_id, dim, amount, n, name, alt_ids FROM ({_CONTRIB_SQL}) WHERE 1
+        ON CONFLICT(ingredient_id, dim) DO UPDATE SET
+            amount = amount + excluded.amount,
+            n = n + excluded.n,
+            -- как MIN/MAX в _CONTRIB_SQL по всем рецептам списка (скалярный MAX с NULL дал бы NULL)
+            name = MIN(name, excluded.name),
+            alt_ids = CASE WHEN alt_ids IS NULL OR excluded.alt_ids > alt_ids THEN excluded.alt_ids ELSE alt_ids END
+    """, (json.dumps(recipe_ids),))
+
+
+def _sync(c) -> str | None:
+    """Пересобирает список, если рецепты поменялись с прошлой записи (иначе вычитание разойдётся).
+
+    Ревизия пишется в app_settings в той же транзакции, что и список. Возвращает её, если
+    список пересобран: после commit вызывающий кладёт её в кэш настроек (cache_setting).
+    """
+    revision = recipes_revision()
+    if get_setting(REVISION_KEY) == revision:
+        return None
+    c.execute("DELETE FROM shopping_list")
+    _add(c, [r[0] for r in c.execute("SELECT recipe_id FROM shopping_recipes")])
+    c.execute(
+        "INSERT INTO app_settings(key, value) VALUES(?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+        (REVISION_KEY, revision),
+    )
+    return revision
+
+
+def _resync() -> None:
+    with _conn() as conn, closing(conn.cursor()) as c:
+        synced = _sync(c)
+        conn.commit()
+    if synced:
+        cache_setting(REVISION_KEY, synced)
+
+
+def add_recipes(recipe_ids: list[int]) -> int:
+    """Добавляет рецепты в список покупок (уже добавленные пропускаются). Возвращает, сколько добавлено."""
+    with _conn() as conn, closing(conn.cursor()) as c:
+        synced = _sync(c)
+        ids_json = json.dumps(list(recipe_ids))
+        new = [r[0] for r in c.execute(
+            "SELECT DISTINCT j.value FROM json_each(?) j "
+            "WHERE j.value NOT IN (SELECT recipe_id FROM shopping_recipes)",
+            (ids_json,),
+        )]
+        if new:
+            c.executemany("INSERT INTO shopping_recipes(recipe_id) VALUES(?)", [(rid,) for rid in new])
+            _add(c, new)
+        conn.commit()
+    if synced:
+        cache_setting(REVISION_KEY, synced)
+    return len(new)
+
+
+def remove_recipes(recipe_ids: list[int]) -> int:
+    """Убирает рецепты из списка покупок, вычитая их вклад. Возвращает, сколько убрано."""
+    with _conn() as conn, closing(conn.cursor()) as c:
+        synced = _sync(c)
+        gone = [r[0] for r in c.execute(
+            "SELECT s.recipe_id FROM json_each(?) j JOIN shopping_recipes s ON s.recipe_id = j.value",
+            (json.dumps(list(recipe_ids)),),
+        )]
+        if gone:
+            c.execute(f"""
+                UPDATE shopping_list AS s SET amount = s.amount - d.amount, n = s.n - d.n
+                FROM ({_CONTRIB_SQL}) AS d
+                WHERE s.ingredient_id = d.ingredient_id AND s.dim = d.dim
+            """, (json.dumps(gone),))
+            c.execute("DELETE FROM shopping_list WHERE n <= 0")
+            c.executemany("DELETE FROM shopping_recipes WHERE recipe_id=?", [(rid,) for rid in gone])
+            # название и альтернативы затронутых строк могли прийти из убранных рецептов —
+            # берём их заново по оставшимся
+            left = [r[0] for r in c.execute("SELECT recipe_id FROM shopping_recipes")]
+            c.execute(f"""
+                UPDATE shopping_list AS s SET name = d.name, alt_ids = d.alt_ids
+                FROM ({_CONTRIB_SQL}) AS d
+                WHERE s.ingredient_id = d.ingredient_id AND s.dim = d.dim
+                  AND s.ingredient_id IN (
+                      SELECT t.ingredient_id FROM json_each(?) j
+                      JOIN all_recipe_ingredients t ON t.recipe_id = j.value
+                  )
+            """, (json.dumps(left), json.dumps(gone)))
+        conn.commit()
+    if synced:
+        cache_setting(REVISION_KEY, synced)
+    return len(gone)
+
+
+def clear() -> None:
+    with _conn() as conn:
+        conn.execute("DELETE FROM shopping_list")
+        conn.execute("DELETE FROM shopping_recipes")
+        conn.commit()
+
+
+def shopping_recipe_ids() -> list[int]:
+    with _conn() as conn, closing(conn.cursor()) as c:
+        return [r[0] for r in c.execute("SELECT recipe_id FROM shopping_recipes ORDER BY added_at, recipe_id")]
+
+
+def get_shopping_list() -> list[dict]:
+    """Что докупить: [{"name", "amount", "dim", "uses"}] по алфавиту; uses — в скольких ингредиентах рецептов.
+
+    Из суммы по рецептам вычитается запас холодильника по тому же ключу (или его альтернативе).
+    Продукт без указанного количества, как и в подборе, считается имеющимся в достатке;
+    amount=None — в рецептах количество не указано.
+    """
+    with _conn() as conn, closing(conn.cursor()) as c:
+        if get_setting(REVISION_KEY) == recipes_revision():
+            rows = c.execute("SELECT ingredient_id, dim, amount, n, name, alt_ids FROM shopping_list").fetchall()
+        else:
+            # рецепты поменялись: считаем сумму по shopping_recipes без записи, а сам список
+            # пересобирается в рабочем потоке db_executor
+            ids = [r[0] for r in c.execute("SELECT recipe_id FROM shopping_recipes")]
+            rows = c.execute(_CONTRIB_SQL, (json.dumps(ids),)).fetchall()
+            submit(_resync, key="shopping.resync")
+
+    have_map, stock = inventory()
+    out = []
+    for (iid, dim, amount, n, name, alt) in rows:
+        key = next((k for k in [iid] + (json.loads(alt) if alt else []) if k in have_map), None)
+        need = amount if dim else None
+        if key is not None:
+            st = stock.get(key)
+            if need is None or st is None or dim not in st:
+                continue
+            need -= st[dim]
+            if need <= _EPS:
+                continue
+        out.append({"name": name, "amount": need, "dim": dim or None, "uses": n})
+    out.sort(key=lambda x: x["name"])
+    return out
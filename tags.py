@@ -0,0 +1,69 @@
+"""Теги рецептов по ингредиентам (мясо, рыба, молочное...) и диеты как маски этих тегов.
+
+Теги рецепта — битовая маска recipes.tags, считается при записи (recipes_db._index_recipes)
+по ключам всех ингредиентов, включая альтернативы и «по желанию». Слова таблиц сводятся
+к основам так же, как ключи matcher, поэтому 'курица' и 'куриное филе' дают один тег.
+Диета исключает рецепты, у которых есть любой из её тегов: (tags & DIETS[diet]) = 0.
+"""
+from ingredients import fold
+from matcher import stem
+
+# Увеличить при изменении таблиц: теги рецептов будут пересчитаны (и каталог пересобран).
+TAGS_VERSION = 1
+
+MEAT, PORK, POULTRY, FISH, SEAFOOD, DAIRY, EGGS, GLUTEN, HONEY, NUTS = (1 << i for i in range(10))
+
+TAG_WORDS = {
+    MEAT: "говядина говяжий свинина свиной баранина телятина колбаса сосиски ветчина бекон сало пельмени фарш",
+    PORK: "свинина свиной ветчина бекон сало",
+    POULTRY: "курица куриный индейка утка",
+    FISH: "рыба рыбный лосось семга треска хек тунец анчоусы сельдь скумбрия",
+    SEAFOOD: "креветки крабовый кальмар мидии",
+    DAIRY: "молоко сливки сметана сыр творог кефир йогурт маскарпоне моцарелла",
+    EGGS: "яйца савоярди майонез",
+    GLUTEN: "мука хлеб булочки лаваш тортильи лапша паста лазанья пельмени савоярди",
+    HONEY: "мед",
+    NUTS: "орехи арахис",
+}
+# ключи, которые содержат слово тега, но тега не дают
+TAG_EXCEPT = {
+    DAIRY: ("кокосовое молоко",),
+    GLUTEN: ("паста том ям",),
+}
+
+# диета -> (подпись, теги, которых в рецепте быть не должно)
+DIETS = {
+    "vegetarian": ("Вегетарианское", MEAT | POULTRY | FISH | SEAFOOD),
+    "vegan": ("Веганское", MEAT | POULTRY | FISH | SEAFOOD | DAIRY | EGGS | HONEY),
+    "no_pork": ("Без свинины", PORK),
+    "gluten_free": ("Без глютена", GLUTEN),
+    "lactose_free": ("Без лактозы", DAIRY),
+    "nut_free": ("Без орехов", NUTS),
+}
+
+
+def _stems(words: str) -> frozenset[str]:
+    return frozenset(stem(w) for w in fold(words).split())
+
+
+_TAG_STEMS = {tag: _stems(words) for tag, words in TAG_WORDS.items()}
+_TAG_EXCEPT = {tag: [_stems(s) for s in phrases] for tag, phrases in TAG_EXCEPT.items()}
+
+
+def key_tags(key: str) -> int:
+    """Маска тегов одного ключа ингредиента (matcher: слова-основы через пробел)."""
+    words = set(key.split())
+    mask = 0
+    for tag, stems in _TAG_STEMS.items():
+        if words & stems and not any(ex <= words for ex in _TAG_EXCEPT.get(tag, ())):
+            mask |= tag
+    return mask
+
+
+def diet_mask(diets) -> int:
+    """Объединённая маска запрещённых тегов для набора диет (неизвестные игнорируются)."""
+    mask = 0
+    for d in diets or ():
+        if d in DIETS:
+            mask |= DIETS[d][1]
+    return mask
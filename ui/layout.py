@@ -44,6 +44,8 @@ def page_layout(page: ft.Page, title: str, content: ft.Control) -> ft.Row:
             sidebar_btn(page, ft.Icons.HOME,            lambda _: page.go("/home")),
             sidebar_btn(page, ft.Icons.SEARCH,          lambda _: page.go("/search")),
             sidebar_btn(page, ft.Icons.RESTAURANT_MENU, lambda _: page.go("/recipes")),
+            sidebar_btn(page, ft.Icons.CALENDAR_MONTH,  lambda _: page.go("/planner")),
+            sidebar_btn(page, ft.Icons.SHOPPING_CART,   lambda _: page.go("/shopping")),
             sidebar_btn(page, ft.Icons.SETTINGS,        lambda _: page.go("/settings")),
             sidebar_btn(page, ft.Icons.PERSON,          lambda _: page.go("/user")),
         ],
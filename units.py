@@ -0,0 +1,103 @@
+"""Перевод количеств к общей мере, чтобы сравнивать «сколько нужно» и «сколько есть».
+
+Всё, что можно, переводится в граммы: масса — напрямую, объём — через плотность
+ингредиента, штуки и прочие «куски» (зубчик, ломтик, пучок...) — через вес штуки.
+Если данных не хватает, остаётся своя мера: 'ml', 'шт', 'зубчик'...
+Таблицы записаны названиями; в коэффициенты по id ключа (matcher) они переводятся
+один раз при импорте, а пары (ключ, единица) кэшируются в factor().
+"""
+from functools import lru_cache
+
+from ingredients import fold, key_id
+from matcher import parse
+
+# Увеличить при изменении таблиц/логики: сохранённые amount/dim рецептов будут пересчитаны.
+UNITS_VERSION = 1
+
+UNIT_ALIASES = {
+    "": "шт", "шт.": "шт", "штук": "шт", "штуки": "шт",
+    "гр": "г", "грамм": "г", "кило": "кг",
+    "литр": "л", "ст. л.": "ст.л.", "ст.ложка": "ст.л.", "ч. л.": "ч.л.", "ч.ложка": "ч.л.",
+}
+MASS_G = {"мг": 0.001, "г": 1.0, "кг": 1000.0}
+VOLUME_ML = {"мл": 1.0, "л": 1000.0, "ч.л.": 5.0, "ст.л.": 15.0, "стакан": 250.0}
+# вес «куска», если для ингредиента нет своего
+UNIT_G = {
+    "щепотка": 0.5, "зубчик": 5.0, "ломтик": 25.0, "пучок": 30.0, "лист": 3.0,
+    "стебель": 40.0, "головка": 50.0, "кочан": 800.0, "банка": 400.0,
+}
+
+# г/мл
+DENSITY = {
+    "вода": 1.0, "молоко": 1.03, "кефир": 1.03, "сливки": 1.0, "йогурт": 1.05, "сметана": 1.0,
+    "куриный бульон": 1.0, "говяжий бульон": 1.0, "масло": 0.92, "мед": 1.4, "сахар": 0.85,
+    "соль": 1.2, "мука": 0.55, "какао": 0.45, "майонез": 0.95, "соевый соус": 1.15,
+    "лимонный сок": 1.03, "тахини": 1.1, "томатный соус": 1.05, "паприка": 0.45,
+    "разрыхлитель": 0.7, "рис": 0.85, "овсянка": 0.4,
+}
+# г за 1 шт
+PIECE_G = {
+    "яйца": 55, "лук": 90, "лук красный": 90, "картофель": 150, "морковь": 80, "томаты": 120,
+    "огурец": 100, "перец": 150, "перец сладкий": 150, "авокадо": 170, "банан": 120,
+    "яблоки": 180, "лимон": 100, "лайм": 60, "кабачок": 300, "баклажан": 300, "свекла": 200,
+    "чили": 15, "булочки": 60, "лаваш": 100, "тортильи": 40, "листы лазаньи": 20,
+    "маслины": 4, "анчоусы": 4,
+}
+# г за единицу, особую для ингредиента
+INGREDIENT_UNIT_G = {
+    ("чеснок", "зубчик"): 5, ("чеснок", "головка"): 50,
+    ("листья салата", "кочан"): 300, ("листья салата", "лист"): 10, ("нори", "лист"): 3,
+    ("хлеб", "ломтик"): 30, ("сыр", "ломтик"): 20,
+    ("тунец консервированный", "банка"): 185, ("горошек", "банка"): 400,
+}
+
+
+def _kid(name: str) -> int:
+    return key_id(parse(name)[0][0])
+
+
+_DENSITY = {_kid(n): d for n, d in DENSITY.items()}
+_PIECE_G = {_kid(n): float(w) for n, w in PIECE_G.items()}
+_INGREDIENT_UNIT_G = {(_kid(n), u): float(w) for (n, u), w in INGREDIENT_UNIT_G.items()}
+
+
+def unit_name(unit: str | None) -> str:
+    u = fold(unit)
+    return UNIT_ALIASES.get(u, u)
+
+
+@lru_cache(maxsize=4096)
+def factor(ingredient_id: int, unit: str | None) -> tuple[float, str]:
+    """(множитель, мера): qty unit ингредиента = qty * множитель в мере ('g', 'ml' или сама единица)."""
+    u = unit_name(unit)
+    if u in MASS_G:
+        return MASS_G[u], "g"
+    if u in VOLUME_ML:
+        d = _DENSITY.get(ingredient_id)
+        return (VOLUME_ML[u] * d, "g") if d else (VOLUME_ML[u], "ml")
+    w = _INGREDIENT_UNIT_G.get((ingredient_id, u)) or (_PIECE_G.get(ingredient_id) if u == "шт" else None) or UNIT_G.get(u)
+    if w:
+        return w, "g"
+    return 1.0, u
+
+
+def normalize(ingredient_id: int, qty: float | None, unit: str | None) -> tuple[float, str] | None:
+    """Количество в общей мере или None, если количество не указано."""
+    if qty is None:
+        return None
+    mult, dim = factor(ingredient_id, unit)
+    return float(qty) * mult, dim
+
+
+def enough(need: tuple[float, str] | None, have: dict[str, float] | None) -> float:
+    """Какая доля потребности закрыта запасом (0..1).
+
+    need — normalize() ингредиента рецепта; have — {мера: сколько есть} или None, если
+    количество в холодильнике не указано. Неизвестное или несравнимое считается закрытым.
+    """
+    if need is None or have is None or need[0] <= 0:
+        return 1.0
+    got = have.get(need[1])
+    if got is None:
+        return 1.0
+    return min(1.0, got / need[0])